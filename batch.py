@@ -0,0 +1,420 @@
+from braking_collision_solver import BrakingCollisionSolver
+from car_collision_solver import CarCollisionSolver
+from drone_intercept_solver import DroneInterceptSolver
+from planar_intercept_solver import PlanarInterceptSolver
+from itertools import islice
+from typing import Iterable, Iterator, List
+from unit_converter import UnitConverter
+import argparse
+import csv
+import json
+import logging
+import math
+import numpy as np
+import sys
+
+logger = logging.getLogger(__name__)
+
+"""
+Headless batch mode.
+
+Reads drone intercept, planar intercept, car collision or braking car
+scenarios from CSV or JSONL, solves them in vectorized chunks and streams
+the results out. Only one chunk is held in memory at a time, so memory use
+does not depend on the input size.
+This module must not import PySide6 so it can run without a display server.
+
+Each record may carry its own "speed_unit" and "distance_unit" columns;
+records without them use the units given on the command line.
+"""
+
+# Input columns and output columns for each problem. Outputs are in miles,
+# miles per hour, minutes (drone, planar) and hours (car, braking), like the
+# solvers. Planar positions are east and north, headings compass degrees.
+# Braking decelerations are in the speed unit per second, reaction times in
+# seconds.
+PROBLEMS = {
+    "drone": {
+        "inputs": ["drone_speed", "radar_range", "reaction_time"],
+        "outputs": [
+            "delay_distance_miles",
+            "intercept_distance_miles",
+            "intercept_time_minutes",
+            "intercept_possible",
+        ],
+    },
+    "planar": {
+        "inputs": [
+            "threat_x",
+            "threat_y",
+            "threat_heading",
+            "threat_speed",
+            "interceptor_speed",
+            "launch_delay",
+        ],
+        "outputs": [
+            "intercept_time_minutes",
+            "intercept_x_miles",
+            "intercept_y_miles",
+            "intercept_distance_miles",
+            "interceptor_heading_degrees",
+            "intercept_possible",
+        ],
+    },
+    "car": {
+        "inputs": ["speed_car_a", "speed_car_b", "initial_distance"],
+        "outputs": [
+            "speed_difference_mph",
+            "time_to_collision_hours",
+            "will_collide",
+        ],
+    },
+    "braking": {
+        "inputs": [
+            "speed_car_a",
+            "speed_car_b",
+            "initial_distance",
+            "deceleration_a",
+            "deceleration_b",
+            "reaction_time",
+        ],
+        "outputs": [
+            "time_to_collision_hours",
+            "impact_speed_mph",
+            "collision_position_miles",
+            "will_collide",
+        ],
+    },
+}
+
+UNIT_COLUMNS = ["speed_unit", "distance_unit"]
+
+# Inputs that may be negative: planar positions and headings. The others are
+# speeds, distances, decelerations and times, which the GUI keeps at 0 or more
+SIGNED_INPUTS = {"threat_x", "threat_y", "threat_heading"}
+
+
+def read_records(stream, fmt: str) -> Iterator[dict]:
+    """
+    Lazily reads records from a CSV or JSONL stream.
+
+    Parameters:
+        stream (TextIO): The input stream.
+        fmt (str): "csv" or "jsonl".
+
+    Yields:
+        dict: One record per row or line.
+    """
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+    elif fmt == "jsonl":
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+    else:
+        raise ValueError(f"Invalid format: {fmt}")
+
+
+def chunked(records: Iterable[dict], chunk_size: int) -> Iterator[List[dict]]:
+    """
+    Groups records into lists of at most chunk_size.
+
+    Parameters:
+        records (Iterable[dict]): The records to group.
+        chunk_size (int): The maximum number of records per chunk.
+
+    Yields:
+        list: The next chunk of records.
+    """
+    records = iter(records)
+    while chunk := list(islice(records, chunk_size)):
+        yield chunk
+
+
+def validate_record(problem: str, record) -> dict:
+    """
+    Checks one record before it joins a chunk, so a bad record can be
+    rejected alone instead of failing its whole chunk.
+
+    Parameters:
+        problem (str): "drone", "planar", "car" or "braking".
+        record: A decoded record.
+
+    Returns:
+        dict: The input columns as floats, and the unit columns the record sets.
+
+    Raises:
+        ValueError: If the record is not an object, misses or has a
+            non-numeric or non-finite input, has a negative speed, distance,
+            deceleration or time, or has an invalid unit.
+    """
+    if not isinstance(record, dict):
+        raise ValueError("A record must be a JSON object")
+    checked = {}
+    for name in PROBLEMS[problem]["inputs"]:
+        if name not in record:
+            raise ValueError(f"Missing column: {name}")
+        try:
+            checked[name] = float(record[name])
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid number: {name}") from None
+        if not math.isfinite(checked[name]):
+            raise ValueError(f"Invalid number: {name}")
+        if checked[name] < 0 and name not in SIGNED_INPUTS:
+            raise ValueError(f"Negative input: {name}")
+    for column, registry in (
+        ("speed_unit", UnitConverter.speed_units),
+        ("distance_unit", UnitConverter.distance_units),
+    ):
+        # Empty CSV cells use the default unit, like in solve_chunk()
+        unit = record.get(column) or None
+        if unit is not None:
+            if not isinstance(unit, str) or unit not in registry.index:
+                raise ValueError(f"Invalid unit: {unit}")
+            checked[column] = unit
+    return checked
+
+
+def solve_chunk(
+    problem: str, chunk: List[dict], speed_unit: str, distance_unit: str
+) -> dict:
+    """
+    Solves one chunk of records with a single vectorized solver call.
+
+    Parameters:
+        problem (str): "drone", "planar", "car" or "braking".
+        chunk (list): The records to solve.
+        speed_unit (str): Speed unit for records without a "speed_unit" column.
+        distance_unit (str): Distance unit for records without a "distance_unit" column.
+
+    Returns:
+        dict: Input and output columns, each a list or NumPy array.
+
+    Raises:
+        ValueError: If a record is missing an input column or has an invalid unit.
+    """
+    columns = {}
+    for name in PROBLEMS[problem]["inputs"]:
+        try:
+            columns[name] = np.array([record[name] for record in chunk], dtype=np.float64)
+        except KeyError:
+            raise ValueError(f"Missing column: {name}") from None
+    speed_units = [record.get("speed_unit") or speed_unit for record in chunk]
+    distance_units = [record.get("distance_unit") or distance_unit for record in chunk]
+
+    if problem == "drone":
+        drone_speed = UnitConverter.convert_speed(
+            columns["drone_speed"], speed_units, "mph"
+        )
+        radar_range = UnitConverter.convert_distance(
+            columns["radar_range"], distance_units, "miles"
+        )
+        result = DroneInterceptSolver.solve(
+            drone_speed, radar_range, columns["reaction_time"]
+        )
+    elif problem == "planar":
+        threat_x = UnitConverter.convert_distance(
+            columns["threat_x"], distance_units, "miles"
+        )
+        threat_y = UnitConverter.convert_distance(
+            columns["threat_y"], distance_units, "miles"
+        )
+        threat_speed = UnitConverter.convert_speed(
+            columns["threat_speed"], speed_units, "mph"
+        )
+        interceptor_speed = UnitConverter.convert_speed(
+            columns["interceptor_speed"], speed_units, "mph"
+        )
+        result = PlanarInterceptSolver.solve(
+            threat_x,
+            threat_y,
+            columns["threat_heading"],
+            threat_speed,
+            interceptor_speed,
+            columns["launch_delay"],
+        )
+    elif problem == "braking":
+        result = BrakingCollisionSolver.solve(
+            columns["speed_car_a"],
+            columns["speed_car_b"],
+            columns["initial_distance"],
+            columns["deceleration_a"],
+            columns["deceleration_b"],
+            columns["reaction_time"],
+            speed_units,
+            distance_units,
+        )
+    else:
+        result = CarCollisionSolver.solve(
+            columns["speed_car_a"],
+            columns["speed_car_b"],
+            columns["initial_distance"],
+            speed_units,
+            distance_units,
+        )
+
+    columns["speed_unit"] = speed_units
+    columns["distance_unit"] = distance_units
+    columns.update(zip(PROBLEMS[problem]["outputs"], result))
+    return columns
+
+
+def dump_json(record: dict) -> str:
+    """
+    Serializes one record as strict JSON.
+
+    inf and NaN results (no collision, no intercept) become null, since JSON
+    has no literal for them and most parsers reject Python's Infinity/NaN.
+
+    Parameters:
+        record (dict): Column names and Python values.
+
+    Returns:
+        str: The JSON text.
+    """
+    return json.dumps(
+        {
+            name: None if isinstance(value, float) and not math.isfinite(value) else value
+            for name, value in record.items()
+        },
+        allow_nan=False,
+    )
+
+
+def write_chunk(writer, fmt: str, fieldnames: List[str], columns: dict) -> None:
+    """
+    Writes one solved chunk.
+
+    Parameters:
+        writer: A csv.writer for "csv", or the output stream for "jsonl".
+        fmt (str): "csv" or "jsonl".
+        fieldnames (list): The column order.
+        columns (dict): The solved columns from solve_chunk().
+    """
+    rows = zip(
+        *(
+            columns[name].tolist() if isinstance(columns[name], np.ndarray) else columns[name]
+            for name in fieldnames
+        )
+    )
+    if fmt == "csv":
+        writer.writerows(rows)
+    else:
+        writer.writelines(dump_json(dict(zip(fieldnames, row))) + "\n" for row in rows)
+
+
+def run_batch(
+    problem: str,
+    input_stream,
+    output_stream,
+    input_format: str = "csv",
+    output_format: str = None,
+    chunk_size: int = 65536,
+    speed_unit: str = "mph",
+    distance_unit: str = "miles",
+) -> int:
+    """
+    Streams scenarios from input_stream through the solver into output_stream.
+
+    Parameters:
+        problem (str): "drone", "planar", "car" or "braking".
+        input_stream (TextIO): Where to read scenarios from.
+        output_stream (TextIO): Where to write results to.
+        input_format (str): "csv" or "jsonl".
+        output_format (str): "csv" or "jsonl". Defaults to input_format.
+        chunk_size (int): Number of records solved per vectorized call.
+        speed_unit (str): Default speed unit.
+        distance_unit (str): Default distance unit.
+
+    Returns:
+        int: The number of records solved.
+    """
+    output_format = output_format or input_format
+    fieldnames = PROBLEMS[problem]["inputs"] + UNIT_COLUMNS + PROBLEMS[problem]["outputs"]
+
+    if output_format == "csv":
+        writer = csv.writer(output_stream, lineterminator="\n")
+        writer.writerow(fieldnames)
+    else:
+        writer = output_stream
+
+    count = 0
+    for chunk in chunked(read_records(input_stream, input_format), chunk_size):
+        columns = solve_chunk(problem, chunk, speed_unit, distance_unit)
+        write_chunk(writer, output_format, fieldnames, columns)
+        count += len(chunk)
+        logger.debug("Solved %d records", count)
+
+    return count
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the argument parser for the batch command.
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py batch",
+        description="Solve drone intercept, planar intercept, car collision or "
+        "braking car scenarios without the GUI.",
+    )
+    parser.add_argument("problem", choices=sorted(PROBLEMS))
+    parser.add_argument("input", nargs="?", default="-", help="input file, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="output file, or - for stdout")
+    parser.add_argument("--input-format", choices=["csv", "jsonl"])
+    parser.add_argument("--output-format", choices=["csv", "jsonl"])
+    parser.add_argument("--chunk-size", type=int, default=65536)
+    parser.add_argument("--speed-unit", default="mph", choices=UnitConverter.speed_units.units)
+    parser.add_argument(
+        "--distance-unit", default="miles", choices=UnitConverter.distance_units.units
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        type=str.upper,
+        help="log level, defaults to $LOG_LEVEL or INFO",
+    )
+    return parser
+
+
+def main(argv=None) -> int:
+    """
+    Entry point for "python main.py batch ...".
+
+    Parameters:
+        argv (list): Command line arguments after "batch".
+
+    Returns:
+        int: The process exit code.
+    """
+    args = build_parser().parse_args(argv)
+    if args.log_level:
+        logging.getLogger().setLevel(args.log_level)
+
+    input_format = args.input_format
+    if input_format is None:
+        input_format = "jsonl" if args.input.endswith((".jsonl", ".ndjson")) else "csv"
+
+    input_stream = sys.stdin if args.input == "-" else open(args.input, newline="")
+    output_stream = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    try:
+        count = run_batch(
+            args.problem,
+            input_stream,
+            output_stream,
+            input_format,
+            args.output_format,
+            args.chunk_size,
+            args.speed_unit,
+            args.distance_unit,
+        )
+    except ValueError as e:
+        logger.error("Batch failed: %s", e)
+        return 1
+    finally:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream is not sys.stdout:
+            output_stream.close()
+
+    logger.info("Solved %d %s scenarios", count, args.problem)
+    return 0
@@ -0,0 +1,104 @@
+"""
+Time of the multi-threat assignment against the number of threats (N) and
+interceptors (M).
+
+Threats and interceptors are drawn at random. The N x M intercept matrix is
+timed on its own, then assign(), which builds the matrix and solves the
+assignment, is timed as a whole with each method. Each size runs once.
+
+    python -m benchmarks.assignment
+    python -m benchmarks.assignment --sizes 100x100 500x2000 --methods auction
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from drone_assignment_solver import ASSIGNMENT_METHODS, DroneAssignmentSolver
+
+DEFAULT_SIZES = (
+    "10x10",
+    "100x100",
+    "100x1000",
+    "300x300",
+    "1000x100",
+    "1000x1000",
+)
+
+
+def scenario(threats, interceptors, seed=0):
+    """
+    Returns random (threat_speed, threat_range, interceptor_speed,
+    reaction_time) arrays.
+    """
+    rng = np.random.default_rng(seed)
+    return (
+        rng.uniform(20, 200, threats),
+        rng.uniform(5, 60, threats),
+        rng.uniform(50, 300, interceptors),
+        rng.uniform(0, 10, interceptors),
+    )
+
+
+def time_size(threats, interceptors, method) -> tuple:
+    """
+    Returns the matrix and assign() times in seconds and the number of
+    intercepted threats.
+    """
+    threat_speed, threat_range, interceptor_speed, reaction_time = scenario(
+        threats, interceptors
+    )
+    start = time.perf_counter()
+    DroneAssignmentSolver.intercept_matrix(
+        threat_speed, threat_range, interceptor_speed, reaction_time
+    )
+    matrix_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = DroneAssignmentSolver.assign(
+        threat_speed, threat_range, interceptor_speed, reaction_time, method=method
+    )
+    assign_time = time.perf_counter() - start
+    return matrix_time, assign_time, len(result.threat)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Time the multi-threat assignment for several sizes."
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="NxM sizes, threats x interceptors.",
+    )
+    parser.add_argument(
+        "--methods",
+        nargs="+",
+        default=ASSIGNMENT_METHODS,
+        choices=ASSIGNMENT_METHODS,
+        help="Assignment methods to time.",
+    )
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'N':>6} {'M':>6} {'method':>16} {'matrix ms':>10} {'assign ms':>10} "
+        f"{'assigned':>9}"
+    )
+    for size in args.sizes:
+        threats, interceptors = (int(value) for value in size.lower().split("x"))
+        for method in args.methods:
+            matrix_time, assign_time, assigned = time_size(
+                threats, interceptors, method
+            )
+            print(
+                f"{threats:6} {interceptors:6} {method:>16} "
+                f"{matrix_time * 1000:10.2f} {assign_time * 1000:10.1f} "
+                f"{assigned:9}",
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
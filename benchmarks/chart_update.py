@@ -0,0 +1,105 @@
+"""
+Per-update time of the result charts.
+
+Compares rebuilding a QChart on every update (the old behaviour, replayed
+here with the same series and axes) against updating the persistent chart
+in place through update_chart(). Each update is followed by processEvents()
+so layout and paint work is included.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.chart_update
+"""
+
+from PySide6.QtCharts import QChart, QLineSeries, QScatterSeries, QValueAxis
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+import configparser
+import logging
+import sys
+import time
+
+from car_collision import CarCollisionWindow
+from drone_intercept import DroneInterceptWindow
+
+
+def rebuild_chart(window) -> None:
+    """
+    Replays the old update path: a new chart, four series and two axes,
+    then setChart().
+    """
+    chart = QChart()
+    for old_series in window.chart.series():
+        series = (
+            QScatterSeries()
+            if isinstance(old_series, QScatterSeries)
+            else QLineSeries()
+        )
+        series.setName(old_series.name())
+        series.append(old_series.points())
+        series.setPen(old_series.pen())
+        chart.addSeries(series)
+
+    axis_x = QValueAxis()
+    axis_x.setRange(window.axis_x.min(), window.axis_x.max())
+    axis_x.setTickCount(10)
+    axis_y = QValueAxis()
+    axis_y.setRange(window.axis_y.min(), window.axis_y.max())
+    axis_y.setTickCount(10)
+    chart.addAxis(axis_x, Qt.AlignBottom)
+    chart.addAxis(axis_y, Qt.AlignLeft)
+    for series in chart.series():
+        series.attachAxis(axis_x)
+        series.attachAxis(axis_y)
+
+    window.chart_view.setChart(chart)
+
+
+def time_updates(app, update, repeat) -> float:
+    """
+    Returns the mean time of update() plus event processing, in milliseconds.
+    """
+    start = time.perf_counter()
+    for i in range(repeat):
+        update(i)
+        app.processEvents()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main(repeat=200) -> None:
+    logging.disable(logging.CRITICAL)
+    app = QApplication.instance() or QApplication(sys.argv)
+    config = configparser.ConfigParser()
+    config.read("config.ini")
+
+    drone = DroneInterceptWindow(config)
+    car = CarCollisionWindow(config)
+    cases = [
+        (
+            "drone",
+            drone,
+            lambda i: drone.update_chart(
+                drone.chart_points(0.5, 2, 5, 5 + i % 10), i % 2 == 0, "miles"
+            ),
+        ),
+        (
+            "car",
+            car,
+            lambda i: car.update_chart(
+                car.chart_points(45, 27, 0.04, 0.1 + (i % 10) / 100), "feet"
+            ),
+        ),
+    ]
+
+    for name, window, update_in_place in cases:
+        window.show()
+        app.processEvents()
+        in_place = time_updates(app, update_in_place, repeat)
+        rebuild = time_updates(app, lambda i: rebuild_chart(window), repeat)
+        print(
+            f"{name:6} rebuild: {rebuild:7.3f} ms/update   "
+            f"in place: {in_place:7.3f} ms/update   ({rebuild / in_place:.1f}x)"
+        )
+        window.hide()
+
+
+if __name__ == "__main__":
+    main()
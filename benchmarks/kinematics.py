@@ -0,0 +1,86 @@
+"""
+Throughput of the RK4 kinematics engine against the number of scenarios (N).
+
+Every scenario is a drone intercept with a random enemy speed, detection
+range and reaction time, and an enemy drone that speeds up half way through
+the run. All scenarios step together until every one has fired its intercept
+or arrival event. Throughput is the number of scenario-steps, one active
+scenario advanced by one step, per second. Each size runs once.
+
+    python -m benchmarks.kinematics
+    python -m benchmarks.kinematics --sizes 1000000 --step 0.02
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from kinematics import AccelerationProfile, Body, Event, KinematicsEngine
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+# Integration step in minutes
+DEFAULT_STEP = 0.05
+
+
+def engine(size, seed=0) -> KinematicsEngine:
+    """
+    Returns an engine of size random drone intercept scenarios.
+    """
+    rng = np.random.default_rng(seed)
+    speed = rng.uniform(60, 300, size)
+    radar_range = rng.uniform(5, 60, size)
+    reaction_time = rng.uniform(0, 5, size)
+    # The enemy drone speeds up by 60 mph per minute, toward the origin
+    boost = AccelerationProfile((radar_range / speed * 30)[:, None], [-60.0])
+    start = -reaction_time
+    bodies = [
+        Body(0.0, speed, reaction_time),
+        Body(radar_range + speed / 60 * reaction_time, -speed, start, boost),
+    ]
+    events = [Event("arrival", (0.0, 1.0)), Event("intercept", (-1.0, 1.0))]
+    return KinematicsEngine(bodies, events, start)
+
+
+def time_size(size, step) -> tuple:
+    """
+    Returns the run time in seconds, the number of steps and the number of
+    scenario-steps.
+    """
+    kinematics = engine(size)
+    scenario_steps = 0
+    start = time.perf_counter()
+    while kinematics.active.any():
+        scenario_steps += int(np.count_nonzero(kinematics.active))
+        kinematics.step(step)
+    return time.perf_counter() - start, kinematics.steps, scenario_steps
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Time the RK4 kinematics engine for several scenario counts."
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=DEFAULT_SIZES,
+        help="Numbers of scenarios.",
+    )
+    parser.add_argument(
+        "--step", type=float, default=DEFAULT_STEP, help="Step in minutes."
+    )
+    args = parser.parse_args(argv)
+
+    print(f"{'N':>8} {'steps':>6} {'run s':>8} {'scenario-steps/s':>17}")
+    for size in args.sizes:
+        run_time, steps, scenario_steps = time_size(size, args.step)
+        print(
+            f"{size:8} {steps:6} {run_time:8.2f} {scenario_steps / run_time:17.3e}",
+            flush=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
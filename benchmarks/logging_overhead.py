@@ -0,0 +1,102 @@
+"""
+Per-call cost of logging on the hot paths.
+
+Compares the old setup, where every module called basicConfig(DEBUG) and
+every call was formatted and written, against the current one: module
+loggers at the default INFO level, so debug calls return after one level
+check. The handler writes to a null stream so only logging itself is
+measured, not the terminal.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.logging_overhead
+"""
+
+from PySide6.QtWidgets import QApplication
+import configparser
+import io
+import logging
+import sys
+import timeit
+
+from logger import LOG_FORMAT, configure_logging
+from unit_converter import UnitConverter
+
+
+class NullStream(io.TextIOBase):
+    """
+    Text stream that discards everything written to it.
+    """
+
+    def write(self, s) -> int:
+        return len(s)
+
+
+def configure(level) -> None:
+    """
+    Sends all records at level and above to a null stream.
+    """
+    configure_logging(level)
+    handler = logging.getLogger().handlers[0]
+    handler.setStream(NullStream())
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+
+def legacy_to_miles_per_hour(value, unit):
+    """
+    Replays the old conversion call: an eagerly formatted f-string sent
+    through the root logger.
+    """
+    logging.debug(f"to_miles_per_hour called with value={value}, unit={unit}")
+    return UnitConverter.speed_units.convert(value, unit, "mph")
+
+
+def per_call_us(function, number) -> float:
+    """
+    Returns the best mean time of function() over five runs, in microseconds.
+    """
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1e6
+
+
+def main(number=20000) -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+    config = configparser.ConfigParser()
+    config.read("config.ini")
+
+    from car_collision import CarCollisionWindow
+    from drone_intercept import DroneInterceptWindow
+
+    drone = DroneInterceptWindow(config)
+    car = CarCollisionWindow(config)
+
+    def uncached(window):
+        # Clear the result cache so every call solves
+        def calculate():
+            window.result_cache.clear()
+            window.calculate(background=False)
+
+        return calculate
+
+    cases = [
+        (
+            "to_miles_per_hour",
+            lambda: legacy_to_miles_per_hour(60.0, "km/h"),
+            lambda: UnitConverter.to_miles_per_hour(60.0, "km/h"),
+            number,
+        ),
+        ("drone calculate", uncached(drone), uncached(drone), number // 20),
+        ("car calculate", uncached(car), uncached(car), number // 20),
+    ]
+
+    for name, legacy, current, count in cases:
+        configure(logging.DEBUG)
+        before = per_call_us(legacy, count)
+        configure(logging.INFO)
+        after = per_call_us(current, count)
+        print(
+            f"{name:18} DEBUG before: {before:8.2f} us/call   "
+            f"INFO now: {after:8.2f} us/call   ({before / after:.1f}x)"
+        )
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Load test of the solver service (solver_service.py).
+
+Concurrent clients each hold one keep-alive connection and send random drone
+intercept requests back to back. Prints the client side throughput and
+latency percentiles, and the batch sizes the service reports on /stats.
+Without --port a local instance is started for the run and stopped after.
+
+    python -m benchmarks.service_load
+    python -m benchmarks.service_load --clients 256 --requests 200 --window-ms 5
+    python -m benchmarks.service_load --port 8765
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+async def request(reader, writer, method, path, payload=None) -> dict:
+    """
+    Sends one request on an open connection and returns the JSON answer.
+    """
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    status = await reader.readline()
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    answer = json.loads(await reader.readexactly(length))
+    if b" 200 " not in status:
+        raise RuntimeError(f"{status.decode().strip()}: {answer}")
+    return answer
+
+
+async def client(port, count, seed, latencies) -> None:
+    """
+    Sends count random drone requests on one connection.
+    """
+    rng = np.random.default_rng(seed)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for _ in range(count):
+            scenario = {
+                "drone_speed": float(rng.uniform(60, 300)),
+                "radar_range": float(rng.uniform(5, 60)),
+                "reaction_time": float(rng.uniform(0, 5)),
+            }
+            start = time.perf_counter()
+            await request(reader, writer, "POST", "/drone", scenario)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def load(port, clients, requests) -> tuple:
+    """
+    Runs the clients and returns the wall time, latencies and server stats.
+    """
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(client(port, requests, seed, latencies) for seed in range(clients))
+    )
+    elapsed = time.perf_counter() - start
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    stats = await request(reader, writer, "GET", "/stats")
+    writer.close()
+    return elapsed, np.array(latencies), stats
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_healthy(port, timeout=30.0) -> None:
+    """
+    Waits until a local instance accepts connections.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.1)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Load test the solver service.")
+    parser.add_argument(
+        "--port", type=int, help="Port of a running service, else start one."
+    )
+    parser.add_argument("--clients", type=int, default=64, help="Connections.")
+    parser.add_argument(
+        "--requests", type=int, default=100, help="Requests per connection."
+    )
+    parser.add_argument(
+        "--window-ms",
+        type=float,
+        default=2.0,
+        help="Batching window of a started service.",
+    )
+    args = parser.parse_args(argv)
+
+    server = None
+    port = args.port
+    if port is None:
+        port = free_port()
+        server = subprocess.Popen(
+            [
+                sys.executable,
+                str(ROOT / "main.py"),
+                "serve",
+                "--port",
+                str(port),
+                "--window-ms",
+                str(args.window_ms),
+                "--log-level",
+                "WARNING",
+            ]
+        )
+    try:
+        wait_healthy(port)
+        elapsed, latencies, stats = asyncio.run(
+            load(port, args.clients, args.requests)
+        )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    batch_size = stats["batch_size"]
+    print(
+        f"{len(latencies)} requests from {args.clients} clients in {elapsed:.2f} s: "
+        f"{len(latencies) / elapsed:.0f} requests/s"
+    )
+    print(f"client latency p50 {p50:.2f} ms, p99 {p99:.2f} ms")
+    print(
+        f"server latency p50 {stats['latency_ms']['p50']:.2f} ms, "
+        f"p99 {stats['latency_ms']['p99']:.2f} ms"
+    )
+    print(
+        f"{stats['batches']} batches, size mean {batch_size['mean']:.1f}, "
+        f"p50 {batch_size['p50']}, p99 {batch_size['p99']}, max {batch_size['max']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
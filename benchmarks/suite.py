@@ -0,0 +1,322 @@
+"""
+Benchmark suite with stored baselines.
+
+Times the unit converters, the lane collision sweep, both tabs' calculate(),
+update_chart() and simulation ticks, and MainWindow construction, then compares each result
+against a JSON baseline. A case fails when it is slower than its baseline
+by more than the threshold (0.3 = 30 % slower; large array cases allow
+more, see CASE_THRESHOLDS), and the run exits with status 1 if any case
+fails. Each case keeps the median of several timing runs.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.suite
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.suite --save
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.suite --threshold 0.5 -k calculate
+
+Timings depend on the machine, so record a baseline with --save on the
+machine that runs the comparison. PySide6 is only imported by run(), so the
+comparison helpers can be used without a display.
+"""
+
+import argparse
+import configparser
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from lane_collision_solver import LaneCollisionSolver
+from unit_converter import UnitConverter
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Allowed slowdown relative to the baseline before a case fails
+DEFAULT_THRESHOLD = 0.3
+
+# Cases that stream large arrays through memory vary more from run to run,
+# so they get their own allowed slowdown
+CASE_THRESHOLDS = {
+    "unit_converter.to_miles[1M]": 0.6,
+    "lane_collision_solver.solve[100k]": 0.6,
+}
+
+# Timing runs per case; the median one is kept, since a single fastest run
+# is a lucky outlier that later runs rarely match
+REPEAT = 11
+
+
+def measure(function, number, repeat=REPEAT) -> float:
+    """
+    Returns the median mean time of function() over several runs, in
+    microseconds.
+
+    Parameters:
+        function (callable): Called without arguments.
+        number (int): Calls per run.
+        repeat (int): Number of runs.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        times.append((time.perf_counter() - start) / number)
+    return statistics.median(times) * 1e6
+
+
+def converter_cases():
+    """
+    Yields (name, function, number) for the unit converters.
+    """
+    distances = np.linspace(0.0, 1000.0, 1_000_000)
+    yield (
+        "unit_converter.to_miles_per_hour",
+        lambda: UnitConverter.to_miles_per_hour(60.0, "km/h"),
+        20000,
+    )
+    yield (
+        "unit_converter.convert_distance",
+        lambda: UnitConverter.convert_distance(5.0, "kilometers", "feet"),
+        20000,
+    )
+    yield (
+        "unit_converter.to_miles[1M]",
+        lambda: UnitConverter.to_miles(distances, "kilometers"),
+        20,
+    )
+
+
+def solver_cases():
+    """
+    Yields (name, function, number) for the headless solvers.
+    """
+    rng = np.random.default_rng(0)
+    positions = rng.uniform(0.0, 1000.0, 100_000)
+    speeds = rng.uniform(40.0, 80.0, 100_000)
+    yield (
+        "lane_collision_solver.solve[100k]",
+        lambda: LaneCollisionSolver.solve(positions, speeds),
+        1,
+    )
+
+
+def window_cases(app, config):
+    """
+    Yields (name, function, number) for the tabs, simulations and main window.
+    """
+    from car_collision import CarCollisionWindow
+    from car_collision_simulation import CarCollisionSimulation
+    from drone_intercept import DroneInterceptWindow
+    from drone_intercept_simulation import DroneInterceptSimulation
+    from main_window import MainWindow
+
+    drone = DroneInterceptWindow(config)
+    car = CarCollisionWindow(config)
+    for window in (drone, car):
+        window.wait_for_calculation()
+        window.show()
+    app.processEvents()
+
+    def uncached(window):
+        # Clear the result cache so every call solves
+        def calculate():
+            window.result_cache.clear()
+            window.calculate(background=False)
+
+        return calculate
+
+    yield "drone.calculate", uncached(drone), 200
+    yield "car.calculate", uncached(car), 200
+
+    def update_chart(window, update):
+        # Include the layout and paint work the update causes
+        counter = iter(range(10**9))
+
+        def run():
+            update(next(counter))
+            app.processEvents()
+
+        return run
+
+    yield (
+        "drone.update_chart",
+        update_chart(
+            drone,
+            lambda i: drone.update_chart(
+                drone.chart_points(0.5, 2, 5, 5 + i % 10), i % 2 == 0, "miles"
+            ),
+        ),
+        100,
+    )
+    yield (
+        "car.update_chart",
+        update_chart(
+            car,
+            lambda i: car.update_chart(
+                car.chart_points(45, 27, 0.04, 0.1 + (i % 10) / 100), "feet"
+            ),
+        ),
+        100,
+    )
+    for window in (drone, car):
+        window.hide()
+
+    # Scenarios whose event is far beyond the timed ticks
+    simulations = [
+        ("drone.update_simulation", DroneInterceptSimulation("drone", 30, 1000, 5)),
+        ("car.update_simulation", CarCollisionSimulation("car", 45, 44.9, 10)),
+    ]
+    for name, simulation in simulations:
+        simulation.timer.stop()
+        yield name, simulation.update_simulation, 1000
+
+    def build_main_window():
+        window = MainWindow(fast_start=True)
+        window.show()
+        app.processEvents()
+        window.close()
+        window.deleteLater()
+
+    yield "main_window.construct", build_main_window, 5
+
+
+def run(pattern=None) -> dict:
+    """
+    Runs the benchmarks.
+
+    Parameters:
+        pattern (str): Only run cases whose name contains this text.
+
+    Returns:
+        dict: Microseconds per call of each case.
+    """
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    config = configparser.ConfigParser()
+    config.read("config.ini")
+
+    results = {}
+    for cases in (converter_cases(), solver_cases(), window_cases(app, config)):
+        for name, function, number in cases:
+            if pattern and pattern not in name:
+                continue
+            results[name] = measure(function, number)
+            print(f"{name:34} {results[name]:12.2f} us/call", flush=True)
+    return results
+
+
+def compare(results, baseline, threshold, case_thresholds=None) -> list:
+    """
+    Finds the cases that are slower than their baseline by more than their
+    threshold.
+
+    Parameters:
+        results (dict): Microseconds per call of each case.
+        baseline (dict): Baseline microseconds per call of each case.
+        threshold (float): Allowed slowdown, 0.3 for 30 %.
+        case_thresholds (dict): Larger allowed slowdowns of noisy cases.
+
+    Returns:
+        list: (name, baseline, result, ratio, threshold) of each regression.
+    """
+    regressions = []
+    for name, value in results.items():
+        if name not in baseline:
+            continue
+        allowed = max(threshold, (case_thresholds or {}).get(name, 0.0))
+        ratio = value / baseline[name]
+        if ratio > 1 + allowed:
+            regressions.append((name, baseline[name], value, ratio, allowed))
+    return regressions
+
+
+def load_baseline(path) -> dict:
+    """
+    Reads the per-case results of a baseline file.
+    """
+    with open(path) as file:
+        return json.load(file)["results"]
+
+
+def save_baseline(path, results) -> None:
+    """
+    Writes results as a baseline file, with the machine they were measured on.
+    """
+    baseline = {
+        "machine": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "results": {name: round(value, 3) for name, value in results.items()},
+    }
+    with open(path, "w") as file:
+        json.dump(baseline, file, indent=2)
+        file.write("\n")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Run the benchmarks and compare them against a baseline."
+    )
+    parser.add_argument(
+        "--baseline", default=BASELINE_PATH, help="Baseline JSON file."
+    )
+    parser.add_argument(
+        "--save",
+        action="store_true",
+        help="Write the results as the new baseline instead of comparing.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown before a case fails, 0.3 for 30%% "
+        f"(default {DEFAULT_THRESHOLD}).",
+    )
+    parser.add_argument(
+        "-k", dest="pattern", help="Only run cases whose name contains this text."
+    )
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.disable(logging.CRITICAL)
+
+    results = run(args.pattern)
+
+    if args.save:
+        if args.pattern and os.path.exists(args.baseline):
+            # Keep the cases that were not run
+            merged = load_baseline(args.baseline)
+            merged.update(results)
+            results = merged
+        save_baseline(args.baseline, results)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, run with --save first")
+        return 1
+
+    regressions = compare(
+        results, load_baseline(args.baseline), args.threshold, CASE_THRESHOLDS
+    )
+    for name, before, after, ratio, allowed in regressions:
+        print(
+            f"REGRESSION {name}: {before:.2f} -> {after:.2f} us/call "
+            f"({ratio:.2f}x, threshold {1 + allowed:.2f}x)"
+        )
+    if regressions:
+        return 1
+    print(f"No regressions past {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
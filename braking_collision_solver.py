@@ -0,0 +1,231 @@
+from typing import NamedTuple
+from unit_converter import UnitConverter
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+"""
+Headless car collision math with braking.
+
+Car B drives in the same lane a given gap in front of Car A. At time 0 Car B
+brakes at a constant deceleration until it stops. Car A keeps its speed for
+its reaction time, then brakes at its own deceleration until it stops. A
+deceleration of 0 never brakes, so zero decelerations give the constant
+speed problem of CarCollisionSolver.
+
+Each car's motion is piecewise quadratic: cruising, braking, stopped. The
+reaction time and both stop times split the timeline into at most four
+intervals on which the gap is one quadratic, so the collision is the
+earliest root found interval by interval, without any time stepping.
+
+Units: speeds in miles per hour, distances in miles, times in hours,
+decelerations in miles per hour per second and reaction times in seconds.
+This module must not import PySide6 so it can be used without a display.
+"""
+
+
+class BrakingCollisionResult(NamedTuple):
+    """
+    Result of a braking collision solve. Fields are floats for a scalar
+    solve and NumPy arrays for a batch solve.
+
+    Attributes:
+        time_to_collision: Time until the cars collide, in hours. inf where
+            the cars never collide.
+        impact_speed: Closing speed of Car A on Car B at the collision, in
+            miles per hour. NaN where the cars never collide.
+        collision_position: Position of the collision from Car A's start, in
+            miles. NaN where the cars never collide.
+        will_collide: True where the cars collide.
+    """
+
+    time_to_collision: object
+    impact_speed: object
+    collision_position: object
+    will_collide: object
+
+
+class BrakingCollisionSolver:
+    """
+    Vectorized closed-form solver for braking car pairs
+    """
+
+    # Log initialization
+    logger.debug("BrakingCollisionSolver initialized")
+
+    @staticmethod
+    def motion(speed, deceleration, brake_time, time) -> tuple:
+        """
+        Position and speed of a car that brakes to a stop.
+
+        Parameters:
+            speed (array_like): Speed before braking in miles per hour.
+            deceleration (array_like): Deceleration in miles per hour per
+                hour, 0 for never braking.
+            brake_time (array_like): Time braking starts, in hours.
+            time (array_like): Times in hours, at or after 0.
+
+        Returns:
+            tuple: Distance driven since time 0 in miles and speed in miles
+            per hour.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stop = np.where(deceleration > 0, speed / deceleration, np.inf)
+        braking = np.clip(time - brake_time, 0, stop)
+        cruising = np.minimum(time, brake_time)
+        position = speed * (cruising + braking) - 0.5 * deceleration * braking**2
+        # Exactly 0 once stopped, so stopped cars never creep together
+        velocity = np.where(braking >= stop, 0.0, speed - deceleration * braking)
+        return position, velocity
+
+    @staticmethod
+    def solve(
+        speed_car_a,
+        speed_car_b,
+        initial_distance,
+        deceleration_a=0.0,
+        deceleration_b=0.0,
+        reaction_time=0.0,
+        speed_unit="mph",
+        distance_unit="miles",
+    ) -> BrakingCollisionResult:
+        """
+        Solves the collision for arrays of braking car pairs in one call.
+
+        Inputs are broadcast against each other, so any of them may be a scalar.
+
+        Parameters:
+            speed_car_a (array_like): Speed of Car A.
+            speed_car_b (array_like): Speed of Car B.
+            initial_distance (array_like): Gap between the cars.
+            deceleration_a (array_like): Braking of Car A, in speed units per
+                second.
+            deceleration_b (array_like): Braking of Car B, in speed units per
+                second, from time 0.
+            reaction_time (array_like): Seconds before Car A starts braking.
+            speed_unit (str or array_like): Unit of the speeds and
+                decelerations, or one unit name or UnitRegistry code per pair.
+            distance_unit (str or array_like): Unit of the gaps, or one unit
+                name or UnitRegistry code per pair.
+
+        Returns:
+            BrakingCollisionResult: Arrays of time to collision in hours,
+            impact speed in mph, collision position in miles and the
+            collision mask.
+        """
+
+        def to_mph(value):
+            return UnitConverter.convert_speed(
+                np.asarray(value, dtype=np.float64), speed_unit, "mph"
+            )
+
+        speed_a = to_mph(speed_car_a)
+        speed_b = to_mph(speed_car_b)
+        gap = UnitConverter.convert_distance(
+            np.asarray(initial_distance, dtype=np.float64), distance_unit, "miles"
+        )
+        # Per second to per hour
+        braking_a = to_mph(deceleration_a) * 3600
+        braking_b = to_mph(deceleration_b) * 3600
+        reaction = np.asarray(reaction_time, dtype=np.float64) / 3600
+        speed_a, speed_b, gap, braking_a, braking_b, reaction = np.broadcast_arrays(
+            speed_a, speed_b, gap, braking_a, braking_b, reaction
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stop_a = reaction + np.where(braking_a > 0, speed_a / braking_a, np.inf)
+            stop_b = np.where(braking_b > 0, speed_b / braking_b, np.inf)
+        zeros = np.zeros(gap.shape)
+        breaks = np.sort(
+            np.stack([zeros, reaction, stop_a, stop_b, np.full(gap.shape, np.inf)]),
+            axis=0,
+        )
+
+        def state(time):
+            position_a, velocity_a = BrakingCollisionSolver.motion(
+                speed_a, braking_a, reaction, time
+            )
+            position_b, velocity_b = BrakingCollisionSolver.motion(
+                speed_b, braking_b, zeros, time
+            )
+            return position_a, velocity_a, gap + position_b, velocity_b
+
+        # Cars already touching collide when Car A closes in at once
+        closing = speed_a - speed_b
+        braking_now = np.where(speed_b > 0, braking_b, 0.0) - np.where(
+            reaction > 0, 0.0, braking_a
+        )
+        time = np.where(
+            (gap <= 0) & ((closing > 0) | ((closing == 0) & (braking_now > 0))),
+            0.0,
+            np.inf,
+        )
+
+        # Intervals starting at inf only yield NaN gaps, which never collide
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            for start, end in zip(breaks[:-1], breaks[1:]):
+                # The gap is g + w s + accel s^2 / 2, s from the start
+                position_a, velocity_a, position_b, velocity_b = state(start)
+                middle = np.where(np.isinf(end), start + 1, (start + end) / 2)
+                accel_a = np.where(
+                    (middle > reaction) & (middle < stop_a), -braking_a, 0.0
+                )
+                accel_b = np.where(middle < stop_b, -braking_b, 0.0)
+                g = position_b - position_a
+                w = velocity_b - velocity_a
+                accel = accel_b - accel_a
+
+                # Stable roots: no cancellation between w and the root
+                discriminant = w * w - 2 * accel * g
+                root = np.sqrt(np.where(discriminant >= 0, discriminant, np.nan))
+                q = -0.5 * (w + np.copysign(root, w))
+                linear = accel == 0
+                first = np.where(linear, -g / w, q / (accel / 2))
+                second = np.where(linear, np.nan, g / q)
+                roots = np.stack([first, second])
+                roots = np.where((roots >= 0) & (roots <= end - start), roots, np.inf)
+                earliest = start + roots.min(axis=0)
+                time = np.where(g > 0, np.fmin(time, earliest), time)
+
+        will_collide = np.isfinite(time)
+        position_a, velocity_a, _, velocity_b = state(np.where(will_collide, time, 0))
+        return BrakingCollisionResult(
+            time,
+            np.where(will_collide, velocity_a - velocity_b, np.nan),
+            np.where(will_collide, position_a, np.nan),
+            will_collide,
+        )
+
+    @staticmethod
+    def solve_scalar(
+        speed_car_a,
+        speed_car_b,
+        initial_distance,
+        deceleration_a=0.0,
+        deceleration_b=0.0,
+        reaction_time=0.0,
+        speed_unit="mph",
+        distance_unit="miles",
+    ) -> BrakingCollisionResult:
+        """
+        Solves the collision of a single braking pair of cars.
+
+        Runs the same code path as solve() so the GUI and batch results agree.
+
+        Returns:
+            BrakingCollisionResult: Python floats and a bool.
+        """
+        result = BrakingCollisionSolver.solve(
+            speed_car_a,
+            speed_car_b,
+            initial_distance,
+            deceleration_a,
+            deceleration_b,
+            reaction_time,
+            speed_unit,
+            distance_unit,
+        )
+        return BrakingCollisionResult(
+            *(float(value) for value in result[:-1]), bool(result.will_collide)
+        )
@@ -6,20 +6,23 @@ from PySide6.QtWidgets import (
     QComboBox,
     QGroupBox,
     QFormLayout,
+    QPushButton,
+    QFileDialog,
 )
-from PySide6.QtCharts import QChart, QLineSeries, QValueAxis, QScatterSeries
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QPointF
 from PySide6.QtGui import QColor, QPen
+from typing import List, NamedTuple
 from unit_converter import UnitConverter
-from car_collision_simulation import CarCollisionSimulation
+from car_collision_solver import CarCollisionSolver, CollisionResult
+from braking_collision_solver import BrakingCollisionSolver, BrakingCollisionResult
+from lane_collision_solver import LaneCollisionSolver
+from result_cache import ChartPoints
 from simulation_window import SimulationWindow
 import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
 
-# Set up logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - %(filename)s - %(lineno)d - %(message)s",
-)
 
 """
 Design Patterns:
@@ -27,15 +30,39 @@ Design Patterns:
 """
 
 
+class CollisionEntry(NamedTuple):
+    """
+    A solved car scenario in canonical units, as kept in the result cache.
+
+    Attributes:
+        result: The solver result.
+        suggestions: Thresholds from solve_suggestions(), None when the
+            collision comes late enough.
+        chart: The chart point sets in hours and miles.
+        braking: The braking solver result, None when the cars don't brake.
+    """
+
+    result: CollisionResult
+    suggestions: object
+    chart: ChartPoints
+    braking: BrakingCollisionResult = None
+
+
 class CarCollisionWindow(SimulationWindow):
     # Log initialization
-    logging.info("CarCollisionWindow initialized")
+    logger.debug("CarCollisionWindow initialized")
+
+    # Collisions of a loaded lane shown in the lane chart
+    LANE_CHART_COLLISIONS = 50
 
-    def __init__(self, config) -> None:
+    # Points of each braking car's curve in the chart
+    BRAKING_CHART_POINTS = 200
+
+    def __init__(self, config, fast_start=False) -> None:
         """
         Initialize the window
         """
-        super().__init__(config)
+        super().__init__(config, fast_start)
         self.config = config
 
     def create_input_group(self, layout) -> None:
@@ -50,33 +77,23 @@ class CarCollisionWindow(SimulationWindow):
         self.speed_car_b.setRange(0.0, 999999.0)
 
         self.speed_unit_combo = QComboBox()
-        self.speed_unit_combo.addItems(
-            [
-                "mph",
-                "km/h",
-                "m/h",
-                "yd/h",
-                "ft/h",
-                "mpm",
-                "km/min",
-                "m/min",
-                "yd/min",
-                "ft/min",
-                "mps",
-                "km/s",
-                "m/s",
-                "yd/s",
-                "ft/s",
-            ]
-        )
+        self.speed_unit_combo.addItems(UnitConverter.speed_units.units)
 
         self.initial_distance = QDoubleSpinBox()
         self.initial_distance.setRange(0, 999999.0)
 
         self.distance_unit_combo = QComboBox()
-        self.distance_unit_combo.addItems(
-            ["miles", "kilometers", "meters", "yards", "feet"]
-        )
+        self.distance_unit_combo.addItems(UnitConverter.distance_units.units)
+
+        self.min_time_to_collision = QDoubleSpinBox()
+        self.min_time_to_collision.setRange(0.0, 999999.0)
+
+        # Braking is in the speed unit per second
+        self.deceleration = QDoubleSpinBox()
+        self.deceleration.setRange(0.0, 999999.0)
+
+        self.reaction_time = QDoubleSpinBox()
+        self.reaction_time.setRange(0.0, 999999.0)
 
         # Layout setup
         input_group = QGroupBox("Input Parameters")
@@ -86,6 +103,9 @@ class CarCollisionWindow(SimulationWindow):
         input_layout.addRow("Speed units:", self.speed_unit_combo)
         input_layout.addRow("Initial distance:", self.initial_distance)
         input_layout.addRow("Distance units:", self.distance_unit_combo)
+        input_layout.addRow("Collide no sooner than (min):", self.min_time_to_collision)
+        input_layout.addRow("Braking (speed units/s):", self.deceleration)
+        input_layout.addRow("Car A reaction time (s):", self.reaction_time)
         layout.addWidget(input_group)
 
         # Set default values
@@ -94,6 +114,13 @@ class CarCollisionWindow(SimulationWindow):
         self.initial_distance.setValue(
             float(self.config["CAR_COLLISION"]["initial_distance"])
         )
+        self.min_time_to_collision.setValue(
+            float(self.config["CAR_COLLISION"]["min_time_to_collision"])
+        )
+        self.deceleration.setValue(float(self.config["CAR_COLLISION"]["deceleration"]))
+        self.reaction_time.setValue(
+            float(self.config["CAR_COLLISION"]["reaction_time"])
+        )
         self.speed_unit_combo.setCurrentIndex(
             int(self.config["CAR_COLLISION"]["speed_unit"])
         )
@@ -112,9 +139,12 @@ class CarCollisionWindow(SimulationWindow):
         self.distance_unit_combo.currentIndexChanged.connect(self.log_distance_unit)
         self.speed_unit_combo.currentIndexChanged.connect(self.log_speed_unit)
 
-        self.speed_car_a.valueChanged.connect(self.validate_and_calculate)
-        self.speed_car_b.valueChanged.connect(self.validate_and_calculate)
-        self.initial_distance.valueChanged.connect(self.validate_and_calculate)
+        self.speed_car_a.valueChanged.connect(self.schedule_calculate)
+        self.speed_car_b.valueChanged.connect(self.schedule_calculate)
+        self.initial_distance.valueChanged.connect(self.schedule_calculate)
+        self.min_time_to_collision.valueChanged.connect(self.schedule_calculate)
+        self.deceleration.valueChanged.connect(self.schedule_calculate)
+        self.reaction_time.valueChanged.connect(self.schedule_calculate)
         self.distance_unit_combo.currentIndexChanged.connect(self.update_units)
         self.speed_unit_combo.currentIndexChanged.connect(self.update_units)
 
@@ -122,33 +152,42 @@ class CarCollisionWindow(SimulationWindow):
         """
         Logs the value of Car A's speed when it changes.
         """
-        logging.debug(f"\nCar A speed changed to {self.speed_car_a.value()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Car A speed changed to %s", self.speed_car_a.value())
 
     def log_initial_distance(self) -> None:
         """
         Logs the value of the initial distance when it changes.
         """
-        logging.debug(f"\nInitial distance changed to {self.initial_distance.value()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Initial distance changed to %s", self.initial_distance.value()
+            )
 
     def log_car_speed_b(self) -> None:
         """
         Logs the value of Car B's speed when it changes.
         """
-        logging.debug(f"\nCar B speed changed to {self.speed_car_b.value()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Car B speed changed to %s", self.speed_car_b.value())
 
     def log_distance_unit(self) -> None:
         """
         Logs the value of the distance unit when it changes.
         """
-        logging.debug(
-            f"\nDistance unit changed to {self.distance_unit_combo.currentText()}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Distance unit changed to %s", self.distance_unit_combo.currentText()
+            )
 
     def log_speed_unit(self) -> None:
         """
         Logs the value of the speed unit when it changes.
         """
-        logging.debug(f"\nSpeed unit changed to {self.speed_unit_combo.currentText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Speed unit changed to %s", self.speed_unit_combo.currentText()
+            )
 
     def create_problem_group(self, layout) -> None:
         """
@@ -187,18 +226,47 @@ class CarCollisionWindow(SimulationWindow):
         """
         # Result label
         self.result_label = QLabel("Result will be shown here")
+        self.suggestion_label = QLabel("")
 
         # Layout setup
         result_group = QGroupBox("Results")
         result_layout = QVBoxLayout(result_group)
         result_layout.addWidget(self.result_label)
+        result_layout.addWidget(self.suggestion_label)
         layout.addWidget(result_group)
 
+        self.create_lane_group(layout)
+
+    def create_lane_group(self, layout) -> None:
+        """
+        Create the group for a lane of many cars loaded from a file
+
+        Parameters:
+            layout (QVBoxLayout): The layout to add the lane group box to.
+        """
+        self.lane = None
+        self.lane_collisions = None
+        self.lane_chart = None
+        self.lane_label = QLabel(
+            "Load a CSV or JSONL file with position and speed columns, in the "
+            "units above, to find the first collisions of a lane."
+        )
+        self.lane_label.setWordWrap(True)
+        load_lane_button = QPushButton("Load Lane...")
+        load_lane_button.clicked.connect(self.choose_lane_file)
+
+        # Layout setup
+        lane_group = QGroupBox("Lane")
+        self.lane_layout = QVBoxLayout(lane_group)
+        self.lane_layout.addWidget(self.lane_label)
+        self.lane_layout.addWidget(load_lane_button)
+        layout.addWidget(lane_group)
+
     def validate_and_calculate(self) -> None:
         """
         Validate the input values and calculate the time to collision
         """
-        logging.debug("validate_and_calculate called")
+        logger.debug("validate_and_calculate called")
 
         if not self.validate_input(self.speed_car_a.value(), min_value=0):
             QMessageBox.warning(
@@ -215,42 +283,128 @@ class CarCollisionWindow(SimulationWindow):
                 self, "Invalid Input", "Initial distance must be non-negative."
             )
             return
+        if not self.validate_input(self.deceleration.value(), min_value=0):
+            QMessageBox.warning(self, "Invalid Input", "Braking must be non-negative.")
+            return
+        if not self.validate_input(self.reaction_time.value(), min_value=0):
+            QMessageBox.warning(
+                self, "Invalid Input", "Reaction time must be non-negative."
+            )
+            return
         self.calculate()
 
-    def calculate(self) -> None:
+    def scenario(self) -> tuple:
         """
-        Calculate the time to collision and update the result label
+        Return the inputs in canonical units: speeds in mph, the initial
+        distance in miles, the wanted time to collision in hours, braking in
+        mph per second and the reaction time in seconds
         """
-        logging.debug("calculate called")
-
         speed_unit = self.speed_unit_combo.currentText()
         distance_unit = self.distance_unit_combo.currentText()
-
-        # Calculate the speed of car A in miles per hour
-        speed_car_a_mph = UnitConverter.to_miles_per_hour(
-            self.speed_car_a.value(), speed_unit
+        return (
+            UnitConverter.to_miles_per_hour(self.speed_car_a.value(), speed_unit),
+            UnitConverter.to_miles_per_hour(self.speed_car_b.value(), speed_unit),
+            UnitConverter.to_miles(self.initial_distance.value(), distance_unit),
+            self.min_time_to_collision.value() / 60,
+            UnitConverter.to_miles_per_hour(self.deceleration.value(), speed_unit),
+            self.reaction_time.value(),
         )
 
-        # Calculate the speed of car B in miles per hour
-        speed_car_b_mph = UnitConverter.to_miles_per_hour(
-            self.speed_car_b.value(), speed_unit
+    def solve_scenario(
+        self,
+        speed_car_a_mph,
+        speed_car_b_mph,
+        initial_distance_miles,
+        min_time_to_collision_hours,
+        deceleration=0.0,
+        reaction_time=0.0,
+    ) -> CollisionEntry:
+        """
+        Solve the collision, the suggestions and the chart points of a scenario
+
+        Parameters:
+            speed_car_a_mph (float): The speed of Car A in miles per hour.
+            speed_car_b_mph (float): The speed of Car B in miles per hour.
+            initial_distance_miles (float): The initial distance in miles.
+            min_time_to_collision_hours (float): The wanted time to collision in hours.
+            deceleration (float): Braking of both cars in mph per second, 0
+                for constant speeds.
+            reaction_time (float): Seconds before Car A brakes after Car B.
+
+        Returns:
+            CollisionEntry: The solved scenario in canonical units.
+        """
+        logger.debug("solve_scenario called")
+
+        if deceleration > 0:
+            braking = BrakingCollisionSolver.solve_scalar(
+                speed_car_a_mph,
+                speed_car_b_mph,
+                initial_distance_miles,
+                deceleration,
+                deceleration,
+                reaction_time,
+            )
+            chart = self.braking_chart_points(
+                speed_car_a_mph,
+                speed_car_b_mph,
+                initial_distance_miles,
+                deceleration,
+                reaction_time,
+                braking,
+            )
+            # The suggestions solve the constant speed model only
+            result = CarCollisionSolver.solve_scalar(
+                speed_car_a_mph, speed_car_b_mph, initial_distance_miles
+            )
+            return CollisionEntry(result, None, chart, braking)
+
+        result = CarCollisionSolver.solve_scalar(
+            speed_car_a_mph, speed_car_b_mph, initial_distance_miles
         )
 
-        # Calculate the initial distance between the cars in miles
-        initial_distance_miles = UnitConverter.to_miles(
-            self.initial_distance.value(), distance_unit
+        # Suggestions when the collision comes sooner than wanted
+        suggestions = None
+        if (
+            result.will_collide
+            and result.time_to_collision < min_time_to_collision_hours
+        ):
+            suggestions = self.solve_suggestions(
+                speed_car_a_mph,
+                speed_car_b_mph,
+                initial_distance_miles,
+                min_time_to_collision_hours,
+            )
+
+        time_to_collision = result.time_to_collision if result.will_collide else 0
+        chart = self.chart_points(
+            speed_car_a_mph, speed_car_b_mph, initial_distance_miles, time_to_collision
         )
+        return CollisionEntry(result, suggestions, chart)
+
+    def show_result(self, entry) -> None:
+        """
+        Update the result label, suggestions, problem statement and chart in
+        the display units
 
-        # Calculate the relative speed of the cars
-        speed_difference = speed_car_a_mph - speed_car_b_mph
+        Parameters:
+            entry (CollisionEntry): The solved scenario.
+        """
+        logger.debug("show_result called")
 
-        if speed_difference <= 0:
-            self.result_label.setText("The cars will never collide.")
-            self.update_chart(0, distance_unit)
+        distance_unit = self.distance_unit_combo.currentText()
+        _, time_to_collision_hours, will_collide = entry.result
+
+        if entry.braking is not None:
+            self.show_braking_result(entry.braking)
+            self.update_chart(entry.chart, distance_unit)
             return
 
-        # Calculate time to collision in hours
-        time_to_collision_hours = initial_distance_miles / speed_difference
+        if not will_collide:
+            self.result_label.setText("The cars will never collide.")
+            self.suggestion_label.setText("")
+            self.update_chart(entry.chart, distance_unit)
+            return
 
         # Convert time to minutes and seconds
         total_seconds = time_to_collision_hours * 3600
@@ -262,6 +416,12 @@ class CarCollisionWindow(SimulationWindow):
             f"The cars will collide in {minutes} minutes and {seconds}.{milliseconds} seconds."
         )
 
+        if entry.suggestions is None:
+            self.suggestion_label.setText("")
+        else:
+            suggestions = self.generate_suggestions(entry.suggestions)
+            self.suggestion_label.setText("\n".join(suggestions))
+
         # Update the problem statement
         car_a_speed = str(self.speed_car_a.value())
         car_b_speed = str(self.speed_car_b.value())
@@ -279,206 +439,581 @@ class CarCollisionWindow(SimulationWindow):
         self.problem_label.setText(problem)
 
         # Update the chart
-        self.update_chart(time_to_collision_hours, distance_unit)
+        self.update_chart(entry.chart, distance_unit)
 
-    def update_chart(self, time_to_collision, distance_unit) -> None:
+    def show_braking_result(self, braking) -> None:
         """
-        Update the chart with the new time to collision
+        Update the result label and problem statement of a braking scenario
+        in the display units
 
         Parameters:
-            time_to_collision (float): The calculated time to collision in hours.
-            distance_unit (str): The unit of distance used for the chart (e.g., "miles", "km").
+            braking (BrakingCollisionResult): The braking solver result.
         """
-        logging.debug("update_chart called")
-
-        # Calculate the maximum time for the chart
-        max_time = time_to_collision * 1.5 if time_to_collision > 0 else 1
+        speed_unit = self.speed_unit_combo.currentText()
+        distance_unit = self.distance_unit_combo.currentText()
 
-        # Convert speeds to the chart's distance unit per hour
-        speed_car_a = UnitConverter.from_miles(
-            UnitConverter.to_miles_per_hour(
-                self.speed_car_a.value(), self.speed_unit_combo.currentText()
-            ),
-            distance_unit,
+        if braking.will_collide:
+            impact_speed = UnitConverter.from_miles_per_hour(
+                braking.impact_speed, speed_unit
+            )
+            self.result_label.setText(
+                f"The cars will collide in {braking.time_to_collision * 3600:.3f} "
+                f"seconds at an impact speed of {impact_speed:.2f} {speed_unit}."
+            )
+        else:
+            self.result_label.setText("The cars will stop without colliding.")
+        self.suggestion_label.setText("")
+
+        self.problem_label.setText(
+            f"Car A is traveling {self.speed_car_a.value()} {speed_unit}.\n"
+            f"Car B is traveling {self.speed_car_b.value()} {speed_unit}.\n"
+            f"Car B is traveling in the same lane {self.initial_distance.value()} "
+            f"{distance_unit} in front of Car A.\n"
+            f"Car B brakes at {self.deceleration.value()} {speed_unit} per second, "
+            f"and Car A does the same {self.reaction_time.value()} seconds later.\n"
+            "Will the cars collide, and how hard?"
         )
 
-        # Convert speeds to the chart's distance unit per hour
-        speed_car_b = UnitConverter.from_miles(
-            UnitConverter.to_miles_per_hour(
-                self.speed_car_b.value(), self.speed_unit_combo.currentText()
-            ),
-            distance_unit,
-        )
+    def solve_suggestions(
+        self,
+        speed_car_a_mph,
+        speed_car_b_mph,
+        initial_distance_miles,
+        min_time_to_collision_hours,
+    ) -> dict:
+        """
+        Solve for each input the value that delays the collision to at least
+        a given time, changing one input at a time
 
-        # Convert initial distance to the chart's distance unit
-        initial_distance = UnitConverter.from_miles(
-            UnitConverter.to_miles(
-                self.initial_distance.value(), self.distance_unit_combo.currentText()
-            ),
-            distance_unit,
-        )
+        Parameters:
+            speed_car_a_mph (float): The speed of Car A in miles per hour.
+            speed_car_b_mph (float): The speed of Car B in miles per hour.
+            initial_distance_miles (float): The initial distance in miles.
+            min_time_to_collision_hours (float): The wanted time to collision in hours.
+
+        Returns:
+            dict: Threshold of each input in canonical units.
+        """
+        from inverse_solver import InverseSolver
+
+        logger.debug("solve_suggestions called")
+
+        inputs = {
+            "speed_car_a": speed_car_a_mph,
+            "speed_car_b": speed_car_b_mph,
+            "initial_distance": initial_distance_miles,
+        }
+
+        thresholds = {}
+        for solve_for in inputs:
+            others = {
+                name: value for name, value in inputs.items() if name != solve_for
+            }
+            thresholds[solve_for] = InverseSolver.solve_scalar(
+                "car",
+                "time_to_collision",
+                min_time_to_collision_hours,
+                solve_for,
+                **others,
+            )
+        return thresholds
+
+    def generate_suggestions(self, thresholds) -> List[str]:
+        """
+        Generate suggestions for delaying the collision to at least a given
+        time, in the display units
+
+        Parameters:
+            thresholds (dict): Thresholds from solve_suggestions().
+
+        Returns:
+            list: A list of suggestions.
+        """
+        logger.debug("generate_suggestions called")
+
+        speed_unit = self.speed_unit_combo.currentText()
+        distance_unit = self.distance_unit_combo.currentText()
+        labels = {
+            "speed_car_a": ("Car A speed", speed_unit),
+            "speed_car_b": ("Car B speed", speed_unit),
+            "initial_distance": ("Initial distance", distance_unit),
+        }
+
+        suggestions = ["Suggestions:"]
+        for solve_for, (label, unit) in labels.items():
+            result = thresholds[solve_for]
+            if not result.found:
+                continue
+            if solve_for == "initial_distance":
+                value = UnitConverter.from_miles(result.value, unit)
+            else:
+                value = UnitConverter.from_miles_per_hour(result.value, unit)
+            bound = "at least" if result.increasing else "at most"
+            suggestions.append(f"{label} {bound} {value:.2f} {unit}")
+
+        return suggestions
+
+    def init_chart(self) -> None:
+        """
+        Create the chart, its series and axes once. update_chart() then only
+        replaces points and axis ranges.
+        """
+        from PySide6.QtCharts import QChart, QLineSeries, QValueAxis, QScatterSeries
 
         # Series for Car A
-        series_a = QLineSeries()
-        series_a.setName("Car A")
-        series_a.append(0, 0)
-        series_a.append(max_time, speed_car_a * max_time)
+        self.series_a = QLineSeries()
+        self.series_a.setName("Car A")
 
         # Series for Car B
-        series_b = QLineSeries()
-        series_b.setName("Car B")
-        series_b.append(0, initial_distance)
-        series_b.append(max_time, initial_distance + speed_car_b * max_time)
-
-        # Calculate max distance for y-axis
-        max_distance = max(
-            speed_car_a * max_time, initial_distance + speed_car_b * max_time
-        )
+        self.series_b = QLineSeries()
+        self.series_b.setName("Car B")
 
         # Intersect point
-        intersect_series = QLineSeries()
-        intersect_series.setName("Intersect Point")
-        intersect_series.append(0, speed_car_a * time_to_collision)
-        intersect_series.append(time_to_collision, speed_car_a * time_to_collision)
-        intersect_series.append(time_to_collision, 0)
+        self.intersect_series = QLineSeries()
+        self.intersect_series.setName("Intersect Point")
 
         # Collision point
-        collision_series = QScatterSeries()
-        collision_series.setName("Collision Point")
-        if time_to_collision > 0:
-            collision_point = speed_car_a * time_to_collision
-            collision_series.append(time_to_collision, collision_point)
+        self.collision_series = QScatterSeries()
+        self.collision_series.setName("Collision Point")
 
         # Set colors
-        series_a.setPen(QPen(QColor(Qt.blue), 2))
-        series_b.setPen(QPen(QColor(Qt.red), 2))
-        intersect_series.setPen(QPen(QColor(Qt.green), 2, Qt.DashLine))
-        collision_series.setColor(QColor(Qt.green))
-        collision_series.setMarkerSize(15)
+        self.series_a.setPen(QPen(QColor(Qt.blue), 2))
+        self.series_b.setPen(QPen(QColor(Qt.red), 2))
+        self.intersect_series.setPen(QPen(QColor(Qt.green), 2, Qt.DashLine))
+        self.collision_series.setColor(QColor(Qt.green))
+        self.collision_series.setMarkerSize(15)
 
         # Create and configure x-axis
-        axis_x = QValueAxis()
-        axis_x.setTitleText("Time (hours)")
-        axis_x.setRange(0, max_time)
-        axis_x.setTickCount(10)
-        axis_x.setGridLineVisible(True)
+        self.axis_x = QValueAxis()
+        self.axis_x.setTitleText("Time (hours)")
+        self.axis_x.setTickCount(10)
+        self.axis_x.setGridLineVisible(True)
 
         # Create and configure y-axis
-        axis_y = QValueAxis()
-        axis_y.setTitleText(f"Distance ({distance_unit})")
-        axis_y.setRange(0, max_distance)
-        axis_y.setTickCount(10)
-        axis_y.setGridLineVisible(True)
+        self.axis_y = QValueAxis()
+        self.axis_y.setTickCount(10)
+        self.axis_y.setGridLineVisible(True)
 
         # Chart setup
-        chart = QChart()
-        chart.setTitle("Car Collision Visualization")
+        self.chart = QChart()
+        self.chart.setTitle("Car Collision Visualization")
 
-        chart.addSeries(intersect_series)
-        chart.addSeries(series_a)
-        chart.addSeries(series_b)
-        chart.addSeries(collision_series)
+        self.chart.addSeries(self.intersect_series)
+        self.chart.addSeries(self.series_a)
+        self.chart.addSeries(self.series_b)
+        self.chart.addSeries(self.collision_series)
 
-        chart.addAxis(axis_x, Qt.AlignBottom)
-        chart.addAxis(axis_y, Qt.AlignLeft)
+        self.chart.addAxis(self.axis_x, Qt.AlignBottom)
+        self.chart.addAxis(self.axis_y, Qt.AlignLeft)
 
         # Attach series to the axes
-        series_a.attachAxis(axis_x)
-        series_a.attachAxis(axis_y)
-        series_b.attachAxis(axis_x)
-        series_b.attachAxis(axis_y)
-        intersect_series.attachAxis(axis_x)
-        intersect_series.attachAxis(axis_y)
-        collision_series.attachAxis(axis_x)
-        collision_series.attachAxis(axis_y)
+        for series in self.chart.series():
+            series.attachAxis(self.axis_x)
+            series.attachAxis(self.axis_y)
 
         # Set chart to view
-        self.chart_view.setChart(chart)
+        self.set_chart(self.chart)
+
+    @staticmethod
+    def chart_points(
+        speed_car_a, speed_car_b, initial_distance, time_to_collision
+    ) -> ChartPoints:
+        """
+        Compute the chart's point sets in hours and miles
+
+        Parameters:
+            speed_car_a (float): The speed of Car A in miles per hour.
+            speed_car_b (float): The speed of Car B in miles per hour.
+            initial_distance (float): The initial distance in miles.
+            time_to_collision (float): The time to collision in hours, 0 if
+                the cars never collide.
+
+        Returns:
+            ChartPoints: The point sets of each series.
+        """
+        # Calculate the maximum time for the chart
+        max_time = time_to_collision * 1.5 if time_to_collision > 0 else 1
+
+        collision_point = speed_car_a * time_to_collision
+        series = {
+            "series_a": ((0, max_time), (0, speed_car_a * max_time)),
+            "series_b": (
+                (0, max_time),
+                (initial_distance, initial_distance + speed_car_b * max_time),
+            ),
+            "intersect_series": (
+                (0, time_to_collision, time_to_collision),
+                (collision_point, collision_point, 0),
+            ),
+            "collision_series": (
+                ((time_to_collision,), (collision_point,))
+                if time_to_collision > 0
+                else ((), ())
+            ),
+        }
+
+        # Calculate max distance for y-axis
+        max_distance = max(
+            speed_car_a * max_time, initial_distance + speed_car_b * max_time
+        )
+        return ChartPoints(series, max_time, max_distance)
+
+    @staticmethod
+    def braking_chart_points(
+        speed_car_a, speed_car_b, initial_distance, deceleration, reaction_time, braking
+    ) -> ChartPoints:
+        """
+        Compute the chart's point sets of a braking scenario in hours and miles
+
+        Parameters:
+            speed_car_a (float): The speed of Car A in miles per hour.
+            speed_car_b (float): The speed of Car B in miles per hour.
+            initial_distance (float): The initial distance in miles.
+            deceleration (float): Braking of both cars in mph per second.
+            reaction_time (float): Seconds before Car A brakes.
+            braking (BrakingCollisionResult): The braking solver result.
+
+        Returns:
+            ChartPoints: The point sets of each series.
+        """
+        deceleration *= 3600
+        reaction_time /= 3600
+        if braking.will_collide and braking.time_to_collision > 0:
+            end = braking.time_to_collision
+        else:
+            # Both cars have stopped
+            end = max(
+                reaction_time + speed_car_a / deceleration, speed_car_b / deceleration
+            )
+        max_time = end * 1.5 if end > 0 else 1
+
+        times = np.linspace(0, max_time, CarCollisionWindow.BRAKING_CHART_POINTS)
+        position_a, _ = BrakingCollisionSolver.motion(
+            speed_car_a, deceleration, reaction_time, times
+        )
+        position_b, _ = BrakingCollisionSolver.motion(
+            speed_car_b, deceleration, 0.0, times
+        )
+        position_b += initial_distance
+
+        if braking.will_collide:
+            time, position = braking.time_to_collision, braking.collision_position
+            intersect = ((0, time, time), (position, position, 0))
+            collision = ((time,), (position,))
+        else:
+            intersect = collision = ((), ())
+        series = {
+            "series_a": (times.tolist(), position_a.tolist()),
+            "series_b": (times.tolist(), position_b.tolist()),
+            "intersect_series": intersect,
+            "collision_series": collision,
+        }
+        max_distance = max(position_a.max(), position_b.max())
+        return ChartPoints(series, max_time, float(max_distance))
+
+    def update_chart(self, chart_points, distance_unit) -> None:
+        """
+        Update the chart with the new time to collision
+
+        Parameters:
+            chart_points (ChartPoints): The point sets in hours and miles.
+            distance_unit (str): The unit of distance used for the chart (e.g., "miles", "km").
+        """
+        logger.debug("update_chart called")
+
+        if self.chart is None:
+            self.init_chart()
+
+        # Replace the points of each series in one call
+        self.show_chart_points(chart_points, UnitConverter.from_miles(1.0, distance_unit))
+
+        # Update the axis title
+        self.axis_y.setTitleText(f"Distance ({distance_unit})")
+
+    def choose_lane_file(self) -> None:
+        """
+        Ask for a lane file and load it
+        """
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Load Lane", "", "Lanes (*.csv *.jsonl);;All files (*)"
+        )
+        if path:
+            self.load_lane(path)
+
+    def load_lane(self, path) -> None:
+        """
+        Read a lane file in the display units and show its first collisions
+
+        Parameters:
+            path (str): A CSV or JSONL file with position and speed columns.
+        """
+        from batch import read_records
+
+        logger.debug("load_lane called")
+
+        fmt = "jsonl" if path.lower().endswith(".jsonl") else "csv"
+        try:
+            with open(path, newline="") as stream:
+                records = list(read_records(stream, fmt))
+            positions = [float(record["position"]) for record in records]
+            speeds = [float(record["speed"]) for record in records]
+        except (OSError, KeyError, ValueError) as error:
+            QMessageBox.warning(self, "Invalid Lane", f"Could not read {path}: {error}")
+            return
+
+        self.show_lane(
+            UnitConverter.to_miles(
+                np.asarray(positions), self.distance_unit_combo.currentText()
+            ),
+            UnitConverter.to_miles_per_hour(
+                np.asarray(speeds), self.speed_unit_combo.currentText()
+            ),
+        )
+
+    def show_lane(self, positions_miles, speeds_mph) -> None:
+        """
+        Solve a lane and show its first collisions
+
+        Parameters:
+            positions_miles (np.ndarray): Position of each car in miles.
+            speeds_mph (np.ndarray): Speed of each car in miles per hour.
+        """
+        logger.debug("show_lane called")
+
+        try:
+            collisions = LaneCollisionSolver.solve(positions_miles, speeds_mph)
+        except ValueError as error:
+            QMessageBox.warning(self, "Invalid Lane", str(error))
+            return
+        self.lane = (positions_miles, speeds_mph)
+        self.lane_collisions = collisions
+        self.update_lane()
+
+    def update_lane(self) -> None:
+        """
+        Update the lane label and chart in the display units
+        """
+        if self.lane_collisions is None:
+            return
+
+        distance_unit = self.distance_unit_combo.currentText()
+        positions, _ = self.lane
+        collisions = self.lane_collisions
+        if not len(collisions.time):
+            self.lane_label.setText(f"{len(positions)} cars, no collisions.")
+        else:
+            first_position = UnitConverter.from_miles(
+                float(collisions.position[0]), distance_unit
+            )
+            # Cars are numbered by their row in the file
+            self.lane_label.setText(
+                f"{len(positions)} cars, {len(collisions.time)} collisions.\n"
+                f"First: car {collisions.rear[0] + 1} hits car "
+                f"{collisions.front[0] + 1} after "
+                f"{collisions.time[0] * 3600:.2f} seconds at "
+                f"{first_position:.2f} {distance_unit}."
+            )
+        self.update_lane_chart(distance_unit)
+
+    def init_lane_chart(self) -> None:
+        """
+        Create the lane chart: the first collisions as points in time and
+        position, and the paths of the first pair
+        """
+        from PySide6.QtCharts import (
+            QChart,
+            QChartView,
+            QLineSeries,
+            QScatterSeries,
+            QValueAxis,
+        )
+
+        self.lane_collision_series = QScatterSeries()
+        self.lane_collision_series.setName("Collisions")
+        self.lane_collision_series.setMarkerSize(8)
+        self.lane_rear_series = QLineSeries()
+        self.lane_rear_series.setName("First rear car")
+        self.lane_rear_series.setPen(QPen(QColor(Qt.blue), 2))
+        self.lane_front_series = QLineSeries()
+        self.lane_front_series.setName("First front car")
+        self.lane_front_series.setPen(QPen(QColor(Qt.red), 2))
+
+        self.lane_axis_x = QValueAxis()
+        self.lane_axis_x.setTitleText("Time (hours)")
+        self.lane_axis_y = QValueAxis()
+
+        self.lane_chart = QChart()
+        self.lane_chart.setTitle("First Lane Collisions")
+        for series in (
+            self.lane_rear_series,
+            self.lane_front_series,
+            self.lane_collision_series,
+        ):
+            self.lane_chart.addSeries(series)
+        self.lane_chart.addAxis(self.lane_axis_x, Qt.AlignBottom)
+        self.lane_chart.addAxis(self.lane_axis_y, Qt.AlignLeft)
+        for series in self.lane_chart.series():
+            series.attachAxis(self.lane_axis_x)
+            series.attachAxis(self.lane_axis_y)
+
+        self.lane_chart_view = QChartView(self.lane_chart)
+        self.lane_chart_view.setMinimumHeight(250)
+        self.lane_layout.addWidget(self.lane_chart_view)
+
+    def update_lane_chart(self, distance_unit) -> None:
+        """
+        Plot the first LANE_CHART_COLLISIONS collisions of the lane
+
+        Parameters:
+            distance_unit (str): The unit of distance used for the chart.
+        """
+        if self.lane_chart is None:
+            self.init_lane_chart()
+
+        factor = UnitConverter.from_miles(1.0, distance_unit)
+        positions, speeds = self.lane
+        collisions = self.lane_collisions
+        shown = min(len(collisions.time), self.LANE_CHART_COLLISIONS)
+        times = collisions.time[:shown]
+        places = collisions.position[:shown] * factor
+        self.lane_collision_series.replace(
+            [QPointF(t, p) for t, p in zip(times.tolist(), places.tolist())]
+        )
+
+        if shown:
+            end = float(times[-1]) * 1.1 or 1.0
+            first = float(times[0])
+            rear, front = collisions.rear[0], collisions.front[0]
+            self.lane_rear_series.replace(
+                [
+                    QPointF(0, positions[rear] * factor),
+                    QPointF(first, collisions.position[0] * factor),
+                ]
+            )
+            self.lane_front_series.replace(
+                [
+                    QPointF(0, positions[front] * factor),
+                    QPointF(first, collisions.position[0] * factor),
+                ]
+            )
+            low = min(places.min(), positions[rear] * factor)
+            high = places.max()
+        else:
+            end = 1.0
+            self.lane_rear_series.clear()
+            self.lane_front_series.clear()
+            low = float(positions.min()) * factor if len(positions) else 0.0
+            high = low + 1.0
+        self.lane_axis_x.setRange(0, end)
+        self.lane_axis_y.setRange(low, max(high, low + 1e-9))
+        self.lane_axis_y.setTitleText(f"Position ({distance_unit})")
 
     def update_units(self) -> None:
         """
         Update the units of the input fields and result labels
         """
-        logging.debug("update_units called")
+        logger.debug("update_units called")
 
         new_speed_unit = self.speed_unit_combo.currentText()
         new_distance_unit = self.distance_unit_combo.currentText()
 
-        # Convert speeds if the speed unit has changed
-        if new_speed_unit != self.current_speed_unit:
-            self.speed_car_a.setValue(
-                self.convert_speed(
-                    self.speed_car_a.value(), self.current_speed_unit, new_speed_unit
+        # Converting the values must not trigger a recalculation per spin box
+        with self.suppress_recalculation():
+            # Convert speeds if the speed unit has changed
+            if new_speed_unit != self.current_speed_unit:
+                self.speed_car_a.setValue(
+                    self.convert_speed(
+                        self.speed_car_a.value(), self.current_speed_unit, new_speed_unit
+                    )
                 )
-            )
 
-            self.speed_car_b.setValue(
-                self.convert_speed(
-                    self.speed_car_b.value(), self.current_speed_unit, new_speed_unit
+                self.speed_car_b.setValue(
+                    self.convert_speed(
+                        self.speed_car_b.value(), self.current_speed_unit, new_speed_unit
+                    )
                 )
-            )
 
-            self.current_speed_unit = new_speed_unit
+                self.deceleration.setValue(
+                    self.convert_speed(
+                        self.deceleration.value(),
+                        self.current_speed_unit,
+                        new_speed_unit,
+                    )
+                )
 
-        # Convert distance if the distance unit has changed
-        if new_distance_unit != self.current_distance_unit:
-            self.initial_distance.setValue(
-                self.convert_distance(
-                    self.initial_distance.value(),
-                    self.current_distance_unit,
-                    new_distance_unit,
+                self.current_speed_unit = new_speed_unit
+
+            # Convert distance if the distance unit has changed
+            if new_distance_unit != self.current_distance_unit:
+                self.initial_distance.setValue(
+                    self.convert_distance(
+                        self.initial_distance.value(),
+                        self.current_distance_unit,
+                        new_distance_unit,
+                    )
                 )
-            )
 
-            self.current_distance_unit = new_distance_unit
+                self.current_distance_unit = new_distance_unit
 
-        self.calculate()
+        # Same scenario in new units: relabel without solving
+        self.relabel()
+        self.update_lane()
 
     def convert_speed(self, speed, from_unit, to_unit) -> float:
         """
         Convert speed from one unit to another
         """
-        logging.debug("convert_speed called")
-        mph = UnitConverter.to_miles_per_hour(speed, from_unit)
-        return UnitConverter.from_miles_per_hour(mph, to_unit)
+        logger.debug("convert_speed called")
+        return UnitConverter.convert_speed(speed, from_unit, to_unit)
 
     def convert_distance(self, distance, from_unit, to_unit) -> float:
         """
         Convert distance from one unit to another
         """
-        logging.debug("convert_distance called")
-        miles = UnitConverter.to_miles(distance, from_unit)
-        return UnitConverter.from_miles(miles, to_unit)
+        logger.debug("convert_distance called")
+        return UnitConverter.convert_distance(distance, from_unit, to_unit)
 
     def reset_to_default(self) -> None:
         """
         Reset input fields to default values
         """
-        logging.debug("reset_to_default called")
+        logger.debug("reset_to_default called")
 
-        # Reset input fields
-        self.speed_unit_combo.setCurrentIndex(
-            int(self.config["CAR_COLLISION"]["speed_unit"])
-        )
+        # Reset input fields as one edit
+        with self.suppress_recalculation():
+            self.speed_unit_combo.setCurrentIndex(
+                int(self.config["CAR_COLLISION"]["speed_unit"])
+            )
 
-        self.distance_unit_combo.setCurrentIndex(
-            int(self.config["CAR_COLLISION"]["distance_unit"])
-        )
+            self.distance_unit_combo.setCurrentIndex(
+                int(self.config["CAR_COLLISION"]["distance_unit"])
+            )
 
-        self.speed_car_a.setValue(float(self.config["CAR_COLLISION"]["speed_car_a"]))
-        self.speed_car_b.setValue(float(self.config["CAR_COLLISION"]["speed_car_b"]))
+            self.speed_car_a.setValue(float(self.config["CAR_COLLISION"]["speed_car_a"]))
+            self.speed_car_b.setValue(float(self.config["CAR_COLLISION"]["speed_car_b"]))
 
-        self.initial_distance.setValue(
-            float(self.config["CAR_COLLISION"]["initial_distance"])
-        )
+            self.initial_distance.setValue(
+                float(self.config["CAR_COLLISION"]["initial_distance"])
+            )
+            self.min_time_to_collision.setValue(
+                float(self.config["CAR_COLLISION"]["min_time_to_collision"])
+            )
+            self.deceleration.setValue(
+                float(self.config["CAR_COLLISION"]["deceleration"])
+            )
+            self.reaction_time.setValue(
+                float(self.config["CAR_COLLISION"]["reaction_time"])
+            )
 
-        self.calculate()
+        self.schedule_calculate()
 
     def start_simulation(self) -> None:
         """
         Start the car collision simulation
         """
-        logging.debug("start_simulation called")
+        from car_collision_simulation import CarCollisionSimulation
+
+        logger.debug("start_simulation called")
 
         # Get current values
         speed_unit = self.speed_unit_combo.currentText()
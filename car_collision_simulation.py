@@ -1,20 +1,22 @@
 from PySide6.QtWidgets import QVBoxLayout, QLabel, QSlider, QHBoxLayout
-from PySide6.QtCharts import QChart, QChartView, QLineSeries, QValueAxis, QScatterSeries
+from PySide6.QtCharts import QChart, QLineSeries, QValueAxis, QScatterSeries
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QColor, QPen
-from simulation import Simulation
+from car_collision_solver import CarCollisionSolver
+from kinematics import KinematicsEngine
+from simulation import ProfiledChartView, Simulation
+from trajectory_buffer import TrajectoryBuffer
 import logging
 
-# Set up logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - %(filename)s - %(lineno)d - %(message)s",
-)
+logger = logging.getLogger(__name__)
 
 
 class CarCollisionSimulation(Simulation):
     # Log initialization
-    logging.info("CarCollisionSimulation initialized")
+    logger.debug("CarCollisionSimulation initialized")
+
+    # Six simulated minutes per wall minute
+    DEFAULT_WARP = 6.0
 
     def __init__(self, problem, speed_car_a, speed_car_b, initial_distance) -> None:
         """
@@ -41,29 +43,25 @@ class CarCollisionSimulation(Simulation):
         self.setWindowTitle("Car Collision Simulation")
 
         # Chart view
-        self.chart_view = QChartView()
+        self.chart_view = ProfiledChartView()
 
         # Speed control
         speed_layout = QHBoxLayout()
-        speed_label = QLabel("Simulation Speed:")
+        self.speed_label = QLabel()
         self.speed_slider = QSlider(Qt.Horizontal)
 
         # Layout setup
         layout.addWidget(self.chart_view)
-        speed_layout.addWidget(speed_label)
+        speed_layout.addWidget(self.speed_label)
         speed_layout.addWidget(self.speed_slider)
         layout.addLayout(speed_layout)
 
         # Chart initialization
         self.init_chart()
 
-        # Speed slider initialization
-        self.speed_slider.setRange(1, 100)
-        self.speed_slider.setValue(50)
-
         # Timer for animation
         self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_simulation)
+        self.timer.timeout.connect(self.tick)
         self.timer.start(50)
 
     def init_chart(self) -> None:
@@ -80,11 +78,25 @@ class CarCollisionSimulation(Simulation):
         self.car_b_series.setName("Car B")
         self.car_b_series.setPen(QPen(QColor(Qt.red), 2, Qt.DashLine))
 
+        # Paths of both cars, revealed up to the current time
+        if self.kinematics == "rk4":
+            trajectories = KinematicsEngine.car_trajectories
+        else:
+            trajectories = CarCollisionSolver.trajectories
+        self.paths = trajectories(
+            self.speed_car_a, self.speed_car_b, self.initial_distance
+        )
+        self.car_a_buffer = TrajectoryBuffer()
+        self.car_a_buffer.append(self.time, self.paths.car_a.at(self.time))
+        self.car_b_buffer = TrajectoryBuffer()
+        self.car_b_buffer.append(self.time, self.paths.car_b.at(self.time))
+
         # Set up axes
         self.axis_x = QValueAxis()
-        self.axis_x.setTitleText("Time (hours)")
+        self.axis_x.setTitleText("Time (minutes)")
         self.axis_y = QValueAxis()
         self.axis_y.setTitleText(f"Distance (miles)")
+        self.set_time_range(0.01)
 
         # Chart setup
         self.chart = QChart()
@@ -103,35 +115,49 @@ class CarCollisionSimulation(Simulation):
         # Set chart to view
         self.chart_view.setChart(self.chart)
 
+    def set_time_range(self, max_time) -> None:
+        """
+        Sets the visible time window and a distance range that fits both cars in it.
+
+        Parameters:
+            max_time (float): The end of the visible window.
+        """
+        self.axis_x.setRange(0, max_time)
+        self.axis_y.setRange(
+            0,
+            self.initial_distance
+            + (max(self.speed_car_a, self.speed_car_b) / 60) * max_time,
+        )
+
     def update_simulation(self) -> None:
         """
         Update the simulation
         """
         
-        # Speed of simulation setup
-        speed_factor = self.speed_slider.value() / 50.0
-        self.time += 0.005 * speed_factor
-
-        # Update car positions
-        car_a_position = (self.speed_car_a / 60) * self.time
-        car_b_position = ((self.speed_car_b / 60) * self.time) + self.initial_distance
-
-        # Update series
-        self.car_a_series.append(self.time, car_a_position)
-        self.car_b_series.append(self.time, car_b_position)
-
-        # Adjust axes
-        self.axis_x.setRange(0, self.time * 2)
-        self.axis_y.setRange(0, self.initial_distance + car_a_position)
-
-        # Check for collision
-        if car_a_position >= car_b_position:
+        # Follow the real-time clock, never stepping past the collision
+        previous_time = self.time
+        self.time = min(self.clock.advance(), self.paths.event_time)
+
+        # Reveal the precomputed paths up to the current time
+        self.reveal_path(
+            self.car_a_series, self.car_a_buffer, self.paths.car_a, previous_time, self.time
+        )
+        self.reveal_path(
+            self.car_b_series, self.car_b_buffer, self.paths.car_b, previous_time, self.time
+        )
+
+        # Adjust axes only when the data leaves the visible window
+        if self.time > self.axis_x.max():
+            self.set_time_range(self.time * 2)
+
+        # Check for collision, at the exact event time
+        if self.time >= self.paths.event_time:
             self.timer.stop()
             self.car_a_series.setPen(QPen(QColor(Qt.blue), 3))
             self.car_b_series.setPen(QPen(QColor(Qt.red), 3))
             collision_point = QScatterSeries()
             collision_point.setName("Collision")
-            collision_point.append(self.time, car_a_position)
+            collision_point.append(self.paths.event_time, self.paths.event_position)
             collision_point.setMarkerSize(10)
             collision_point.setColor(QColor(Qt.green))
             self.chart.addSeries(collision_point)
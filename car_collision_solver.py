@@ -0,0 +1,168 @@
+from typing import NamedTuple
+from trajectory import Trajectory
+from unit_converter import UnitConverter
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+"""
+Headless car collision math.
+
+Car B drives in the same lane a given gap in front of Car A. The cars only
+collide when Car A is faster, after gap / (speed_a - speed_b) hours.
+
+Units: speeds in miles per hour, distances in miles, times in hours.
+This module must not import PySide6 so it can be used without a display.
+"""
+
+
+class CollisionResult(NamedTuple):
+    """
+    Result of a car collision solve. Fields are floats for a scalar solve
+    and NumPy arrays for a batch solve.
+
+    Attributes:
+        speed_difference: Closing speed of Car A on Car B, in miles per hour.
+        time_to_collision: Time until the cars collide, in hours. inf where
+            the cars never collide, NaN where an input is NaN.
+        will_collide: True where the cars are closing.
+    """
+
+    speed_difference: object
+    time_to_collision: object
+    will_collide: object
+
+
+class CollisionTrajectories(NamedTuple):
+    """
+    Closed-form paths of both cars for the collision animation, with time in
+    minutes from the start.
+
+    Attributes:
+        car_a: Trajectory of Car A, in miles.
+        car_b: Trajectory of Car B, in miles.
+        event_time: Exact time of the collision in minutes, inf if the cars never collide.
+        event_position: Position of the collision in miles, NaN if the cars never collide.
+        will_collide: True if the cars collide.
+    """
+
+    car_a: Trajectory
+    car_b: Trajectory
+    event_time: float
+    event_position: float
+    will_collide: bool
+
+
+class CarCollisionSolver:
+    """
+    Vectorized solver for the car collision problem
+    """
+
+    # Log initialization
+    logger.debug("CarCollisionSolver initialized")
+
+    @staticmethod
+    def solve(
+        speed_car_a,
+        speed_car_b,
+        initial_distance,
+        speed_unit="mph",
+        distance_unit="miles",
+    ) -> CollisionResult:
+        """
+        Solves the time to collision for arrays of car pairs in one call.
+
+        Inputs are broadcast against each other, so any of them may be a scalar.
+
+        Parameters:
+            speed_car_a (array_like): Speed of Car A.
+            speed_car_b (array_like): Speed of Car B.
+            initial_distance (array_like): Gap between the cars.
+            speed_unit (str or array_like): Unit of the speeds, or one unit
+                name or UnitRegistry code per pair.
+            distance_unit (str or array_like): Unit of the gaps, or one unit
+                name or UnitRegistry code per pair.
+
+        Returns:
+            CollisionResult: Arrays of closing speed in mph, time to collision
+            in hours and the collision mask.
+        """
+        speed_car_a = UnitConverter.convert_speed(
+            np.asarray(speed_car_a, dtype=np.float64), speed_unit, "mph"
+        )
+        speed_car_b = UnitConverter.convert_speed(
+            np.asarray(speed_car_b, dtype=np.float64), speed_unit, "mph"
+        )
+        initial_distance = UnitConverter.convert_distance(
+            np.asarray(initial_distance, dtype=np.float64), distance_unit, "miles"
+        )
+
+        speed_difference = speed_car_a - speed_car_b
+        will_collide = speed_difference > 0
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            time_to_collision = np.asarray(initial_distance / speed_difference)
+        np.copyto(time_to_collision, np.inf, where=speed_difference <= 0)
+
+        return CollisionResult(speed_difference, time_to_collision, will_collide)
+
+    @staticmethod
+    def solve_scalar(
+        speed_car_a,
+        speed_car_b,
+        initial_distance,
+        speed_unit="mph",
+        distance_unit="miles",
+    ) -> CollisionResult:
+        """
+        Solves the time to collision for a single pair of cars.
+
+        Runs the same code path as solve() so the GUI and batch results agree.
+
+        Parameters:
+            speed_car_a (float): Speed of Car A.
+            speed_car_b (float): Speed of Car B.
+            initial_distance (float): Gap between the cars.
+            speed_unit (str): Unit of the speeds.
+            distance_unit (str): Unit of the gap.
+
+        Returns:
+            CollisionResult: Python floats and a bool.
+        """
+        result = CarCollisionSolver.solve(
+            speed_car_a, speed_car_b, initial_distance, speed_unit, distance_unit
+        )
+        return CollisionResult(
+            float(result.speed_difference),
+            float(result.time_to_collision),
+            bool(result.will_collide),
+        )
+
+    @staticmethod
+    def trajectories(speed_car_a, speed_car_b, initial_distance) -> CollisionTrajectories:
+        """
+        Builds the exact paths of both cars and the collision event.
+
+        Parameters:
+            speed_car_a (float): Speed of Car A in miles per hour.
+            speed_car_b (float): Speed of Car B in miles per hour.
+            initial_distance (float): Gap between the cars in miles.
+
+        Returns:
+            CollisionTrajectories: The paths and the exact event.
+        """
+        _, time_to_collision, will_collide = CarCollisionSolver.solve_scalar(
+            speed_car_a, speed_car_b, initial_distance
+        )
+        event_time = time_to_collision * 60
+        event_position = (speed_car_a / 60) * event_time if will_collide else np.nan
+
+        # Constant speeds, so two keyframes describe each path for all time
+        end = event_time if will_collide and event_time > 0 else 1.0
+        car_a = Trajectory([0.0, end], [0.0, (speed_car_a / 60) * end])
+        car_b = Trajectory(
+            [0.0, end], [initial_distance, initial_distance + (speed_car_b / 60) * end]
+        )
+
+        return CollisionTrajectories(car_a, car_b, event_time, event_position, will_collide)
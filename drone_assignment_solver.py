@@ -0,0 +1,340 @@
+from typing import NamedTuple
+from drone_intercept_solver import DroneInterceptSolver, InterceptResult
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+"""
+Many enemy drones against a limited set of interceptors.
+
+Every threat is detected at its own range and flies straight at the origin at
+its own speed. Every interceptor launches from the origin after its own
+reaction time at its own speed. Each interceptor can take at most one threat.
+
+The threat x interceptor matrix of intercept times and distances comes from
+one broadcast call of DroneInterceptSolver.solve(). The assignment then
+intercepts as many threats as possible and, among those assignments, the one
+with the best total: the earliest intercepts or the farthest out.
+
+Small or very rectangular problems are solved exactly with the shortest
+augmenting path form of the Hungarian method, vectorized over the longer side.
+Intercept times are close to a Monge matrix (a faster interceptor is better
+against every threat), so each augmenting path search ends up visiting nearly
+every assigned threat, and large square problems go to a vectorized auction
+instead, optimal to within 1e-9 of the cost range.
+
+Units are the solver's: mph, miles, minutes. This module does not import
+PySide6.
+"""
+
+OBJECTIVES = ("intercept_time", "intercept_distance")
+ASSIGNMENT_METHODS = ("auto", "augmenting_path", "auction")
+
+# Shorter side from which "auto" uses the auction on nearly square problems
+AUCTION_MIN_SIZE = 200
+
+
+class AssignmentResult(NamedTuple):
+    """
+    Result of an assignment, one entry per intercepted threat.
+
+    Attributes:
+        threat: Index of each intercepted threat, ascending.
+        interceptor: Index of the interceptor assigned to it.
+        intercept_time: Intercept time of each pair, in minutes.
+        intercept_distance: Intercept distance of each pair, in miles.
+        unassigned: Indices of the threats that are not intercepted.
+    """
+
+    threat: np.ndarray
+    interceptor: np.ndarray
+    intercept_time: np.ndarray
+    intercept_distance: np.ndarray
+    unassigned: np.ndarray
+
+
+class DroneAssignmentSolver:
+    """
+    Optimal assignment of interceptors to threats
+    """
+
+    # Log initialization
+    logger.debug("DroneAssignmentSolver initialized")
+
+    @staticmethod
+    def intercept_matrix(
+        threat_speed, threat_range, interceptor_speed, reaction_time
+    ) -> InterceptResult:
+        """
+        Solves every threat against every interceptor in one vectorized step.
+
+        Parameters:
+            threat_speed (array_like): N threat speeds in miles per hour.
+            threat_range (array_like): N detection ranges in miles.
+            interceptor_speed (array_like): M interceptor speeds in miles per hour.
+            reaction_time (array_like): M reaction times in minutes.
+
+        Returns:
+            InterceptResult: N x M arrays, rows are threats.
+        """
+        threat_speed = np.asarray(threat_speed, dtype=np.float64).reshape(-1, 1)
+        threat_range = np.asarray(threat_range, dtype=np.float64).reshape(-1, 1)
+        interceptor_speed = np.asarray(interceptor_speed, dtype=np.float64).ravel()
+        reaction_time = np.asarray(reaction_time, dtype=np.float64).ravel()
+        return DroneInterceptSolver.solve(
+            threat_speed, threat_range, reaction_time, interceptor_speed
+        )
+
+    @staticmethod
+    def assign(
+        threat_speed,
+        threat_range,
+        interceptor_speed,
+        reaction_time,
+        objective="intercept_time",
+        method="auto",
+    ) -> AssignmentResult:
+        """
+        Assigns interceptors to threats.
+
+        Parameters:
+            threat_speed (array_like): N threat speeds in miles per hour.
+            threat_range (array_like): N detection ranges in miles.
+            interceptor_speed (array_like): M interceptor speeds in miles per hour.
+            reaction_time (array_like): M reaction times in minutes.
+            objective (str): "intercept_time" to minimize the sum of intercept
+                times, "intercept_distance" to maximize the sum of intercept
+                distances.
+            method (str): The assignment method, see min_cost_assignment().
+
+        Returns:
+            AssignmentResult: The intercepted pairs and the unassigned threats.
+
+        Raises:
+            ValueError: If the objective or method is unknown.
+        """
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Invalid objective: {objective}")
+
+        matrix = DroneAssignmentSolver.intercept_matrix(
+            threat_speed, threat_range, interceptor_speed, reaction_time
+        )
+        possible = matrix.intercept_possible
+        threats = possible.shape[0]
+        if not possible.any():
+            empty = np.zeros(0, dtype=np.intp)
+            return AssignmentResult(
+                empty, empty, np.zeros(0), np.zeros(0), np.arange(threats)
+            )
+
+        if objective == "intercept_time":
+            cost = matrix.intercept_time.copy()
+        else:
+            cost = -matrix.intercept_distance
+        cost -= cost[possible].min()
+
+        # Any impossible pair costs more than a whole assignment of possible
+        # ones, so the most threats are intercepted first
+        penalty = (cost[possible].max() + 1) * (min(cost.shape) + 1)
+        cost[~possible] = penalty
+
+        rows, cols = DroneAssignmentSolver.min_cost_assignment(cost, method)
+        keep = possible[rows, cols]
+        rows, cols = rows[keep], cols[keep]
+        unassigned = np.setdiff1d(np.arange(threats), rows)
+        return AssignmentResult(
+            rows,
+            cols,
+            matrix.intercept_time[rows, cols],
+            matrix.intercept_distance[rows, cols],
+            unassigned,
+        )
+
+    @staticmethod
+    def min_cost_assignment(cost, method="auto", tolerance=1e-9):
+        """
+        Solves the rectangular linear assignment problem: every row of the
+        shorter side is matched to a distinct column of the longer side at the
+        least total cost.
+
+        Parameters:
+            cost (array_like): N x M matrix of finite costs.
+            method (str): "augmenting_path" (exact), "auction" (within
+                tolerance * cost range of the optimum) or "auto", which picks
+                the auction for large, nearly square problems.
+            tolerance (float): Allowed excess of the auction's total cost,
+                relative to the cost range.
+
+        Returns:
+            tuple: Row and column index arrays of the matched pairs, sorted by row.
+
+        Raises:
+            ValueError: If a cost is not finite or the method is unknown.
+        """
+        if method not in ASSIGNMENT_METHODS:
+            raise ValueError(f"Invalid method: {method}")
+        cost = np.asarray(cost, dtype=np.float64)
+        if not np.isfinite(cost).all():
+            raise ValueError("Costs must be finite")
+        transposed = cost.shape[0] > cost.shape[1]
+        if transposed:
+            cost = cost.T
+        n, m = cost.shape
+
+        if method == "auto":
+            square = n >= AUCTION_MIN_SIZE and m <= 2 * n
+            method = "auction" if square else "augmenting_path"
+        if n == 0:
+            col_of_row = np.zeros(0, dtype=np.intp)
+        elif method == "auction":
+            col_of_row = DroneAssignmentSolver.auction_assignment(cost, tolerance)
+        else:
+            col_of_row = DroneAssignmentSolver.augmenting_path(cost)
+
+        rows = np.arange(n, dtype=np.intp)
+        if transposed:
+            order = np.argsort(col_of_row)
+            return col_of_row[order], rows[order]
+        return rows, col_of_row
+
+    @staticmethod
+    def augmenting_path(cost) -> np.ndarray:
+        """
+        Solves an N x M assignment, N <= M, exactly. Each row is added by a
+        shortest augmenting path search over reduced costs (Dijkstra with row
+        and column potentials), so the cost is O(N^2 M) in the worst case.
+
+        Parameters:
+            cost (np.ndarray): N x M matrix of finite costs.
+
+        Returns:
+            np.ndarray: The column of each row.
+        """
+        n, m = cost.shape
+        row_potential = np.zeros(n)
+        col_potential = np.zeros(m)
+        row_of_col = np.full(m, -1, dtype=np.intp)
+        col_of_row = np.full(n, -1, dtype=np.intp)
+
+        for start in range(n):
+            # Dijkstra from the new row until a free column is reached
+            shortest = np.full(m, np.inf)
+            path = np.full(m, -1, dtype=np.intp)
+            open_cols = np.ones(m, dtype=bool)
+            visited_rows = []
+            distance = 0.0
+            row = start
+            while True:
+                reduced = distance + cost[row] - row_potential[row] - col_potential
+                better = open_cols & (reduced < shortest)
+                path[better] = row
+                shortest[better] = reduced[better]
+                col = int(np.argmin(np.where(open_cols, shortest, np.inf)))
+                distance = shortest[col]
+                open_cols[col] = False
+                if row_of_col[col] == -1:
+                    break
+                row = row_of_col[col]
+                visited_rows.append(row)
+
+            # Keep the reduced costs non-negative for the next search
+            row_potential[start] += distance
+            if visited_rows:
+                visited = np.array(visited_rows, dtype=np.intp)
+                row_potential[visited] += distance - shortest[col_of_row[visited]]
+            closed = ~open_cols
+            col_potential[closed] -= distance - shortest[closed]
+
+            # Flip the matching along the path
+            while True:
+                row = path[col]
+                row_of_col[col] = row
+                col_of_row[row], col = col, col_of_row[row]
+                if row == start:
+                    break
+
+        return col_of_row
+
+    @staticmethod
+    def auction_assignment(cost, tolerance=1e-9) -> np.ndarray:
+        """
+        Solves an N x M assignment, N <= M, with the auction algorithm.
+
+        Only the columns among some row's N cheapest can be in an optimal
+        matching, so the others are dropped, and dummy rows of zero cost
+        make the rest square.
+
+        Parameters:
+            cost (np.ndarray): N x M matrix of finite costs.
+            tolerance (float): Allowed excess of the total cost, relative to the
+                cost range.
+
+        Returns:
+            np.ndarray: The column of each row.
+        """
+        n, m = cost.shape
+        columns = np.arange(m)
+        if n < m:
+            cheapest = np.argpartition(cost, n - 1, axis=1)[:, :n]
+            columns = np.unique(cheapest)
+        benefit = np.zeros((columns.size, columns.size))
+        benefit[:n] = -cost[:, columns]
+        return columns[DroneAssignmentSolver.auction(benefit, tolerance)[:n]]
+
+    @staticmethod
+    def auction(benefit, tolerance=1e-9, factor=5.0) -> np.ndarray:
+        """
+        Maximizes the total benefit of a square assignment with the auction
+        algorithm. Every unmatched row bids for its best column, raising the
+        price by the gap to its second best plus epsilon; the highest bid on
+        each column wins and pushes out the previous owner. Epsilon starts at
+        a quarter of the benefit range and shrinks by factor each phase.
+
+        Parameters:
+            benefit (np.ndarray): N x N matrix of finite benefits.
+            tolerance (float): Final epsilon times N, relative to the benefit
+                range.
+            factor (float): Epsilon reduction per phase.
+
+        Returns:
+            np.ndarray: The column of each row.
+        """
+        size = benefit.shape[0]
+        if size == 1:
+            return np.zeros(1, dtype=np.intp)
+        spread = max(np.ptp(benefit), 1e-12)
+        final_epsilon = spread * tolerance / size
+        epsilon = max(spread / 4, final_epsilon)
+        prices = np.zeros(size)
+
+        while True:
+            owner = np.full(size, -1, dtype=np.intp)
+            col_of_row = np.full(size, -1, dtype=np.intp)
+            bidders = np.arange(size)
+            while bidders.size:
+                values = benefit[bidders] - prices
+                best = np.argmax(values, axis=1)
+                index = np.arange(bidders.size)
+                best_value = values[index, best]
+                values[index, best] = -np.inf
+                bids = prices[best] + best_value - values.max(axis=1) + epsilon
+
+                # The highest bid on each column, last after sorting
+                order = np.lexsort((bids, best))
+                won = order[np.r_[best[order][1:] != best[order][:-1], True]]
+                won_cols = best[won]
+                outbid = owner[won_cols]
+                outbid = outbid[outbid >= 0]
+                col_of_row[outbid] = -1
+                owner[won_cols] = bidders[won]
+                col_of_row[bidders[won]] = won_cols
+                prices[won_cols] = bids[won]
+
+                lost = np.ones(bidders.size, dtype=bool)
+                lost[won] = False
+                bidders = np.concatenate([bidders[lost], outbid])
+
+            if epsilon <= final_epsilon:
+                return col_of_row
+            epsilon = max(epsilon / factor, final_epsilon)
@@ -6,21 +6,21 @@ from PySide6.QtWidgets import (
     QComboBox,
     QGroupBox,
     QFormLayout,
+    QPushButton,
 )
-from PySide6.QtCharts import QChart, QLineSeries, QValueAxis, QScatterSeries
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QPointF
 from PySide6.QtGui import QColor, QPen
-from typing import List
+from typing import List, NamedTuple
 from unit_converter import UnitConverter
+from drone_intercept_solver import DroneInterceptSolver, InterceptResult
+from planar_intercept_solver import PlanarInterceptSolver, PlanarInterceptResult
+from result_cache import ChartPoints
 from simulation_window import SimulationWindow
-from drone_intercept_simulation import DroneInterceptSimulation
 import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
 
-# Set up logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - %(filename)s - %(lineno)d - %(message)s",
-)
 
 """
 Design Patterns:
@@ -28,15 +28,42 @@ Design Patterns:
 """
 
 
+class InterceptEntry(NamedTuple):
+    """
+    A solved drone scenario in canonical units, as kept in the result cache.
+
+    Attributes:
+        drone_speed: The drone speed in miles per hour.
+        result: The solver result.
+        suggestions: Thresholds from solve_suggestions(), None when the
+            intercept is far enough out.
+        chart: The chart point sets in minutes and miles.
+        planar: The planar solver result for the approach bearing and heading.
+        track: The x/y chart point sets in miles.
+    """
+
+    drone_speed: float
+    result: InterceptResult
+    suggestions: object
+    chart: ChartPoints
+    planar: PlanarInterceptResult
+    track: ChartPoints
+
+
 class DroneInterceptWindow(SimulationWindow):
     # Log initialization
-    logging.info("DroneInterceptWindow initialized")
+    logger.debug("DroneInterceptWindow initialized")
+
+    CHART_MODES = ("Time", "Track (x/y)")
 
-    def __init__(self, config) -> None:
+    # Points of the radar circle in the x/y chart
+    RADAR_CIRCLE_POINTS = 73
+
+    def __init__(self, config, fast_start=False) -> None:
         """
         Initialize the window
         """
-        super().__init__(config)
+        super().__init__(config, fast_start)
         self.config = config
 
     def create_input_group(self, layout) -> None:
@@ -56,31 +83,26 @@ class DroneInterceptWindow(SimulationWindow):
         self.reaction_time = QDoubleSpinBox()
         self.reaction_time.setRange(0.0, 999999.0)
 
+        self.min_intercept_distance = QDoubleSpinBox()
+        self.min_intercept_distance.setRange(0.0, 999999.0)
+
         self.speed_unit_combo = QComboBox()
-        self.speed_unit_combo.addItems(
-            [
-                "mph",
-                "km/h",
-                "m/h",
-                "yd/h",
-                "ft/h",
-                "mpm",
-                "km/min",
-                "m/min",
-                "yd/min",
-                "ft/min",
-                "mps",
-                "km/s",
-                "m/s",
-                "yd/s",
-                "ft/s",
-            ]
-        )
+        self.speed_unit_combo.addItems(UnitConverter.speed_units.units)
 
         self.distance_unit_combo = QComboBox()
-        self.distance_unit_combo.addItems(
-            ["miles", "kilometers", "meters", "yards", "feet"]
-        )
+        self.distance_unit_combo.addItems(UnitConverter.distance_units.units)
+
+        # The x/y chart is created on first use, like the time chart
+        self.chart_mode_combo = QComboBox()
+        self.chart_mode_combo.addItems(self.CHART_MODES)
+        self.track_chart = None
+
+        self.approach_bearing = QDoubleSpinBox()
+        self.approach_bearing.setRange(0.0, 360.0)
+        self.approach_bearing.setWrapping(True)
+
+        self.heading_offset = QDoubleSpinBox()
+        self.heading_offset.setRange(-180.0, 180.0)
 
         # Layout setup
         input_group = QGroupBox("Input Parameters")
@@ -90,6 +112,10 @@ class DroneInterceptWindow(SimulationWindow):
         input_layout.addRow("Radar range:", self.radar_range)
         input_layout.addRow("Distance units:", self.distance_unit_combo)
         input_layout.addRow("Reaction time (min):", self.reaction_time)
+        input_layout.addRow("Intercept at least:", self.min_intercept_distance)
+        input_layout.addRow("Chart:", self.chart_mode_combo)
+        input_layout.addRow("Approach bearing (deg):", self.approach_bearing)
+        input_layout.addRow("Heading off target (deg):", self.heading_offset)
         layout.addWidget(input_group)
 
         # Set default values
@@ -98,12 +124,22 @@ class DroneInterceptWindow(SimulationWindow):
         self.reaction_time.setValue(
             float(self.config["DRONE_INTERCEPT"]["reaction_time"])
         )
+        self.min_intercept_distance.setValue(
+            float(self.config["DRONE_INTERCEPT"]["min_intercept_distance"])
+        )
         self.speed_unit_combo.setCurrentIndex(
             int(self.config["DRONE_INTERCEPT"]["speed_unit"])
         )
         self.distance_unit_combo.setCurrentIndex(
             int(self.config["DRONE_INTERCEPT"]["distance_unit"])
         )
+        self.approach_bearing.setValue(
+            float(self.config["DRONE_INTERCEPT"]["approach_bearing"])
+        )
+        self.heading_offset.setValue(
+            float(self.config["DRONE_INTERCEPT"]["heading_offset"])
+        )
+        self.update_chart_mode_inputs()
 
         # Store the current units
         self.current_speed_unit = self.speed_unit_combo.currentText()
@@ -116,43 +152,77 @@ class DroneInterceptWindow(SimulationWindow):
         self.speed_unit_combo.currentIndexChanged.connect(self.log_speed_unit)
         self.distance_unit_combo.currentIndexChanged.connect(self.log_distance_unit)
 
-        self.drone_speed.valueChanged.connect(self.validate_and_calculate)
-        self.radar_range.valueChanged.connect(self.validate_and_calculate)
-        self.reaction_time.valueChanged.connect(self.validate_and_calculate)
+        self.drone_speed.valueChanged.connect(self.schedule_calculate)
+        self.radar_range.valueChanged.connect(self.schedule_calculate)
+        self.reaction_time.valueChanged.connect(self.schedule_calculate)
+        self.min_intercept_distance.valueChanged.connect(self.schedule_calculate)
+        self.approach_bearing.valueChanged.connect(self.schedule_calculate)
+        self.heading_offset.valueChanged.connect(self.schedule_calculate)
         self.speed_unit_combo.currentIndexChanged.connect(self.update_units)
         self.distance_unit_combo.currentIndexChanged.connect(self.update_units)
+        self.chart_mode_combo.currentIndexChanged.connect(self.update_chart_mode)
+
+    def track_mode(self) -> bool:
+        """
+        Returns True when the x/y chart of the planar intercept is shown.
+        """
+        return self.chart_mode_combo.currentIndex() == 1
+
+    def update_chart_mode_inputs(self) -> None:
+        """
+        Enables the approach inputs, which only the x/y chart uses.
+        """
+        self.approach_bearing.setEnabled(self.track_mode())
+        self.heading_offset.setEnabled(self.track_mode())
+
+    def update_chart_mode(self) -> None:
+        """
+        Shows the current result with the chosen chart, without solving.
+        """
+        logger.debug("update_chart_mode called")
+
+        self.update_chart_mode_inputs()
+        if self.current_entry is not None:
+            self.show_result(self.current_entry)
 
     def log_drone_speed(self) -> None:
         """
         Logs the value of the drone speed when it changes.
         """
-        logging.debug(f"\nDrone speed changed to {self.drone_speed.value()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Drone speed changed to %s", self.drone_speed.value())
 
     def log_radar_range(self) -> None:
         """
         Logs the value of the radar range when it changes.
         """
-        logging.debug(f"\nRadar range changed to {self.radar_range.value()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Radar range changed to %s", self.radar_range.value())
 
     def log_reaction_time(self) -> None:
         """
         Logs the value of the reaction time when it changes.
         """
-        logging.debug(f"\nReaction time changed to {self.reaction_time.value()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Reaction time changed to %s", self.reaction_time.value())
 
     def log_distance_unit(self) -> None:
         """
         Logs the value of the distance unit when it changes.
         """
-        logging.debug(
-            f"\nDistance unit changed to {self.distance_unit_combo.currentText()}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Distance unit changed to %s", self.distance_unit_combo.currentText()
+            )
 
     def log_speed_unit(self) -> None:
         """
         Logs the value of the speed unit when it changes.
         """
-        logging.debug(f"\nSpeed unit changed to {self.speed_unit_combo.currentText()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Speed unit changed to %s", self.speed_unit_combo.currentText()
+            )
 
     def create_problem_group(self, layout) -> None:
         """
@@ -206,11 +276,16 @@ class DroneInterceptWindow(SimulationWindow):
         result_layout.addWidget(self.suggestion_label)
         layout.addWidget(result_group)
 
+        # Sweep button
+        sweep_button = QPushButton("Parameter Sweep")
+        sweep_button.clicked.connect(self.start_sweep)
+        result_layout.addWidget(sweep_button)
+
     def validate_and_calculate(self) -> None:
         """
         Validate the input fields and calculate the intercept distance
         """
-        logging.debug("validate_and_calculate called")
+        logger.debug("validate_and_calculate called")
 
         if not self.validate_input(self.drone_speed.value(), min_value=0):
             QMessageBox.warning(
@@ -229,63 +304,130 @@ class DroneInterceptWindow(SimulationWindow):
             return
         self.calculate()
 
-    def calculate(self) -> None:
+    def scenario(self) -> tuple:
         """
-        Calculate the intercept distance and update the result labels
+        Return the inputs in canonical units: drone speed in mph, radar range
+        in miles, reaction time in minutes, the wanted intercept distance in
+        miles, and the approach bearing and heading offset in degrees
         """
-        logging.debug("calculate called")
-
         speed_unit = self.speed_unit_combo.currentText()
         distance_unit = self.distance_unit_combo.currentText()
+        return (
+            UnitConverter.to_miles_per_hour(self.drone_speed.value(), speed_unit),
+            UnitConverter.to_miles(self.radar_range.value(), distance_unit),
+            self.reaction_time.value(),
+            UnitConverter.to_miles(self.min_intercept_distance.value(), distance_unit),
+            self.approach_bearing.value(),
+            self.heading_offset.value(),
+        )
 
-        # Calculate drone speed in miles per hour
-        drone_speed_mph = UnitConverter.to_miles_per_hour(
-            self.drone_speed.value(), speed_unit
+    def solve_scenario(
+        self,
+        drone_speed_mph,
+        radar_range_miles,
+        reaction_time,
+        min_intercept_distance,
+        approach_bearing=0.0,
+        heading_offset=0.0,
+    ) -> InterceptEntry:
+        """
+        Solve the intercept, the suggestions and the chart points of a scenario
+
+        Parameters:
+            drone_speed_mph (float): The drone speed in miles per hour.
+            radar_range_miles (float): The radar range in miles.
+            reaction_time (float): The reaction time in minutes.
+            min_intercept_distance (float): The wanted intercept distance in miles.
+            approach_bearing (float): Compass bearing of the detection point.
+            heading_offset (float): Degrees the enemy heading is off the origin.
+
+        Returns:
+            InterceptEntry: The solved scenario in canonical units.
+        """
+        logger.debug("solve_scenario called")
+
+        result = DroneInterceptSolver.solve_scalar(
+            drone_speed_mph, radar_range_miles, reaction_time
         )
 
-        # Calculate radar range in miles
-        radar_range_miles = UnitConverter.to_miles(
-            self.radar_range.value(), distance_unit
+        # Suggestions when there is no intercept, or it is closer than wanted
+        suggestions = None
+        if (
+            not result.intercept_possible
+            or result.intercept_distance < min_intercept_distance
+        ):
+            suggestions = self.solve_suggestions(
+                drone_speed_mph,
+                radar_range_miles,
+                reaction_time,
+                min_intercept_distance,
+            )
+
+        chart = self.chart_points(
+            drone_speed_mph / 60, radar_range_miles, reaction_time, result.intercept_time
+        )
+
+        # The same drones in the plane: our drone flies at the enemy's speed
+        threat_x, threat_y, heading = PlanarInterceptSolver.detection_point(
+            radar_range_miles, approach_bearing, heading_offset
+        )
+        planar = PlanarInterceptSolver.solve_scalar(
+            threat_x, threat_y, heading, drone_speed_mph, drone_speed_mph, reaction_time
+        )
+        track = self.track_points(
+            float(threat_x),
+            float(threat_y),
+            float(heading),
+            drone_speed_mph,
+            radar_range_miles,
+            planar,
+        )
+        return InterceptEntry(
+            drone_speed_mph, result, suggestions, chart, planar, track
         )
 
-        # Calculate intercept distance
-        mins_drone_speed = drone_speed_mph / 60
-        self.drone_speed_label.setText(f"Drone speed (mph): {drone_speed_mph:.4f}")
+    def show_result(self, entry) -> None:
+        """
+        Update the result labels, suggestions and chart in the display units
 
-        miles_delay_distance = mins_drone_speed * self.reaction_time.value()
-        delay_distance = UnitConverter.from_miles(miles_delay_distance, distance_unit)
+        Parameters:
+            entry (InterceptEntry): The solved scenario.
+        """
+        logger.debug("show_result called")
+
+        distance_unit = self.distance_unit_combo.currentText()
+        result = entry.result
+
+        self.drone_speed_label.setText(f"Drone speed (mph): {entry.drone_speed:.4f}")
+
+        delay_distance = UnitConverter.from_miles(result.delay_distance, distance_unit)
         self.delay_distance_label.setText(
             f"Bad drone distance during delay ({distance_unit}): {delay_distance:.4f}"
         )
 
-        intercept_distance = (radar_range_miles - miles_delay_distance) / 2
-        intercept_time = (
-            intercept_distance / mins_drone_speed
-        ) + self.reaction_time.value()
-        intercept_possible = miles_delay_distance < radar_range_miles
-
-        if intercept_possible:
+        if self.track_mode():
+            self.show_planar_result(entry.planar, distance_unit)
+        elif result.intercept_possible:
             results = [f"We intercept the drone."]
             results.append(
-                f"Interception distance: {intercept_distance:.2f} miles away"
+                f"Interception distance: {result.intercept_distance:.2f} miles away"
             )
-            results.append(f"Interception time: {intercept_time:.2f} minutes")
+            results.append(f"Interception time: {result.intercept_time:.2f} minutes")
             self.result_label.setText("\n".join(results))
-            self.suggestion_label.setText("")
         else:
-            suggestions = self.generate_suggestions(
-                drone_speed_mph, intercept_distance, distance_unit
-            )
             self.result_label.setText("We can't intercept the drone")
+
+        if entry.suggestions is None:
+            self.suggestion_label.setText("")
+        else:
+            suggestions = self.generate_suggestions(entry.suggestions)
             self.suggestion_label.setText("\n".join(suggestions))
 
         # Update the chart
-        self.update_chart(
-            mins_drone_speed,
-            intercept_time,
-            intercept_possible,
-            distance_unit,
-        )
+        if self.track_mode():
+            self.update_track_chart(entry.track, entry.planar, distance_unit)
+        else:
+            self.update_chart(entry.chart, result.intercept_possible, distance_unit)
 
         # Update the problem statement
         radar_range = str(self.radar_range.value())
@@ -304,222 +446,462 @@ class DroneInterceptWindow(SimulationWindow):
 
         self.problem_label.setText(problem)
 
-    def generate_suggestions(self, drone_speed_mph, intercept_distance, distance_unit) -> List[str]:
+    def solve_suggestions(
+        self, drone_speed_mph, radar_range_miles, reaction_time, min_intercept_distance
+    ) -> dict:
         """
-        Generate suggestions for intercepting the drone
+        Solve for each input the value that puts the intercept at least a
+        given distance out, changing one input at a time
 
         Parameters:
             drone_speed_mph (float): The drone speed in miles per hour.
-            intercept_distance (float): The calculated intercept distance in miles.
-            distance_unit (str): The unit of distance used for the suggestions (e.g., "miles", "km").
+            radar_range_miles (float): The radar range in miles.
+            reaction_time (float): The reaction time in minutes.
+            min_intercept_distance (float): The wanted intercept distance in miles.
+
+        Returns:
+            dict: Threshold of each input in canonical units.
+        """
+        from inverse_solver import InverseSolver
+
+        logger.debug("solve_suggestions called")
+
+        inputs = {
+            "drone_speed": drone_speed_mph,
+            "radar_range": radar_range_miles,
+            "reaction_time": reaction_time,
+        }
+
+        thresholds = {}
+        for solve_for in ("drone_speed", "reaction_time", "radar_range"):
+            others = {
+                name: value for name, value in inputs.items() if name != solve_for
+            }
+            thresholds[solve_for] = InverseSolver.solve_scalar(
+                "drone",
+                "intercept_distance",
+                min_intercept_distance,
+                solve_for,
+                **others,
+            )
+        return thresholds
+
+    def generate_suggestions(self, thresholds) -> List[str]:
+        """
+        Generate suggestions for intercepting the drone at least a given
+        distance out, in the display units
+
+        Parameters:
+            thresholds (dict): Thresholds from solve_suggestions().
 
         Returns:
             list: A list of suggestions for intercepting the drone.
         """
-        logging.debug("generate_suggestions called")
+        logger.debug("generate_suggestions called")
 
-        suggestions = ["Suggestions:"]
+        speed_unit = self.speed_unit_combo.currentText()
+        distance_unit = self.distance_unit_combo.currentText()
 
-        # Decrease drone speed
-        required_drone_speed = (
-            self.radar_range.value() / self.reaction_time.value()
-        ) * 60
-        suggestions.append(
-            f"Decrease drone speed to less than {required_drone_speed:.2f} {self.speed_unit_combo.currentText()}"
-        )
+        suggestions = ["Suggestions:"]
 
-        # Decrease reaction time
-        required_reaction_time = self.radar_range.value() / (drone_speed_mph / 60)
-        suggestions.append(
-            f"Decrease reaction time to less than {required_reaction_time:.2f} minutes"
-        )
+        # Change drone speed
+        result = thresholds["drone_speed"]
+        if result.found:
+            bound = "at least" if result.increasing else "at most"
+            required_drone_speed = UnitConverter.from_miles_per_hour(
+                result.value, speed_unit
+            )
+            suggestions.append(
+                f"Drone speed {bound} {required_drone_speed:.2f} {speed_unit}"
+            )
 
-        # Increase radar range
-        required_radar_range = UnitConverter.from_miles(
-            abs(intercept_distance), distance_unit
-        )
-        suggestions.append(
-            f"Increase radar range to more than {required_radar_range:.2f} {distance_unit}"
-        )
+        # Change reaction time
+        result = thresholds["reaction_time"]
+        if result.found:
+            bound = "at least" if result.increasing else "at most"
+            suggestions.append(f"Reaction time {bound} {result.value:.2f} minutes")
+
+        # Change radar range
+        result = thresholds["radar_range"]
+        if result.found:
+            bound = "at least" if result.increasing else "at most"
+            required_radar_range = UnitConverter.from_miles(result.value, distance_unit)
+            suggestions.append(
+                f"Radar range {bound} {required_radar_range:.2f} {distance_unit}"
+            )
 
         return suggestions
 
-    def update_chart(
-        self,
-        mins_drone_speed,
-        intercept_time,
-        intercept_possible,
-        distance_unit,
-    ) -> None:
+    def init_chart(self) -> None:
         """
-        Update the chart with the new intercept distance
-
-        Parameters:
-            mins_drone_speed (float): The drone speed in miles per minute.
-            intercept_distance (float): The calculated intercept distance in miles.
-            intercept_possible (bool): True if interception is possible, False otherwise.
-            distance_unit (str): The unit of distance used for the chart (e.g., "miles", "km").
+        Create the chart, its series and axes once. update_chart() then only
+        replaces points, pens and axis ranges.
         """
-        logging.debug("update_chart called")
+        from PySide6.QtCharts import QChart, QLineSeries, QValueAxis, QScatterSeries
 
-        chart = QChart()
-        chart.setTitle("Drone Intercept Visualization")
-        max_time = max(
-            self.reaction_time.value() * 2,
-            self.radar_range.value() * 2 / mins_drone_speed,
-        )
+        self.chart = QChart()
+        self.chart.setTitle("Drone Intercept Visualization")
 
         # Series for radar range
-        radar_series = QLineSeries()
-        radar_series.setName("Radar Range")
-        radar_series.append(0, self.radar_range.value())
-        radar_series.append(max_time, self.radar_range.value())
+        self.radar_series = QLineSeries()
+        self.radar_series.setName("Radar Range")
 
         # Series for drone position
-        drone_series = QLineSeries()
-        drone_series.setName("Drone Position")
-        drone_series.append(0, 0)
-        drone_series.append(max_time, max_time * mins_drone_speed)
-        max_distance = max(self.radar_range.value(), mins_drone_speed * max_time)
+        self.drone_series = QLineSeries()
+        self.drone_series.setName("Drone Position")
 
         # Intersect point
-        intersect_series = QLineSeries()
-        intersect_series.setName("Intersect Point")
-        intersect_series.append(intercept_time, self.radar_range.value())
-        intersect_series.append(intercept_time, 0)
+        self.intersect_series = QLineSeries()
+        self.intersect_series.setName("Intersect Point")
 
         # Intercept point
-        intercept_series = QScatterSeries()
-        intercept_series.setName("Intercept Point")
-        intercept_series.append(intercept_time, self.radar_range.value())
+        self.intercept_series = QScatterSeries()
+        self.intercept_series.setName("Intercept Point")
+        self.intercept_series.setMarkerSize(15)
+
+        self.chart.addSeries(self.radar_series)
+        self.chart.addSeries(self.drone_series)
+        self.chart.addSeries(self.intersect_series)
+        self.chart.addSeries(self.intercept_series)
+
+        # Create and configure x-axis
+        self.axis_x = QValueAxis()
+        self.axis_x.setTitleText("Time (minutes)")
+        self.axis_x.setTickCount(10)
+        self.axis_x.setGridLineVisible(True)
+
+        # Create and configure y-axis
+        self.axis_y = QValueAxis()
+        self.axis_y.setTickCount(10)
+        self.axis_y.setGridLineVisible(True)
+
+        # Add axes to the chart
+        self.chart.addAxis(self.axis_x, Qt.AlignBottom)
+        self.chart.addAxis(self.axis_y, Qt.AlignLeft)
+
+        # Attach series to the axes
+        for series in self.chart.series():
+            series.attachAxis(self.axis_x)
+            series.attachAxis(self.axis_y)
+
+        self.set_chart(self.chart)
+
+    @staticmethod
+    def chart_points(
+        mins_drone_speed, radar_range, reaction_time, intercept_time
+    ) -> ChartPoints:
+        """
+        Compute the chart's point sets in minutes and miles
+
+        Parameters:
+            mins_drone_speed (float): The drone speed in miles per minute.
+            radar_range (float): The radar range in miles.
+            reaction_time (float): The reaction time in minutes.
+            intercept_time (float): The calculated intercept time in minutes.
+
+        Returns:
+            ChartPoints: The point sets of each series.
+        """
+        max_time = max(reaction_time * 2, radar_range * 2 / mins_drone_speed)
+        max_distance = max(radar_range, mins_drone_speed * max_time)
+        series = {
+            "radar_series": ((0, max_time), (radar_range, radar_range)),
+            "drone_series": ((0, max_time), (0, max_time * mins_drone_speed)),
+            "intersect_series": ((intercept_time, intercept_time), (radar_range, 0)),
+            "intercept_series": ((intercept_time,), (radar_range,)),
+        }
+        return ChartPoints(series, max_time, max_distance)
+
+    def update_chart(self, chart_points, intercept_possible, distance_unit) -> None:
+        """
+        Update the chart with the new intercept
+
+        Parameters:
+            chart_points (ChartPoints): The point sets in minutes and miles.
+            intercept_possible (bool): True if interception is possible, False otherwise.
+            distance_unit (str): The unit of distance used for the chart (e.g., "miles", "km").
+        """
+        logger.debug("update_chart called")
+
+        if self.chart is None:
+            self.init_chart()
+        self.show_chart(self.chart)
+
+        # Replace the points of each series in one call
+        self.show_chart_points(chart_points, UnitConverter.from_miles(1.0, distance_unit))
 
         # Set colors based on intercept possibility
-        radar_series.setPen(
+        self.radar_series.setPen(
             QPen(QColor(Qt.cyan) if intercept_possible else QColor(Qt.magenta))
         )
-        drone_series.setPen(
+        self.drone_series.setPen(
             QPen(QColor(Qt.blue) if intercept_possible else QColor(Qt.red))
         )
-        intersect_series.setPen(QPen(QColor(Qt.darkGreen), 2, Qt.DashLine))
-        intercept_series.setPen(QPen(QColor(Qt.darkGreen), 2, Qt.DashLine))
         if intercept_possible:
-            intersect_series.setPen(QPen(QColor(Qt.green), 3))
-            intercept_series.setPen(QPen(QColor(Qt.green), 3))
-            intercept_series.setMarkerSize(15)
+            self.intersect_series.setPen(QPen(QColor(Qt.green), 3))
+            self.intercept_series.setPen(QPen(QColor(Qt.green), 3))
+        else:
+            self.intersect_series.setPen(QPen(QColor(Qt.darkGreen), 2, Qt.DashLine))
+            self.intercept_series.setPen(QPen(QColor(Qt.darkGreen), 2, Qt.DashLine))
 
-        chart.addSeries(radar_series)
-        chart.addSeries(drone_series)
-        chart.addSeries(intersect_series)
-        chart.addSeries(intercept_series)
+        # Update the axis title
+        self.axis_y.setTitleText(f"Distance ({distance_unit})")
 
-        # Create and configure x-axis
-        axis_x = QValueAxis()
-        axis_x.setTitleText("Time (minutes)")
-        axis_x.setRange(0, max_time)
-        axis_x.setTickCount(10)
-        axis_x.setGridLineVisible(True)
+    def show_planar_result(self, planar, distance_unit) -> None:
+        """
+        Update the result label with the planar intercept
 
-        # Create and configure y-axis
-        axis_y = QValueAxis()
-        axis_y.setTitleText(f"Distance ({distance_unit})")
-        axis_y.setRange(0, max_distance)
-        axis_y.setTickCount(10)
-        axis_y.setGridLineVisible(True)
+        Parameters:
+            planar (PlanarInterceptResult): The planar solver result.
+            distance_unit (str): The unit of distance to show.
+        """
+        if not planar.intercept_possible:
+            self.result_label.setText("We can't intercept the drone")
+            return
+        factor = UnitConverter.from_miles(1.0, distance_unit)
+        self.result_label.setText(
+            "\n".join(
+                [
+                    "We intercept the drone.",
+                    f"Interception distance: "
+                    f"{planar.intercept_distance * factor:.2f} {distance_unit} away",
+                    f"Interception point: ({planar.intercept_x * factor:.2f}, "
+                    f"{planar.intercept_y * factor:.2f}) {distance_unit} east, north",
+                    f"Our heading: {planar.interceptor_heading:.1f} deg",
+                    f"Interception time: {planar.intercept_time:.2f} minutes",
+                ]
+            )
+        )
 
-        # Add axes to the chart
-        chart.addAxis(axis_x, Qt.AlignBottom)
-        chart.addAxis(axis_y, Qt.AlignLeft)
+    def init_track_chart(self) -> None:
+        """
+        Create the x/y chart: the radar circle, both tracks and the intercept
+        point
+        """
+        from PySide6.QtCharts import QChart, QLineSeries, QValueAxis, QScatterSeries
 
-        # Attach series to the axes
-        radar_series.attachAxis(axis_x)
-        radar_series.attachAxis(axis_y)
-        drone_series.attachAxis(axis_x)
-        drone_series.attachAxis(axis_y)
-        intersect_series.attachAxis(axis_x)
-        intersect_series.attachAxis(axis_y)
-        intercept_series.attachAxis(axis_x)
-        intercept_series.attachAxis(axis_y)
+        self.track_chart = QChart()
+        self.track_chart.setTitle("Drone Intercept Tracks")
 
-        self.chart_view.setChart(chart)
+        self.track_radar_series = QLineSeries()
+        self.track_radar_series.setName("Radar Range")
+        self.track_radar_series.setPen(QPen(QColor(Qt.cyan), 1, Qt.DashLine))
+
+        self.track_enemy_series = QLineSeries()
+        self.track_enemy_series.setName("Enemy Drone")
+        self.track_enemy_series.setPen(QPen(QColor(Qt.red), 2))
+
+        self.track_our_series = QLineSeries()
+        self.track_our_series.setName("Our Drone")
+        self.track_our_series.setPen(QPen(QColor(Qt.blue), 2))
+
+        self.track_intercept_series = QScatterSeries()
+        self.track_intercept_series.setName("Intercept Point")
+        self.track_intercept_series.setMarkerSize(15)
+        self.track_intercept_series.setColor(QColor(Qt.green))
+
+        self.track_axis_x = QValueAxis()
+        self.track_axis_x.setTickCount(9)
+        self.track_axis_y = QValueAxis()
+        self.track_axis_y.setTickCount(9)
+
+        for series in (
+            self.track_radar_series,
+            self.track_enemy_series,
+            self.track_our_series,
+            self.track_intercept_series,
+        ):
+            self.track_chart.addSeries(series)
+        self.track_chart.addAxis(self.track_axis_x, Qt.AlignBottom)
+        self.track_chart.addAxis(self.track_axis_y, Qt.AlignLeft)
+        for series in self.track_chart.series():
+            series.attachAxis(self.track_axis_x)
+            series.attachAxis(self.track_axis_y)
+
+    @staticmethod
+    def track_points(
+        threat_x, threat_y, heading, drone_speed, radar_range, planar
+    ) -> ChartPoints:
+        """
+        Compute the x/y chart's point sets in miles
+
+        Parameters:
+            threat_x (float): East position of the detection in miles.
+            threat_y (float): North position of the detection in miles.
+            heading (float): Compass heading of the enemy drone.
+            drone_speed (float): The drone speed in miles per hour.
+            radar_range (float): The radar range in miles.
+            planar (PlanarInterceptResult): The planar solver result.
+
+        Returns:
+            ChartPoints: The point sets of each series; x_max and y_max are
+            the half width of the square view.
+        """
+        angles = np.linspace(0, 2 * np.pi, DroneInterceptWindow.RADAR_CIRCLE_POINTS)
+        radar = (
+            tuple(radar_range * np.sin(angles)),
+            tuple(radar_range * np.cos(angles)),
+        )
+
+        if planar.intercept_possible:
+            end_time = planar.intercept_time
+            ours = ((0.0, planar.intercept_x), (0.0, planar.intercept_y))
+            intercept = ((planar.intercept_x,), (planar.intercept_y,))
+        else:
+            # Show the enemy track across the whole radar circle
+            end_time = 2 * radar_range / (drone_speed / 60)
+            ours = ((), ())
+            intercept = ((), ())
+        velocity_x, velocity_y = PlanarInterceptSolver.velocity(drone_speed, heading)
+        enemy = (
+            (threat_x, threat_x + float(velocity_x) * end_time),
+            (threat_y, threat_y + float(velocity_y) * end_time),
+        )
+
+        extent = 1.1 * max(radar_range, *map(abs, enemy[0] + enemy[1]))
+        series = {
+            "track_radar_series": radar,
+            "track_enemy_series": enemy,
+            "track_our_series": ours,
+            "track_intercept_series": intercept,
+        }
+        return ChartPoints(series, extent, extent)
+
+    def update_track_chart(self, track_points, planar, distance_unit) -> None:
+        """
+        Show the x/y chart of the planar intercept
+
+        Parameters:
+            track_points (ChartPoints): The point sets in miles.
+            planar (PlanarInterceptResult): The planar solver result.
+            distance_unit (str): The unit of distance used for the chart.
+        """
+        logger.debug("update_track_chart called")
+
+        if self.track_chart is None:
+            self.init_track_chart()
+        self.show_chart(self.track_chart)
+
+        factor = UnitConverter.from_miles(1.0, distance_unit)
+        for name, (x, y) in track_points.series.items():
+            getattr(self, name).replace(
+                [QPointF(a * factor, b * factor) for a, b in zip(x, y)]
+            )
+        extent = track_points.x_max * factor
+        self.track_axis_x.setRange(-extent, extent)
+        self.track_axis_y.setRange(-extent, extent)
+        self.track_axis_x.setTitleText(f"East ({distance_unit})")
+        self.track_axis_y.setTitleText(f"North ({distance_unit})")
+        self.track_our_series.setVisible(bool(planar.intercept_possible))
+
+    def show_chart(self, chart) -> None:
+        """
+        Show one of the two charts in the chart view, if it is not shown yet
+
+        Parameters:
+            chart (QChart): The time or x/y chart.
+        """
+        if self.chart_view is None or self.chart_view.chart() is not chart:
+            self.set_chart(chart)
 
     def update_units(self) -> None:
         """
         Update the units of the input fields and result labels
         """
-        logging.debug("update_units called")
+        logger.debug("update_units called")
 
         new_speed_unit = self.speed_unit_combo.currentText()
         new_distance_unit = self.distance_unit_combo.currentText()
 
-        # Convert speeds if the speed unit has changed
-        if new_speed_unit != self.current_speed_unit:
-            self.drone_speed.setValue(
-                self.convert_speed(
-                    self.drone_speed.value(), self.current_speed_unit, new_speed_unit
+        # Converting the values must not trigger a recalculation per spin box
+        with self.suppress_recalculation():
+            # Convert speeds if the speed unit has changed
+            if new_speed_unit != self.current_speed_unit:
+                self.drone_speed.setValue(
+                    self.convert_speed(
+                        self.drone_speed.value(), self.current_speed_unit, new_speed_unit
+                    )
                 )
-            )
 
-            self.current_speed_unit = new_speed_unit
+                self.current_speed_unit = new_speed_unit
 
-        # Convert distance if the distance unit has changed
-        if new_distance_unit != self.current_distance_unit:
-            self.radar_range.setValue(
-                self.convert_distance(
-                    self.radar_range.value(),
-                    self.current_distance_unit,
-                    new_distance_unit,
+            # Convert distance if the distance unit has changed
+            if new_distance_unit != self.current_distance_unit:
+                self.radar_range.setValue(
+                    self.convert_distance(
+                        self.radar_range.value(),
+                        self.current_distance_unit,
+                        new_distance_unit,
+                    )
+                )
+                self.min_intercept_distance.setValue(
+                    self.convert_distance(
+                        self.min_intercept_distance.value(),
+                        self.current_distance_unit,
+                        new_distance_unit,
+                    )
                 )
-            )
 
-            self.current_distance_unit = new_distance_unit
+                self.current_distance_unit = new_distance_unit
 
-        self.calculate()
+        # Same scenario in new units: relabel without solving
+        self.relabel()
 
     def convert_speed(self, speed, from_unit, to_unit) -> float:
         """
         Convert speed from one unit to another
         """
-        logging.debug("convert_speed called")
-        mph = UnitConverter.to_miles_per_hour(speed, from_unit)
-        return UnitConverter.from_miles_per_hour(mph, to_unit)
+        logger.debug("convert_speed called")
+        return UnitConverter.convert_speed(speed, from_unit, to_unit)
 
     def convert_distance(self, distance, from_unit, to_unit) -> float:
         """
         Convert distance from one unit to another
         """
-        logging.debug("convert_distance called")
-        miles = UnitConverter.to_miles(distance, from_unit)
-        return UnitConverter.from_miles(miles, to_unit)
+        logger.debug("convert_distance called")
+        return UnitConverter.convert_distance(distance, from_unit, to_unit)
 
     def reset_to_default(self) -> None:
         """
         Reset input fields to default values
         """
-        logging.debug("reset_to_default called")
+        logger.debug("reset_to_default called")
 
-        # Reset input fields
-        self.speed_unit_combo.setCurrentIndex(
-            int(self.config["DRONE_INTERCEPT"]["speed_unit"])
-        )
+        # Reset input fields as one edit
+        with self.suppress_recalculation():
+            self.speed_unit_combo.setCurrentIndex(
+                int(self.config["DRONE_INTERCEPT"]["speed_unit"])
+            )
 
-        self.distance_unit_combo.setCurrentIndex(
-            int(self.config["DRONE_INTERCEPT"]["distance_unit"])
-        )
+            self.distance_unit_combo.setCurrentIndex(
+                int(self.config["DRONE_INTERCEPT"]["distance_unit"])
+            )
 
-        self.drone_speed.setValue(float(self.config["DRONE_INTERCEPT"]["drone_speed"]))
-        self.radar_range.setValue(float(self.config["DRONE_INTERCEPT"]["radar_range"]))
+            self.drone_speed.setValue(float(self.config["DRONE_INTERCEPT"]["drone_speed"]))
+            self.radar_range.setValue(float(self.config["DRONE_INTERCEPT"]["radar_range"]))
 
-        self.reaction_time.setValue(
-            float(self.config["DRONE_INTERCEPT"]["reaction_time"])
-        )
+            self.reaction_time.setValue(
+                float(self.config["DRONE_INTERCEPT"]["reaction_time"])
+            )
+            self.min_intercept_distance.setValue(
+                float(self.config["DRONE_INTERCEPT"]["min_intercept_distance"])
+            )
+            self.approach_bearing.setValue(
+                float(self.config["DRONE_INTERCEPT"]["approach_bearing"])
+            )
+            self.heading_offset.setValue(
+                float(self.config["DRONE_INTERCEPT"]["heading_offset"])
+            )
 
-        self.calculate()
+        self.schedule_calculate()
 
     def start_simulation(self) -> None:
         """
         Start the drone intercept simulation
         """
-        logging.debug("start_simulation called")
+        from drone_intercept_simulation import DroneInterceptSimulation
+
+        logger.debug("start_simulation called")
 
         # Get current values
         speed_unit = self.speed_unit_combo.currentText()
@@ -536,3 +918,25 @@ class DroneInterceptWindow(SimulationWindow):
             "drone", drone_speed_mph, radar_range_miles, self.reaction_time.value()
         )
         self.sim_window.show()
+
+    def start_sweep(self) -> None:
+        """
+        Open a feasibility heatmap over two inputs, around the current scenario
+        """
+        from drone_sweep import DroneSweepWindow
+
+        logger.debug("start_sweep called")
+
+        speed_unit = self.speed_unit_combo.currentText()
+        distance_unit = self.distance_unit_combo.currentText()
+        drone_speed_mph = UnitConverter.to_miles_per_hour(
+            self.drone_speed.value(), speed_unit
+        )
+        radar_range_miles = UnitConverter.to_miles(
+            self.radar_range.value(), distance_unit
+        )
+
+        self.sweep_window = DroneSweepWindow(
+            drone_speed_mph, radar_range_miles, self.reaction_time.value()
+        )
+        self.sweep_window.show()
@@ -1,20 +1,19 @@
 from PySide6.QtWidgets import QVBoxLayout, QLabel, QSlider, QHBoxLayout
-from PySide6.QtCharts import QChart, QChartView, QLineSeries, QValueAxis, QScatterSeries
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCharts import QChart, QLineSeries, QValueAxis, QScatterSeries
+from PySide6.QtCore import Qt, QTimer, QPointF
 from PySide6.QtGui import QColor, QPen
-from simulation import Simulation
+from drone_intercept_solver import DroneInterceptSolver
+from kinematics import KinematicsEngine
+from simulation import ProfiledChartView, Simulation
+from trajectory_buffer import TrajectoryBuffer
 import logging
 
-# Set up logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - %(filename)s - %(lineno)d - %(message)s",
-)
+logger = logging.getLogger(__name__)
 
 
 class DroneInterceptSimulation(Simulation):
     # Log initialization
-    logging.info("DroneInterceptSimulation initialized")
+    logger.debug("DroneInterceptSimulation initialized")
 
     def __init__(self, problem, drone_speed, radar_range, reaction_time) -> None:
         """
@@ -42,29 +41,25 @@ class DroneInterceptSimulation(Simulation):
         self.setWindowTitle("Drone Intercept Simulation")
 
         # Chart view
-        self.chart_view = QChartView()
+        self.chart_view = ProfiledChartView()
 
         # Speed control
         speed_layout = QHBoxLayout()
-        speed_label = QLabel("Simulation Speed:")
+        self.speed_label = QLabel()
         self.speed_slider = QSlider(Qt.Horizontal)
 
         # Layout setup
         layout.addWidget(self.chart_view)
-        speed_layout.addWidget(speed_label)
+        speed_layout.addWidget(self.speed_label)
         speed_layout.addWidget(self.speed_slider)
         layout.addLayout(speed_layout)
 
         # Chart initialization
         self.init_chart()
 
-        # Speed slider initialization
-        self.speed_slider.setRange(1, 100)
-        self.speed_slider.setValue(50)
-
         # Timer for animation
         self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_simulation)
+        self.timer.timeout.connect(self.tick)
         self.timer.start(50)
 
     def init_chart(self) -> None:
@@ -85,14 +80,29 @@ class DroneInterceptSimulation(Simulation):
         self.radar_range_series = QLineSeries()
         self.radar_range_series.setName("Radar Range")
         self.radar_range_series.setPen(QPen(QColor(Qt.darkGreen), 2, Qt.DashLine))
-        self.radar_range_series.append(-self.reaction_time, self.radar_range)
-        self.radar_range_series.append(self.time + self.reaction_time * 2, self.radar_range)
 
-        # Set up axes
+        # Paths of both drones, revealed up to the current time
+        if self.kinematics == "rk4":
+            trajectories = KinematicsEngine.drone_trajectories
+        else:
+            trajectories = DroneInterceptSolver.trajectories
+        self.paths = trajectories(
+            self.drone_speed, self.radar_range, self.reaction_time
+        )
+        self.enemy_drone_buffer = TrajectoryBuffer()
+        self.enemy_drone_buffer.append(self.time, self.paths.enemy.at(self.time))
+        self.our_drone_buffer = TrajectoryBuffer()
+        self.our_drone_buffer.append(self.time, self.paths.ours.at(self.time))
+        self.detected = False
+        self.launched = False
+
+        # Set up axes, the y range covers the whole run
         self.axis_x = QValueAxis()
         self.axis_x.setTitleText("Time (minutes)")
         self.axis_y = QValueAxis()
         self.axis_y.setTitleText("Distance (miles)")
+        self.axis_y.setRange(-self.radar_range, self.starting_y)
+        self.set_time_range(self.time + max(self.reaction_time * 2, 1))
 
         # Chart setup
         self.chart = QChart()
@@ -114,70 +124,74 @@ class DroneInterceptSimulation(Simulation):
         # Set chart to view
         self.chart_view.setChart(self.chart)
 
+    def set_time_range(self, max_time) -> None:
+        """
+        Sets the visible time window and stretches the radar range line across it.
+
+        Parameters:
+            max_time (float): The end of the visible window, in minutes.
+        """
+        self.axis_x.setRange(-self.reaction_time, max_time)
+        self.radar_range_series.replace(
+            [
+                QPointF(-self.reaction_time, self.radar_range),
+                QPointF(max_time, self.radar_range),
+            ]
+        )
+
     def update_simulation(self) -> None:
         """
         Update the simulation
         """
         
-        # Speed of simulation setup
-        speed_factor = self.speed_slider.value() / 50.0
-        self.time += 0.05 * speed_factor
-
-        # Update drone positions
-        if self.time > 0:
-            enemy_drone_position = self.radar_range - (
-                (self.drone_speed / 60) * self.time
-            )
-
-            our_drone_position = max(
-                0, (self.drone_speed / 60) * (self.time - self.reaction_time)
-            )
-        else:
-            enemy_drone_position = self.radar_range + (
-                (self.drone_speed / 60) * abs(self.time)
-            )
-            our_drone_position = 0
-
-        # Update series
-        self.enemy_drone_series.append(self.time, enemy_drone_position)
-        self.our_drone_series.append(self.time, our_drone_position)
-        self.radar_range_series.append(self.time + self.reaction_time * 2, self.radar_range)
-
-        # Adjust axes
-        self.axis_x.setRange(-self.reaction_time, self.time + self.reaction_time * 2)
-        self.axis_y.setRange(-self.radar_range, self.starting_y)
-
+        # Follow the real-time clock, never stepping past the event
+        previous_time = self.time
+        self.time = min(self.clock.advance(), self.paths.event_time)
+
+        # Reveal the precomputed paths up to the current time
+        self.reveal_path(
+            self.enemy_drone_series,
+            self.enemy_drone_buffer,
+            self.paths.enemy,
+            previous_time,
+            self.time,
+        )
+        self.reveal_path(
+            self.our_drone_series,
+            self.our_drone_buffer,
+            self.paths.ours,
+            previous_time,
+            self.time,
+        )
+
+        # Adjust axes only when the data leaves the visible window
+        if self.time > self.axis_x.max():
+            self.set_time_range(self.time + (self.time - self.axis_x.min()))
 
         # Check for detection
-        if enemy_drone_position <= self.radar_range:
+        if not self.detected and self.time >= 0:
+            self.detected = True
             self.radar_range_series.setPen(QPen(QColor(Qt.green), 3))
             self.enemy_drone_series.setPen(QPen(QColor(Qt.magenta), 3))
 
         # Check for our drone launch
-        if our_drone_position > 0:
+        if not self.launched and self.time > self.reaction_time:
+            self.launched = True
             self.our_drone_series.setPen(QPen(QColor(Qt.blue), 3))
 
-        # Check for interception
-        if our_drone_position >= enemy_drone_position:
-            if our_drone_position > 0:
-                self.timer.stop()
-                intercept_point = QScatterSeries()
+        # Check for interception, at the exact event time
+        if self.time >= self.paths.event_time:
+            self.timer.stop()
+            intercept_point = QScatterSeries()
+            intercept_point.append(self.paths.event_time, self.paths.event_position)
+            intercept_point.setMarkerSize(10)
+            if self.paths.intercepted:
                 intercept_point.setName("Intercept")
-                intercept_point.append(self.time, enemy_drone_position)
-                intercept_point.setMarkerSize(10)
                 intercept_point.setColor(QColor(Qt.green))
-
-                self.chart.addSeries(intercept_point)
-                intercept_point.attachAxis(self.axis_x)
-                intercept_point.attachAxis(self.axis_y)
             else:
-                self.timer.stop()
-                intercept_point = QScatterSeries()
                 intercept_point.setName("Not intercepted")
-                intercept_point.append(self.time, enemy_drone_position)
-                intercept_point.setMarkerSize(10)
                 intercept_point.setColor(QColor(Qt.red))
 
-                self.chart.addSeries(intercept_point)
-                intercept_point.attachAxis(self.axis_x)
-                intercept_point.attachAxis(self.axis_y)
+            self.chart.addSeries(intercept_point)
+            intercept_point.attachAxis(self.axis_x)
+            intercept_point.attachAxis(self.axis_y)
@@ -0,0 +1,180 @@
+from typing import NamedTuple
+from trajectory import Trajectory
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+"""
+Headless drone intercept math.
+
+The enemy drone is detected at the radar range, our drone launches after
+the reaction time and the two close head-on. By default both drones travel
+at the same speed, so they meet halfway across whatever gap is left after
+the delay; with a separate interceptor speed the gap splits in proportion
+to the two speeds.
+
+Units: speeds in miles per hour, distances in miles, times in minutes.
+This module must not import PySide6 so it can be used without a display.
+"""
+
+
+class InterceptResult(NamedTuple):
+    """
+    Result of a drone intercept solve. Fields are floats for a scalar solve
+    and NumPy arrays for a batch solve.
+
+    Attributes:
+        delay_distance: Distance the enemy drone covers during the reaction time, in miles.
+        intercept_distance: Distance from the origin of the intercept, in miles.
+        intercept_time: Time of the intercept after detection, in minutes.
+        intercept_possible: True where our drone launches before the enemy drone arrives.
+    """
+
+    delay_distance: object
+    intercept_distance: object
+    intercept_time: object
+    intercept_possible: object
+
+
+class InterceptTrajectories(NamedTuple):
+    """
+    Closed-form paths of both drones for the intercept animation. Time 0 is
+    detection and the paths start at -reaction_time.
+
+    Attributes:
+        enemy: Trajectory of the enemy drone, distance from the origin in miles.
+        ours: Trajectory of our drone, distance from the origin in miles.
+        event_time: Exact time of the intercept, or of the enemy drone
+            reaching the origin, in minutes.
+        event_position: Position of the event, in miles.
+        intercepted: True if our drone intercepts the enemy drone.
+    """
+
+    enemy: Trajectory
+    ours: Trajectory
+    event_time: float
+    event_position: float
+    intercepted: bool
+
+
+class DroneInterceptSolver:
+    """
+    Vectorized solver for the drone intercept problem
+    """
+
+    # Log initialization
+    logger.debug("DroneInterceptSolver initialized")
+
+    @staticmethod
+    def solve(
+        drone_speed, radar_range, reaction_time, interceptor_speed=None
+    ) -> InterceptResult:
+        """
+        Solves the intercept problem for arrays of scenarios in one call.
+
+        Inputs are broadcast against each other, so any of them may be a scalar.
+
+        Parameters:
+            drone_speed (array_like): Speed of the enemy drone in miles per hour.
+            radar_range (array_like): Radar detection range in miles.
+            reaction_time (array_like): Time to react and launch, in minutes.
+            interceptor_speed (array_like): Speed of our drone in miles per
+                hour. Defaults to drone_speed, the head-on equal speed case.
+                Speeds of 0 or less never intercept, with an infinite time.
+
+        Returns:
+            InterceptResult: Arrays of delay distance, intercept distance,
+            intercept time and the feasibility mask.
+        """
+        drone_speed = np.asarray(drone_speed, dtype=np.float64)
+        radar_range = np.asarray(radar_range, dtype=np.float64)
+        reaction_time = np.asarray(reaction_time, dtype=np.float64)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mins_drone_speed = drone_speed / 60
+            delay_distance = mins_drone_speed * reaction_time
+            if interceptor_speed is None:
+                intercept_distance = (radar_range - delay_distance) / 2
+                intercept_time = intercept_distance / mins_drone_speed + reaction_time
+            else:
+                # The gap left after the delay closes at the sum of both speeds
+                interceptor_speed = np.asarray(interceptor_speed, dtype=np.float64)
+                share = interceptor_speed / (drone_speed + interceptor_speed)
+                intercept_distance = (radar_range - delay_distance) * share
+                intercept_time = (
+                    intercept_distance / (interceptor_speed / 60) + reaction_time
+                )
+        intercept_possible = delay_distance < radar_range
+        if interceptor_speed is not None:
+            # An interceptor that can't fly never reaches the enemy drone
+            grounded = interceptor_speed <= 0
+            intercept_possible = intercept_possible & ~grounded
+            intercept_time = np.where(grounded, np.inf, intercept_time)
+
+        return InterceptResult(
+            delay_distance, intercept_distance, intercept_time, intercept_possible
+        )
+
+    @staticmethod
+    def solve_scalar(drone_speed, radar_range, reaction_time) -> InterceptResult:
+        """
+        Solves the intercept problem for a single scenario.
+
+        Runs the same code path as solve() so the GUI and batch results agree.
+
+        Parameters:
+            drone_speed (float): Speed of both drones in miles per hour.
+            radar_range (float): Radar detection range in miles.
+            reaction_time (float): Time to react and launch, in minutes.
+
+        Returns:
+            InterceptResult: Python floats and a bool.
+        """
+        result = DroneInterceptSolver.solve(drone_speed, radar_range, reaction_time)
+        return InterceptResult(
+            float(result.delay_distance),
+            float(result.intercept_distance),
+            float(result.intercept_time),
+            bool(result.intercept_possible),
+        )
+
+    @staticmethod
+    def trajectories(drone_speed, radar_range, reaction_time) -> InterceptTrajectories:
+        """
+        Builds the exact paths of both drones up to the intercept, or up to
+        the enemy drone reaching the origin if it can't be intercepted.
+
+        Parameters:
+            drone_speed (float): Speed of both drones in miles per hour.
+            radar_range (float): Radar detection range in miles.
+            reaction_time (float): Time to react and launch, in minutes.
+
+        Returns:
+            InterceptTrajectories: The paths and the exact event.
+        """
+        result = DroneInterceptSolver.solve_scalar(drone_speed, radar_range, reaction_time)
+        mins_drone_speed = drone_speed / 60
+
+        if result.intercept_possible:
+            event_time = result.intercept_time
+            event_position = result.intercept_distance
+        else:
+            event_time = radar_range / mins_drone_speed
+            event_position = 0.0
+
+        start = -reaction_time
+        enemy = Trajectory(
+            [start, event_time],
+            [radar_range - mins_drone_speed * start, event_position],
+        )
+        if 0 < reaction_time < event_time:
+            ours = Trajectory(
+                [start, reaction_time, event_time], [0.0, 0.0, event_position]
+            )
+        else:
+            ours = Trajectory([start, event_time], [0.0, event_position])
+
+        return InterceptTrajectories(
+            enemy, ours, event_time, event_position, result.intercept_possible
+        )
@@ -0,0 +1,417 @@
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QFormLayout,
+    QComboBox,
+    QDoubleSpinBox,
+    QSpinBox,
+    QPushButton,
+    QLabel,
+)
+from PySide6.QtCore import Qt, QTimer, QRectF
+from PySide6.QtGui import QImage, QPainter, QColor
+from sweep import DRONE_SWEEP_PARAMETERS, SweepResult, heatmap_rgb, sweep_drone_grid
+import logging
+import numpy as np
+import time
+
+logger = logging.getLogger(__name__)
+
+
+"""
+Design Patterns:
+    Iterator: The coarse-to-fine levels come from a generator, one level per
+    event loop pass, so the view repaints between levels.
+
+Grids larger than PARALLEL_CELLS solve their finest level on a SweepExecutor
+process pool, polled from a timer so the window stays responsive and the
+sweep can be cancelled.
+"""
+
+
+class HeatmapView(QWidget):
+    """
+    Draws a sweep level as an image stretched over the swept ranges, with
+    the range limits as axis labels.
+    """
+
+    # Space around the image for the axis labels, in pixels
+    MARGIN = 48
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.image = None
+        self.x_label = ""
+        self.y_label = ""
+        self.x_range = (0.0, 1.0)
+        self.y_range = (0.0, 1.0)
+        self.setMinimumSize(400, 400)
+
+    def set_level(self, rgb, x_range, y_range, x_label, y_label) -> None:
+        """
+        Shows a coloured sweep level.
+
+        Parameters:
+            rgb (np.ndarray): uint8 (rows, columns, 3) colours, lowest y first.
+            x_range (tuple): The first and last x value.
+            y_range (tuple): The first and last y value.
+            x_label (str): The x axis title.
+            y_label (str): The y axis title.
+        """
+        # QImage rows run top to bottom, so flip to put the lowest y at the bottom
+        rgb = np.ascontiguousarray(rgb[::-1])
+        rows, columns, _ = rgb.shape
+        self.image = QImage(
+            rgb.data, columns, rows, 3 * columns, QImage.Format_RGB888
+        ).copy()
+        self.x_range = x_range
+        self.y_range = y_range
+        self.x_label = x_label
+        self.y_label = y_label
+        self.update()
+
+    def plot_rect(self) -> QRectF:
+        """
+        Returns the area the image is drawn into.
+        """
+        margin = self.MARGIN
+        width = self.width() - 1.5 * margin
+        height = self.height() - 1.5 * margin
+        return QRectF(margin, margin / 2, width, height)
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        rect = self.plot_rect()
+        if self.image is not None:
+            painter.drawImage(rect, self.image)
+        painter.setPen(QColor(Qt.black))
+        painter.drawRect(rect)
+
+        # Axis limits and titles
+        painter.drawText(
+            QRectF(rect.left(), rect.bottom(), rect.width(), self.MARGIN / 2),
+            Qt.AlignLeft | Qt.AlignTop,
+            f"{self.x_range[0]:g}",
+        )
+        painter.drawText(
+            QRectF(rect.left(), rect.bottom(), rect.width(), self.MARGIN / 2),
+            Qt.AlignRight | Qt.AlignTop,
+            f"{self.x_range[1]:g}",
+        )
+        painter.drawText(
+            QRectF(rect.left(), rect.bottom(), rect.width(), self.MARGIN),
+            Qt.AlignHCenter | Qt.AlignBottom,
+            self.x_label,
+        )
+        painter.drawText(
+            QRectF(0, rect.bottom() - 20, self.MARGIN - 4, 20),
+            Qt.AlignRight | Qt.AlignBottom,
+            f"{self.y_range[0]:g}",
+        )
+        painter.drawText(
+            QRectF(0, rect.top(), self.MARGIN - 4, 20),
+            Qt.AlignRight | Qt.AlignTop,
+            f"{self.y_range[1]:g}",
+        )
+        painter.save()
+        painter.translate(12, rect.center().y())
+        painter.rotate(-90)
+        painter.drawText(
+            QRectF(-rect.height() / 2, -10, rect.height(), 20),
+            Qt.AlignCenter,
+            self.y_label,
+        )
+        painter.restore()
+        painter.end()
+
+
+class DroneSweepWindow(QWidget):
+    """
+    Heatmap of intercept distance over a grid of two drone inputs, with the
+    feasibility boundary drawn in white and infeasible cells in grey.
+    """
+
+    # Log initialization
+    logger.debug("DroneSweepWindow initialized")
+
+    # Finest levels with more cells than this run on worker processes
+    PARALLEL_CELLS = 4_000_000
+
+    # Time between two progress polls of a parallel level
+    POLL_INTERVAL_MS = 50
+
+    def __init__(self, drone_speed, radar_range, reaction_time) -> None:
+        """
+        Initialize the window
+
+        Parameters:
+            drone_speed (float): The speed of both drones in miles per hour.
+            radar_range (float): The radar detection range in miles.
+            reaction_time (float): The time to react and launch, in minutes.
+        """
+        super().__init__()
+        self.fixed = {
+            "drone_speed": drone_speed,
+            "radar_range": radar_range,
+            "reaction_time": reaction_time,
+        }
+        self.levels = None
+        self.executor = None
+        self.sweep_start = None
+        self.first_level_time = None
+        self.init_ui()
+        self.run_sweep()
+
+    def init_ui(self) -> None:
+        """
+        Initialize the UI
+        """
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+        self.setWindowTitle("Drone Intercept Parameter Sweep")
+
+        names = list(DRONE_SWEEP_PARAMETERS)
+        self.x_combo = QComboBox()
+        self.y_combo = QComboBox()
+        for name in names:
+            self.x_combo.addItem(DRONE_SWEEP_PARAMETERS[name], name)
+            self.y_combo.addItem(DRONE_SWEEP_PARAMETERS[name], name)
+        self.x_combo.setCurrentIndex(names.index("drone_speed"))
+        self.y_combo.setCurrentIndex(names.index("reaction_time"))
+
+        self.x_min, self.x_max = self.create_range_inputs()
+        self.y_min, self.y_max = self.create_range_inputs()
+        self.resolution = QSpinBox()
+        self.resolution.setRange(2, 4000)
+        self.resolution.setValue(1000)
+
+        # Layout setup
+        form = QFormLayout()
+        form.addRow("X axis:", self.row(self.x_combo, self.x_min, self.x_max))
+        form.addRow("Y axis:", self.row(self.y_combo, self.y_min, self.y_max))
+        form.addRow("Cells per axis:", self.resolution)
+        layout.addLayout(form)
+
+        self.run_button = QPushButton("Run Sweep")
+        layout.addWidget(self.run_button)
+
+        self.heatmap = HeatmapView()
+        layout.addWidget(self.heatmap, 1)
+
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+
+        # Default ranges around the current scenario
+        self.reset_range(self.x_combo, self.x_min, self.x_max)
+        self.reset_range(self.y_combo, self.y_min, self.y_max)
+
+        # Signals and slots
+        self.x_combo.currentIndexChanged.connect(
+            lambda: self.reset_range(self.x_combo, self.x_min, self.x_max)
+        )
+        self.y_combo.currentIndexChanged.connect(
+            lambda: self.reset_range(self.y_combo, self.y_min, self.y_max)
+        )
+        self.run_button.clicked.connect(self.run_or_cancel)
+
+        # Progress polling of a parallel level
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(self.POLL_INTERVAL_MS)
+        self.poll_timer.timeout.connect(self.poll_parallel_level)
+
+    def create_range_inputs(self):
+        """
+        Returns the minimum and maximum spin boxes of one axis.
+        """
+        spin_boxes = []
+        for _ in range(2):
+            spin_box = QDoubleSpinBox()
+            spin_box.setRange(0.0, 999999.0)
+            spin_box.setDecimals(3)
+            spin_boxes.append(spin_box)
+        return spin_boxes
+
+    def row(self, *widgets) -> QWidget:
+        """
+        Returns a widget holding the given widgets side by side.
+        """
+        container = QWidget()
+        layout = QHBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        for widget in widgets:
+            layout.addWidget(widget)
+        return container
+
+    def reset_range(self, combo, minimum, maximum) -> None:
+        """
+        Sets an axis to run from zero to four times the current value of its input.
+        """
+        current = self.fixed[combo.currentData()]
+        low = 1.0 if combo.currentData() == "drone_speed" else 0.0
+        minimum.setValue(low)
+        maximum.setValue(max(current * 4, low + 1.0))
+
+    def run_or_cancel(self) -> None:
+        """
+        Runs a sweep, or cancels the parallel level that is running.
+        """
+        if self.executor is not None:
+            self.executor.cancel()
+        else:
+            self.run_sweep()
+
+    def run_sweep(self) -> None:
+        """
+        Starts a coarse-to-fine sweep, replacing one that is still running.
+        """
+        x_name = self.x_combo.currentData()
+        y_name = self.y_combo.currentData()
+        if x_name == y_name:
+            self.status_label.setText("Choose two different parameters.")
+            return
+
+        cells = self.resolution.value()
+        self.x_values = np.linspace(self.x_min.value(), self.x_max.value(), cells)
+        self.y_values = np.linspace(self.y_min.value(), self.y_max.value(), cells)
+        self.x_name = x_name
+        self.y_name = y_name
+
+        # Intercepts are at most half the radar range, which fixes the colour scale
+        radar_range = self.fixed["radar_range"]
+        if x_name == "radar_range":
+            radar_range = self.x_values.max()
+        elif y_name == "radar_range":
+            radar_range = self.y_values.max()
+        self.max_distance = radar_range / 2
+
+        # Large grids leave the finest level to the worker processes
+        self.parallel = cells * cells > self.PARALLEL_CELLS
+        self.levels = sweep_drone_grid(
+            x_name,
+            self.x_values,
+            y_name,
+            self.y_values,
+            self.fixed,
+            min_stride=2 if self.parallel else 1,
+        )
+        self.sweep_start = time.perf_counter()
+        self.first_level_time = None
+        QTimer.singleShot(0, self.next_level)
+
+    def next_level(self) -> None:
+        """
+        Solves and shows the next level, then yields to the event loop so it
+        is painted before the next, finer level.
+        """
+        if self.levels is None:
+            return
+        try:
+            level = next(self.levels)
+        except StopIteration:
+            self.levels = None
+            if self.parallel:
+                self.start_parallel_level()
+            return
+
+        self.show_level(level)
+        QTimer.singleShot(0, self.next_level)
+
+    def show_level(self, level) -> None:
+        """
+        Draws a solved level and describes it in the status line.
+
+        Parameters:
+            level (SweepResult): The level to show.
+        """
+        self.heatmap.set_level(
+            heatmap_rgb(level, self.max_distance),
+            (self.x_values[0], self.x_values[-1]),
+            (self.y_values[0], self.y_values[-1]),
+            DRONE_SWEEP_PARAMETERS[self.x_name],
+            DRONE_SWEEP_PARAMETERS[self.y_name],
+        )
+        elapsed = (time.perf_counter() - self.sweep_start) * 1000
+        if self.first_level_time is None:
+            self.first_level_time = elapsed
+            logger.info("First sweep level after %.1f ms", elapsed)
+
+        rows, columns = level.intercept_distance.shape
+        feasible = np.mean(level.intercept_possible)
+        self.status_label.setText(
+            f"{columns} x {rows} cells in {elapsed:.0f} ms, "
+            f"{feasible:.0%} can intercept. Colour: intercept distance, up to "
+            f"{self.max_distance:g} miles; grey: no intercept; white: boundary."
+        )
+
+    def start_parallel_level(self) -> None:
+        """
+        Starts solving the finest level on worker processes.
+        """
+        from sweep_executor import SweepExecutor
+
+        swept = (self.x_name, self.y_name)
+        fixed = {name: value for name, value in self.fixed.items() if name not in swept}
+        self.executor = SweepExecutor(
+            "drone",
+            {self.y_name: self.y_values, self.x_name: self.x_values},
+            fixed,
+            ["intercept_distance", "intercept_possible"],
+        )
+        self.executor.start()
+        self.run_button.setText("Cancel Sweep")
+        self.poll_timer.start()
+
+    def poll_parallel_level(self) -> None:
+        """
+        Reports the progress of the parallel level and shows it once solved.
+        """
+        try:
+            running = self.executor.poll()
+        except Exception as e:
+            logger.error("Sweep failed: %s", e)
+            self.status_label.setText(f"Sweep failed: {e}")
+            self.finish_parallel_level()
+            return
+
+        if running:
+            self.status_label.setText(
+                f"Solving {self.executor.total} cells on "
+                f"{self.executor.max_workers} processes: "
+                f"{self.executor.progress():.0%}"
+            )
+            return
+
+        if self.executor.cancelled:
+            self.status_label.setText("Sweep cancelled.")
+        else:
+            results = self.executor.results
+            self.show_level(
+                SweepResult(
+                    self.x_values,
+                    self.y_values,
+                    results["intercept_distance"],
+                    results["intercept_possible"],
+                    1,
+                )
+            )
+        self.finish_parallel_level()
+
+    def finish_parallel_level(self) -> None:
+        """
+        Stops polling and frees the worker processes and result files.
+        """
+        self.poll_timer.stop()
+        self.executor.close()
+        self.executor = None
+        self.run_button.setText("Run Sweep")
+
+    def closeEvent(self, event) -> None:
+        """
+        Cancels a running sweep when the window closes.
+        """
+        self.levels = None
+        if self.executor is not None:
+            self.executor.cancel()
+            self.finish_parallel_level()
+        super().closeEvent(event)
@@ -0,0 +1,188 @@
+from typing import Dict
+import json
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+"""
+Frame timing of the simulation windows.
+
+FrameProfiler keeps three fixed-size histograms per window:
+    - tick: time spent in update_simulation()
+    - jitter: how far each timer tick is from its nominal interval, early or late
+    - paint: time spent painting the chart
+and counts frames dropped because a tick came a whole interval or more late.
+
+Bins are log-spaced, so memory is constant however long a simulation runs and
+every percentile is within one bin width (about 5 %) of the exact value.
+Times are recorded in seconds. This module does not import PySide6.
+"""
+
+
+class Histogram:
+    """
+    Fixed-size histogram of durations with log-spaced bins
+    """
+
+    # Log initialization
+    logger.debug("Histogram initialized")
+
+    # Range of the bins in seconds; values outside are counted in the end bins
+    LOW = 1e-6
+    HIGH = 10.0
+    BINS = 320
+
+    def __init__(self) -> None:
+        self.edges = np.geomspace(self.LOW, self.HIGH, self.BINS + 1)
+        self.counts = np.zeros(self.BINS, dtype=np.int64)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def record(self, seconds) -> None:
+        """
+        Adds one duration.
+
+        Parameters:
+            seconds (float): The duration in seconds.
+        """
+        index = int(np.searchsorted(self.edges, seconds, side="right")) - 1
+        self.counts[min(max(index, 0), self.BINS - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+
+    def percentile(self, percent) -> float:
+        """
+        Returns a percentile in seconds, the geometric middle of its bin, or
+        NaN if nothing was recorded.
+
+        Parameters:
+            percent (float): The percentile, 0 to 100.
+        """
+        if not self.count:
+            return float("nan")
+        rank = percent / 100 * self.count
+        index = int(np.searchsorted(np.cumsum(self.counts), max(rank, 1)))
+        index = min(index, self.BINS - 1)
+        return float(np.sqrt(self.edges[index] * self.edges[index + 1]))
+
+    def mean(self) -> float:
+        """
+        Returns the mean in seconds, or NaN if nothing was recorded.
+        """
+        return self.total / self.count if self.count else float("nan")
+
+    def to_dict(self) -> dict:
+        """
+        Returns the non-empty bins and summary statistics, for dumping.
+        """
+        nonzero = np.flatnonzero(self.counts)
+        return {
+            "count": self.count,
+            "mean": self.mean() if self.count else None,
+            "max": self.maximum,
+            "p50": self.percentile(50) if self.count else None,
+            "p95": self.percentile(95) if self.count else None,
+            "p99": self.percentile(99) if self.count else None,
+            "bins": [
+                {
+                    "low": float(self.edges[i]),
+                    "high": float(self.edges[i + 1]),
+                    "count": int(self.counts[i]),
+                }
+                for i in nonzero
+            ],
+        }
+
+
+class FrameProfiler:
+    """
+    Tick, jitter and paint histograms and the dropped frame count of one
+    simulation window
+    """
+
+    # Log initialization
+    logger.debug("FrameProfiler initialized")
+
+    METRICS = ("tick", "jitter", "paint")
+
+    def __init__(self, interval) -> None:
+        """
+        Parameters:
+            interval (float): The nominal time between ticks, in seconds.
+        """
+        self.interval = interval
+        self.histograms: Dict[str, Histogram] = {
+            name: Histogram() for name in self.METRICS
+        }
+        self.last_tick = None
+        self.dropped = 0
+
+    def tick_started(self, now) -> None:
+        """
+        Records the timer jitter and dropped frames of a tick starting now.
+
+        Parameters:
+            now (float): The tick's start time in seconds, from a monotonic clock.
+        """
+        if self.last_tick is not None:
+            elapsed = now - self.last_tick
+            self.histograms["jitter"].record(abs(elapsed - self.interval))
+            self.dropped += max(0, int(elapsed / self.interval + 0.5) - 1)
+        self.last_tick = now
+
+    def record(self, metric, seconds) -> None:
+        """
+        Adds a duration to one histogram.
+
+        Parameters:
+            metric (str): "tick", "jitter" or "paint".
+            seconds (float): The duration in seconds.
+        """
+        self.histograms[metric].record(seconds)
+
+    def summary(self) -> str:
+        """
+        Returns p50/p95/p99 of each histogram in milliseconds and the dropped
+        frames, one line per metric.
+        """
+        lines = []
+        for name, histogram in self.histograms.items():
+            if histogram.count:
+                p50, p95, p99 = (
+                    histogram.percentile(p) * 1000 for p in (50, 95, 99)
+                )
+                lines.append(
+                    f"{name:6} p50 {p50:7.2f}  p95 {p95:7.2f}  p99 {p99:7.2f} ms"
+                )
+            else:
+                lines.append(f"{name:6} -")
+        ticks = self.histograms["tick"].count
+        lines.append(f"dropped {self.dropped} of {ticks + self.dropped} frames")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        """
+        Returns all histograms and counters, for dumping.
+        """
+        return {
+            "interval": self.interval,
+            "dropped": self.dropped,
+            "histograms": {
+                name: histogram.to_dict() for name, histogram in self.histograms.items()
+            },
+        }
+
+    def dump(self, path) -> None:
+        """
+        Writes the histograms to a JSON file.
+
+        Parameters:
+            path (str): The output file.
+        """
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2)
+            file.write("\n")
+        logger.info("Frame profile written to %s", path)
@@ -0,0 +1,249 @@
+from result_cache import ResultCache
+from sweep_executor import WORKLOADS
+from typing import NamedTuple
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+"""
+Headless inverse solves: "what must change".
+
+Given a target for one output of the drone or car solver, finds the value of
+one chosen input at which the output reaches the target, with the other
+inputs held fixed. Every output is monotonic in every input over the input's
+bounds, so the answer is a threshold: the output is past the target on one
+side of it, and InverseResult.increasing tells which side.
+
+Common cases have closed forms. Everything else is solved by bisection
+between the input's bounds, vectorized over arrays of scenarios, so a batch
+of thresholds costs one forward solve per bisection step.
+
+Units are the solvers': mph, miles, minutes (drone) and hours (car).
+This module does not import PySide6.
+"""
+
+# Search range of each input in the solver's units
+BOUNDS = {
+    "drone_speed": (1e-9, 1e7),
+    "radar_range": (0.0, 1e7),
+    "reaction_time": (0.0, 1e7),
+    "interceptor_speed": (1e-9, 1e7),
+    "speed_car_a": (0.0, 1e7),
+    "speed_car_b": (0.0, 1e7),
+    "initial_distance": (0.0, 1e7),
+}
+
+# Bisection steps, enough to shrink the widest bounds below float resolution
+BISECTION_STEPS = 100
+
+# Bisection stops early once every interval is this small relative to its ends
+BISECTION_TOLERANCE = 1e-13
+
+# Significant digits kept when quantizing cached scalar inputs
+CACHE_DIGITS = 12
+
+# Scalar solves, keyed by quantized inputs
+SCALAR_CACHE = ResultCache(maxsize=1024, digits=CACHE_DIGITS)
+
+
+class InverseResult(NamedTuple):
+    """
+    Result of an inverse solve. Fields are floats for a scalar solve and
+    NumPy arrays for a batch solve.
+
+    Attributes:
+        value: Input value at which the output equals the target, NaN where
+            the target is not reached within the input's bounds.
+        increasing: True where the output increases with the input, so inputs
+            above value give outputs above the target.
+        found: True where value is a solution.
+    """
+
+    value: object
+    increasing: object
+    found: object
+
+
+def drone_closed_form(output, solve_for, target, inputs):
+    """
+    Closed forms of the equal-speed drone problem, or None where there is none.
+
+    intercept_distance = (R - v t / 60) / 2 and intercept_time = 30 R / v + t / 2.
+    """
+    if inputs.get("interceptor_speed") is not None:
+        return None
+    v = inputs.get("drone_speed")
+    r = inputs.get("radar_range")
+    t = inputs.get("reaction_time")
+    if output == "intercept_distance":
+        if solve_for == "drone_speed":
+            return 60 * (r - 2 * target) / t
+        if solve_for == "radar_range":
+            return 2 * target + v * t / 60
+        if solve_for == "reaction_time":
+            return 60 * (r - 2 * target) / v
+    if output == "intercept_time":
+        if solve_for == "drone_speed":
+            return 30 * r / (target - t / 2)
+        if solve_for == "radar_range":
+            return v * (target - t / 2) / 30
+        if solve_for == "reaction_time":
+            return 2 * (target - 30 * r / v)
+    return None
+
+
+def car_closed_form(output, solve_for, target, inputs):
+    """
+    Closed forms of the car problem, or None where there is none.
+
+    time_to_collision = D / (a - b) while Car A is faster.
+    """
+    if output != "time_to_collision":
+        return None
+    a = inputs.get("speed_car_a")
+    b = inputs.get("speed_car_b")
+    d = inputs.get("initial_distance")
+    if solve_for == "speed_car_a":
+        return b + d / target
+    if solve_for == "speed_car_b":
+        return a - d / target
+    if solve_for == "initial_distance":
+        return target * (a - b)
+    return None
+
+
+CLOSED_FORMS = {"drone": drone_closed_form, "car": car_closed_form}
+
+
+class InverseSolver:
+    """
+    Vectorized threshold solver for the drone and car problems
+    """
+
+    # Log initialization
+    logger.debug("InverseSolver initialized")
+
+    @staticmethod
+    def solve(problem, output, target, solve_for, **inputs) -> InverseResult:
+        """
+        Finds the value of one input at which an output reaches a target,
+        for arrays of scenarios in one call.
+
+        Inputs are broadcast against each other and the target.
+
+        Parameters:
+            problem (str): "drone" or "car".
+            output (str): The solver output to hit, e.g. "intercept_distance".
+            target (array_like): The output value to reach.
+            solve_for (str): The input to solve for, e.g. "reaction_time".
+            **inputs (array_like): Values of the other inputs.
+
+        Returns:
+            InverseResult: Arrays of threshold value, direction and solution mask.
+
+        Raises:
+            ValueError: If the problem, output or input is unknown, or an
+                input is missing.
+        """
+        if problem not in WORKLOADS:
+            raise ValueError(f"Invalid problem: {problem}")
+        workload = WORKLOADS[problem]
+        if output not in workload.outputs or workload.outputs[output] is np.bool_:
+            raise ValueError(f"Invalid output for {problem}: {output}")
+        if solve_for not in workload.inputs:
+            raise ValueError(f"Invalid input for {problem}: {solve_for}")
+
+        values = dict(workload.defaults)
+        values.update(inputs)
+        values.pop(solve_for, None)
+        for name in workload.inputs:
+            if name != solve_for and name not in values:
+                raise ValueError(f"Missing input for {problem}: {name}")
+        for name, value in values.items():
+            if value is not None:
+                values[name] = np.asarray(value, dtype=np.float64)
+        target = np.asarray(target, dtype=np.float64)
+
+        def excess(x):
+            # How far the output is past the target at input value x
+            result = workload.solve(**values, **{solve_for: x})
+            with np.errstate(invalid="ignore"):
+                return getattr(result, output) - target
+
+        # Bracket: the target must lie between the outputs at the two bounds
+        low, high = BOUNDS[solve_for]
+        shape = np.broadcast_shapes(
+            target.shape, *(v.shape for v in values.values() if v is not None)
+        )
+        low = np.full(shape, low)
+        high = np.full(shape, high)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            excess_low = excess(low)
+            excess_high = excess(high)
+            increasing = excess_high > excess_low
+            bracketed = np.sign(excess_low) != np.sign(excess_high)
+            bracketed &= ~np.isnan(excess_low) & ~np.isnan(excess_high)
+
+            value = CLOSED_FORMS[problem](output, solve_for, target, values)
+            if value is None:
+                value = InverseSolver.bisect(excess, low, high, increasing)
+            value = np.broadcast_to(np.asarray(value, dtype=np.float64), shape)
+
+        found = bracketed & np.isfinite(value) & (value >= low) & (value <= high)
+        value = np.where(found, value, np.nan)
+        return InverseResult(value, increasing, found)
+
+    @staticmethod
+    def bisect(excess, low, high, increasing) -> np.ndarray:
+        """
+        Bisects every scenario at once between its bounds.
+
+        Parameters:
+            excess (callable): Maps input values to output minus target.
+            low (np.ndarray): Lower bounds.
+            high (np.ndarray): Upper bounds.
+            increasing (np.ndarray): True where excess increases with the input.
+
+        Returns:
+            np.ndarray: The input values where excess crosses zero.
+        """
+        low = low.copy()
+        high = high.copy()
+        for step in range(BISECTION_STEPS):
+            middle = (low + high) / 2
+            past = (excess(middle) > 0) == increasing
+            np.copyto(high, middle, where=past)
+            np.copyto(low, middle, where=~past)
+            if step % 8 == 7 and np.all(
+                high - low <= BISECTION_TOLERANCE * np.abs(high)
+            ):
+                break
+        return (low + high) / 2
+
+    @staticmethod
+    def solve_scalar(problem, output, target, solve_for, **inputs) -> InverseResult:
+        """
+        Solves a single scenario, caching results by the quantized inputs.
+
+        Parameters:
+            As for solve(), with scalar values.
+
+        Returns:
+            InverseResult: A float and two bools.
+        """
+        key = SCALAR_CACHE.key(
+            problem,
+            output,
+            target,
+            solve_for,
+            *(item for name in sorted(inputs) for item in (name, inputs[name])),
+        )
+
+        def compute():
+            result = InverseSolver.solve(problem, output, target, solve_for, **inputs)
+            return InverseResult(
+                float(result.value), bool(result.increasing), bool(result.found)
+            )
+
+        return SCALAR_CACHE.get_or_compute(key, compute)
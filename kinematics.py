@@ -0,0 +1,495 @@
+from typing import List, NamedTuple
+from drone_intercept_solver import InterceptTrajectories
+from car_collision_solver import CollisionTrajectories
+from trajectory import Trajectory
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+"""
+Time-varying kinematics on a line, integrated with RK4.
+
+Every scenario has the same bodies (two drones, two cars), each with its own
+start position, launch time, launch speed, piecewise-constant acceleration
+profile and quadratic drag. All scenarios advance together as (N, B) NumPy
+state arrays, one RK4 step per call for all of them. Each scenario's step is
+cut short at its next launch or acceleration breakpoint, so the forces are
+smooth within every step and the results match the closed-form solvers to
+round-off when speeds are constant.
+
+Events are zero crossings of a linear combination of the positions, such as
+the gap between two bodies. Within each step the positions follow the cubic
+Hermite interpolant of the RK4 end states, and the earliest root of every
+event on it is found by bracketing between its turning points and
+bisecting, so an event that opens and closes again inside one step is
+still found.
+
+Units: times in minutes, positions in miles, speeds in miles per hour,
+accelerations in miles per hour per minute and drag per mile. This module
+does not import PySide6.
+"""
+
+# Bisection iterations on a bracketed event root, a 2^-50 share of the step
+EVENT_ITERATIONS = 50
+
+# Trajectory backends of the simulation windows: the exact closed-form
+# solvers, or this engine
+BACKENDS = ("closed_form", "rk4")
+
+
+class AccelerationProfile(NamedTuple):
+    """
+    Piecewise-constant acceleration of one body in every scenario.
+
+    Attributes:
+        times: Start time of each segment in minutes, ascending, shape (K,)
+            or (N, K). There is no acceleration before the first start.
+        accelerations: Acceleration of each segment in miles per hour per
+            minute, same shape as times. The last one holds for good.
+    """
+
+    times: object
+    accelerations: object
+
+
+class Body(NamedTuple):
+    """
+    One moving body, each field a scalar or one value per scenario.
+
+    Attributes:
+        position: Position at the start time, in miles.
+        speed: Speed at launch, in miles per hour.
+        launch_time: Time the body starts to move, in minutes. Before it the
+            body holds its position; -inf for moving from the start.
+        profile: AccelerationProfile, None for constant speed.
+        drag: Quadratic drag per mile, slowing by drag * speed^2.
+    """
+
+    position: object
+    speed: object
+    launch_time: object = -np.inf
+    profile: object = None
+    drag: object = 0.0
+
+
+class Event(NamedTuple):
+    """
+    An event that fires when sum(coefficients * positions) + offset falls to
+    zero from above.
+
+    Attributes:
+        name: The event name.
+        coefficients: One coefficient per body.
+        offset: Constant term, in miles.
+    """
+
+    name: str
+    coefficients: tuple
+    offset: float = 0.0
+
+
+class KinematicsEngine:
+    """
+    Lockstep RK4 integrator of many scenarios with in-step event detection
+    """
+
+    # Log initialization
+    logger.debug("KinematicsEngine initialized")
+
+    def __init__(
+        self, bodies: List[Body], events: List[Event], start_time=0.0
+    ) -> None:
+        """
+        Parameters:
+            bodies (list): The bodies, in the order of the event coefficients.
+            events (list): The events; the first one to fire stops a scenario.
+            start_time (float or array_like): Start time of each scenario, in
+                minutes.
+        """
+        # Scenario count: the longest per-scenario field or profile
+        sizes = [np.size(start_time)]
+        for body in bodies:
+            sizes += [np.size(body.position), np.size(body.speed)]
+            sizes += [np.size(body.launch_time), np.size(body.drag)]
+            if body.profile is not None:
+                times = np.asarray(body.profile.times)
+                sizes.append(times.shape[0] if times.ndim > 1 else 1)
+        count = max(sizes)
+
+        def column(name, dtype=np.float64):
+            return np.stack(
+                [
+                    np.broadcast_to(np.asarray(getattr(body, name), dtype), count)
+                    for body in bodies
+                ],
+                axis=1,
+            ).astype(dtype)
+
+        self.count = count
+        self.time = np.broadcast_to(
+            np.asarray(start_time, dtype=np.float64), count
+        ).copy()
+        self.position = column("position")
+        self.velocity = column("speed") / 60
+        self.launch_time = column("launch_time")
+        self.drag = column("drag")
+
+        # Accelerations in miles per minute^2, one (N, K) pair per body
+        self.profiles = []
+        for body in bodies:
+            if body.profile is None:
+                self.profiles.append(None)
+                continue
+            times = np.asarray(body.profile.times, dtype=np.float64)
+            accelerations = np.asarray(body.profile.accelerations, dtype=np.float64)
+            times, accelerations = np.broadcast_arrays(times, accelerations)
+            self.profiles.append(
+                (
+                    np.broadcast_to(times, (count, times.shape[-1])),
+                    np.broadcast_to(accelerations, (count, times.shape[-1])) / 60,
+                )
+            )
+
+        # Every time at which a body launches or changes acceleration
+        breaks = [self.launch_time]
+        breaks += [times for times, _ in filter(None, self.profiles)]
+        self.breakpoints = np.sort(np.concatenate(breaks, axis=1), axis=1)
+
+        self.events = events
+        self.event_matrix = np.array(
+            [event.coefficients for event in events], dtype=np.float64
+        ).reshape(len(events), len(bodies))
+        self.event_offset = np.array(
+            [event.offset for event in events], dtype=np.float64
+        )
+
+        self.active = np.ones(count, dtype=bool)
+        self.event_index = np.full(count, -1, dtype=np.intp)
+        self.event_time = np.full(count, np.inf)
+        self.steps = 0
+
+        # Events that hold at the start, or start closing from zero
+        values = self.event_values(self.position)
+        launched = self.time[:, None] >= self.launch_time
+        rates = self.event_values(np.where(launched, self.velocity, 0.0), 0)
+        fired = (values < 0) | ((values == 0) & (rates < 0))
+        started = fired.any(axis=1)
+        self.event_index[started] = np.argmax(fired[started], axis=1)
+        self.event_time[started] = self.time[started]
+        self.active[started] = False
+
+    def event_values(self, position, offset=None) -> np.ndarray:
+        """
+        Returns the (N, E) values of every event for (N, B) positions.
+        """
+        offset = self.event_offset if offset is None else offset
+        return position @ self.event_matrix.T + offset
+
+    def step(self, step) -> None:
+        """
+        Advances every active scenario by one RK4 step, cut short at its next
+        breakpoint, and stops the scenarios whose events fire within it.
+
+        Parameters:
+            step (float): The step in minutes.
+        """
+        rows = np.flatnonzero(self.active)
+        if not rows.size:
+            return
+        time = self.time[rows]
+        breakpoints = self.breakpoints[rows]
+        ahead = np.where(breakpoints > time[:, None], breakpoints, np.inf)
+        h = np.minimum(step, ahead.min(axis=1) - time)
+
+        # Forces and launch state are those of the step's middle, so each
+        # stage sees the same smooth segment
+        middle = time + h / 2
+        launched = middle[:, None] >= self.launch_time[rows]
+        x0 = self.position[rows]
+        v0 = self.velocity[rows]
+
+        thrust = self.thrust(rows, middle)
+        drag = self.drag[rows] if self.drag.any() else None
+
+        def derivative(velocity):
+            force = thrust
+            if drag is not None:
+                force = thrust - drag * velocity * np.abs(velocity)
+            return np.where(launched, velocity, 0.0), np.where(launched, force, 0.0)
+
+        hh = h[:, None]
+        dx1, dv1 = derivative(v0)
+        dx2, dv2 = derivative(v0 + dv1 * hh / 2)
+        dx3, dv3 = derivative(v0 + dv2 * hh / 2)
+        dx4, dv4 = derivative(v0 + dv3 * hh)
+        x1 = x0 + hh / 6 * (dx1 + 2 * dx2 + 2 * dx3 + dx4)
+        v1 = v0 + hh / 6 * (dv1 + 2 * dv2 + 2 * dv3 + dv4)
+
+        # Earliest event root on the Hermite interpolant of the step
+        moving0 = np.where(launched, v0, 0.0) * hh
+        moving1 = np.where(launched, v1, 0.0) * hh
+        g0 = self.event_values(x0)
+        g1 = self.event_values(x1)
+        m0 = self.event_values(moving0, 0)
+        m1 = self.event_values(moving1, 0)
+        theta = self.first_root(g0, g1, m0, m1)
+        fired = np.isfinite(theta).any(axis=1)
+        fraction = np.where(fired, np.min(theta, axis=1), 1.0)
+
+        # Scenarios with an event stop at it
+        event_x = self.hermite(x0, x1, moving0, moving1, fraction)
+        self.position[rows] = np.where(fired[:, None], event_x, x1)
+        self.velocity[rows] = v0 + (v1 - v0) * fraction[:, None]
+        self.time[rows] = time + fraction * h
+        if fired.any():
+            hit = rows[fired]
+            self.event_index[hit] = np.argmin(theta[fired], axis=1)
+            self.event_time[hit] = self.time[hit]
+            self.active[hit] = False
+        self.steps += 1
+
+    def thrust(self, rows, time) -> np.ndarray:
+        """
+        Returns the (n, B) profile accelerations of some scenarios in miles
+        per minute^2, without drag.
+
+        Parameters:
+            rows (np.ndarray): The scenarios.
+            time (np.ndarray): The time of each, inside one profile segment.
+        """
+        acceleration = np.zeros((len(rows), len(self.profiles)))
+        for body, profile in enumerate(self.profiles):
+            if profile is None:
+                continue
+            times, accelerations = profile
+            times, accelerations = times[rows], accelerations[rows]
+            segment = (times <= time[:, None]).sum(axis=1) - 1
+            index = np.arange(len(rows))
+            acceleration[:, body] += np.where(
+                segment >= 0, accelerations[index, np.maximum(segment, 0)], 0.0
+            )
+        return acceleration
+
+    @staticmethod
+    def hermite(x0, x1, m0, m1, theta) -> np.ndarray:
+        """
+        Evaluates cubic Hermite interpolants at a fraction of the step.
+
+        Parameters:
+            x0, x1 (np.ndarray): Values at the step's ends.
+            m0, m1 (np.ndarray): Derivatives at the ends, times the step.
+            theta (np.ndarray): Fractions of the step, one per row.
+        """
+        t = theta[:, None]
+        t2 = t * t
+        t3 = t2 * t
+        return (
+            (2 * t3 - 3 * t2 + 1) * x0
+            + (t3 - 2 * t2 + t) * m0
+            + (-2 * t3 + 3 * t2) * x1
+            + (t3 - t2) * m1
+        )
+
+    @staticmethod
+    def first_root(g0, g1, m0, m1) -> np.ndarray:
+        """
+        Finds the first fraction of the step where each Hermite cubic falls
+        to zero from above.
+
+        Parameters:
+            g0, g1 (np.ndarray): Values at the step's ends.
+            m0, m1 (np.ndarray): Derivatives at the ends, times the step.
+
+        Returns:
+            np.ndarray: Fractions in (0, 1], inf where there is no root.
+        """
+        # The cubic stays within the hull of its Bezier control points, so
+        # only those with a control point at or below zero can have a root
+        result = np.full(g0.shape, np.inf)
+        candidate = (g0 > 0) & (
+            np.minimum(np.minimum(g0 + m0 / 3, g1 - m1 / 3), g1) <= 0
+        )
+        if not candidate.any():
+            return result
+        g0, g1, m0, m1 = g0[candidate], g1[candidate], m0[candidate], m1[candidate]
+
+        # p(t) = a t^3 + b t^2 + m0 t + g0
+        a = 2 * g0 + m0 - 2 * g1 + m1
+        b = -3 * g0 - 2 * m0 + 3 * g1 - m1
+
+        # Turning points split the step into monotone pieces
+        with np.errstate(divide="ignore", invalid="ignore"):
+            discriminant = b * b - 3 * a * m0
+            root = np.sqrt(np.where(discriminant >= 0, discriminant, np.nan))
+            quadratic = np.abs(a) > 1e-12 * (np.abs(b) + np.abs(m0) + 1e-300)
+            turn1 = np.where(quadratic, (-b - root) / (3 * a), -m0 / (2 * b))
+            turn2 = np.where(quadratic, (-b + root) / (3 * a), np.nan)
+        turns = np.stack([turn1, turn2], axis=-1)
+        turns = np.where((turns > 0) & (turns < 1), turns, 1.0)
+        turns.sort(axis=-1)
+        ends = np.ones((len(g0), 1))
+        points = np.concatenate([0 * ends, turns, ends], axis=-1)
+
+        def cubic(t):
+            return ((a[:, None] * t + b[:, None]) * t + m0[:, None]) * t + g0[:, None]
+
+        below = cubic(points)[:, 1:] <= 0
+        found = below.any(axis=-1)
+        piece = np.argmax(below, axis=-1)[found]
+        a, b, m0, g0 = a[found], b[found], m0[found], g0[found]
+        index = np.arange(len(piece))
+        low = points[found][index, piece]
+        high = points[found][index, piece + 1]
+
+        # p > 0 at low and p <= 0 at high
+        for _ in range(EVENT_ITERATIONS):
+            middle = (low + high) / 2
+            falls = cubic(middle[:, None])[:, 0] <= 0
+            high = np.where(falls, middle, high)
+            low = np.where(falls, low, middle)
+        found_at = np.flatnonzero(candidate.ravel())[found]
+        result.ravel()[found_at] = high
+        return result
+
+    def run(self, end_time, step, record=False):
+        """
+        Steps until every scenario has fired an event or reached end_time.
+
+        Parameters:
+            end_time (float): Time at which scenarios without an event stop.
+            step (float): The step in minutes.
+            record (bool): Keep the time and positions after every step.
+
+        Returns:
+            tuple: Lists of (N,) times and (N, B) positions, starting with the
+            initial state; empty unless record is True.
+        """
+        times = [self.time.copy()] if record else []
+        positions = [self.position.copy()] if record else []
+        while True:
+            self.active &= self.time < end_time
+            if not self.active.any():
+                break
+            remaining = end_time - self.time[self.active].min()
+            self.step(min(step, remaining) if remaining > 0 else step)
+            if record:
+                times.append(self.time.copy())
+                positions.append(self.position.copy())
+        return times, positions
+
+    @staticmethod
+    def path(times, positions, body) -> Trajectory:
+        """
+        Builds the piecewise-linear trajectory of one body of the first
+        scenario from recorded steps.
+        """
+        t = np.array([time[0] for time in times])
+        y = np.array([position[0, body] for position in positions])
+        keep = np.r_[True, np.diff(t) > 0]
+        t, y = t[keep], y[keep]
+        if len(t) < 2:
+            t = np.array([t[0], t[0] + 1.0])
+            y = np.array([y[0], y[0]])
+        return Trajectory(t, y)
+
+    @staticmethod
+    def drone_trajectories(
+        drone_speed,
+        radar_range,
+        reaction_time,
+        step=None,
+        enemy_profile=None,
+        our_profile=None,
+    ) -> InterceptTrajectories:
+        """
+        Integrates the drone intercept animation: the enemy drone from
+        reaction_time before detection, our drone launching reaction_time
+        after it, until the intercept or the enemy drone reaching the origin.
+
+        Parameters:
+            drone_speed (float): Speed of both drones in miles per hour.
+            radar_range (float): Radar detection range in miles.
+            reaction_time (float): Time to react and launch, in minutes.
+            step (float): Integration step in minutes, 1/200 of the run by
+                default.
+            enemy_profile (AccelerationProfile): Enemy acceleration, toward
+                the origin.
+            our_profile (AccelerationProfile): Our acceleration, outward.
+
+        Returns:
+            InterceptTrajectories: The paths and the event.
+        """
+        mins_speed = drone_speed / 60
+        start = -reaction_time
+        if enemy_profile is not None:
+            enemy_profile = AccelerationProfile(
+                enemy_profile.times, -np.asarray(enemy_profile.accelerations)
+            )
+        enemy_start = radar_range + mins_speed * reaction_time
+        bodies = [
+            Body(0.0, drone_speed, reaction_time, our_profile),
+            Body(enemy_start, -drone_speed, start, enemy_profile),
+        ]
+        # Arrival comes first, so an intercept at the origin is a miss, as in
+        # the closed form
+        events = [Event("arrival", (0.0, 1.0)), Event("intercept", (-1.0, 1.0))]
+        engine = KinematicsEngine(bodies, events, start)
+        horizon = 2 * (radar_range / mins_speed + 2 * reaction_time) + 1
+        times, positions = engine.run(
+            start + horizon, step or horizon / 200, record=True
+        )
+
+        intercepted = bool(engine.event_index[0] == 1)
+        event_time = float(engine.event_time[0])
+        event_position = float(engine.position[0, 1]) if intercepted else 0.0
+        return InterceptTrajectories(
+            KinematicsEngine.path(times, positions, 1),
+            KinematicsEngine.path(times, positions, 0),
+            event_time,
+            event_position,
+            intercepted,
+        )
+
+    @staticmethod
+    def car_trajectories(
+        speed_car_a,
+        speed_car_b,
+        initial_distance,
+        step=None,
+        profile_a=None,
+        profile_b=None,
+        horizon=60.0,
+    ) -> CollisionTrajectories:
+        """
+        Integrates the car collision animation until the collision, or until
+        the horizon if the cars never collide.
+
+        Parameters:
+            speed_car_a (float): Speed of Car A in miles per hour.
+            speed_car_b (float): Speed of Car B in miles per hour.
+            initial_distance (float): Gap between the cars in miles.
+            step (float): Integration step in minutes, 1/200 of the horizon
+                by default.
+            profile_a (AccelerationProfile): Acceleration of Car A.
+            profile_b (AccelerationProfile): Acceleration of Car B.
+            horizon (float): Longest run in minutes.
+
+        Returns:
+            CollisionTrajectories: The paths and the event.
+        """
+        bodies = [
+            Body(0.0, speed_car_a, -np.inf, profile_a),
+            Body(initial_distance, speed_car_b, -np.inf, profile_b),
+        ]
+        engine = KinematicsEngine(bodies, [Event("collision", (-1.0, 1.0))])
+        times, positions = engine.run(horizon, step or horizon / 200, record=True)
+
+        will_collide = bool(engine.event_index[0] == 0)
+        return CollisionTrajectories(
+            KinematicsEngine.path(times, positions, 0),
+            KinematicsEngine.path(times, positions, 1),
+            float(engine.event_time[0]),
+            float(engine.position[0, 0]) if will_collide else np.nan,
+            will_collide,
+        )
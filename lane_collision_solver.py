@@ -0,0 +1,147 @@
+from typing import NamedTuple
+import heapq
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+"""
+First collisions on a single lane of many cars.
+
+Every car drives at a constant speed in the same direction. A car that
+catches the car in front merges with it: from then on both move as one
+cluster at the front car's speed, which is the slower one. Only neighbours
+can collide, so the lane is swept with a priority queue of adjacent-pair
+collision times. A merge removes one pair and creates at most one new pair
+(the car behind against the merged cluster), so n cars take O(n log n).
+Queue entries of pairs that stopped being neighbours are skipped when popped.
+
+Units: positions in miles, speeds in miles per hour, times in hours.
+This module must not import PySide6 so it can be used without a display.
+"""
+
+
+class LaneCollisions(NamedTuple):
+    """
+    Collisions of a lane in the order they happen.
+
+    Attributes:
+        time: Time of each collision, in hours.
+        position: Position of each collision, in miles.
+        rear: Index of the car that drives into the car in front.
+        front: Index of the car it hits, the rearmost car of its cluster.
+    """
+
+    time: np.ndarray
+    position: np.ndarray
+    rear: np.ndarray
+    front: np.ndarray
+
+
+class LaneCollisionSolver:
+    """
+    Event sweep over the adjacent pairs of a lane
+    """
+
+    # Log initialization
+    logger.debug("LaneCollisionSolver initialized")
+
+    @staticmethod
+    def pair_times(positions, speeds) -> np.ndarray:
+        """
+        Computes when each car catches the next one in front, for cars sorted
+        from the back of the lane to the front.
+
+        Parameters:
+            positions (np.ndarray): Sorted positions in miles.
+            speeds (np.ndarray): Speeds in miles per hour.
+
+        Returns:
+            np.ndarray: n - 1 times in hours, inf where a pair never closes.
+        """
+        gap = np.diff(positions)
+        closing = speeds[:-1] - speeds[1:]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            times = gap / closing
+        times[closing <= 0] = np.inf
+        return times
+
+    @staticmethod
+    def solve(positions, speeds, max_collisions=None) -> LaneCollisions:
+        """
+        Finds the collisions of a lane in time order.
+
+        Parameters:
+            positions (array_like): Position of each car in miles.
+            speeds (array_like): Speed of each car in miles per hour.
+            max_collisions (int): Stop after this many collisions, all if None.
+
+        Returns:
+            LaneCollisions: The collisions, earliest first. Car indices refer
+            to the order of the inputs.
+
+        Raises:
+            ValueError: If the inputs differ in length or are not finite.
+        """
+        positions = np.asarray(positions, dtype=np.float64).ravel()
+        speeds = np.asarray(speeds, dtype=np.float64).ravel()
+        if positions.shape != speeds.shape:
+            raise ValueError("Positions and speeds must have the same length")
+        if not (np.isfinite(positions).all() and np.isfinite(speeds).all()):
+            raise ValueError("Positions and speeds must be finite")
+
+        # Lane order, from the back to the front
+        order = np.argsort(positions, kind="stable")
+        x = positions[order]
+        v = speeds[order]
+        times = LaneCollisionSolver.pair_times(x, v)
+
+        count = len(x)
+        limit = count if max_collisions is None else min(max_collisions, count)
+        closing = np.flatnonzero(np.isfinite(times))
+        heap = list(
+            zip(times[closing].tolist(), closing.tolist(), (closing + 1).tolist())
+        )
+        heapq.heapify(heap)
+
+        # Clusters are named after their front car, whose line they follow.
+        # ahead/behind link the clusters; rearmost is each cluster's last car.
+        x_list = x.tolist()
+        v_list = v.tolist()
+        ahead = list(range(1, count + 1))
+        behind = list(range(-1, count - 1))
+        rearmost = list(range(count))
+        merged = [False] * count
+
+        collision_time = []
+        collision_position = []
+        rear = []
+        front = []
+        while heap and len(collision_time) < limit:
+            time, car, cluster = heapq.heappop(heap)
+            if merged[car] or ahead[car] != cluster:
+                # The pair stopped being neighbours
+                continue
+            collision_time.append(time)
+            collision_position.append(x_list[cluster] + v_list[cluster] * time)
+            rear.append(car)
+            front.append(rearmost[cluster])
+
+            # The car's cluster joins the one in front
+            merged[car] = True
+            rearmost[cluster] = rearmost[car]
+            follower = behind[car]
+            behind[cluster] = follower
+            if follower >= 0:
+                ahead[follower] = cluster
+                closing_speed = v_list[follower] - v_list[cluster]
+                if closing_speed > 0:
+                    catch_up = (x_list[cluster] - x_list[follower]) / closing_speed
+                    heapq.heappush(heap, (max(catch_up, time), follower, cluster))
+
+        return LaneCollisions(
+            np.array(collision_time, dtype=np.float64),
+            np.array(collision_position, dtype=np.float64),
+            order[np.array(rear, dtype=np.intp)],
+            order[np.array(front, dtype=np.intp)],
+        )
@@ -1,10 +1,34 @@
 import logging
+import os
 
-def create_logger(name, level=logging.INFO):
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
-    return logger
+"""
+The one place where logging is configured.
+
+Modules log through their own named logger:
+
+    logger = logging.getLogger(__name__)
+
+and never configure handlers or levels themselves. Entry points call
+configure_logging() once. The level comes from the argument, else the
+LOG_LEVEL environment variable, else INFO.
+
+Per-call debug messages are %-style so nothing is formatted unless DEBUG is
+enabled. Where building the arguments costs something (widget reads), the
+call is guarded with logger.isEnabledFor(logging.DEBUG).
+"""
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(name)s - %(lineno)d - %(message)s"
+
+
+def configure_logging(level=None) -> None:
+    """
+    Configures the root logger once for the whole application.
+
+    Parameters:
+        level (str or int): The log level, e.g. "DEBUG" or logging.INFO.
+    """
+    if level is None:
+        level = os.environ.get("LOG_LEVEL", "INFO")
+    if isinstance(level, str):
+        level = level.upper()
+    logging.basicConfig(level=level, format=LOG_FORMAT, force=True)
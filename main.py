@@ -1,62 +1,54 @@
-from PySide6.QtWidgets import QApplication, QMainWindow, QTabWidget
-from car_collision import CarCollisionWindow
-from drone_intercept import DroneInterceptWindow
-import configparser
-import logging
-import sys
-import test
-import unittest
+import time
 
-# Set up logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - %(filename)s - %(lineno)d - %(message)s",
-)
 
-"""
-Design Patterns:
-    Composite: The MainWindow class acts as a composite, containing and
-    managing multiple component windows (CarCollisionWindow and
-    DroneInterceptWindow) through a QTabWidget. This allows treating
-    individual windows and compositions of windows uniformly.
-    
-    Factory Method: The creation of specific window objects
-    (CarCollisionWindow and DroneInterceptWindow) is delegated to
-    their respective classes, adhering to the Factory Method pattern.
-    This allows for easy extension if more simulation types are added
-    in the future.
-"""
+def process_age() -> float:
+    """
+    Returns the seconds since this process started, including interpreter
+    startup, or 0.0 where /proc is unavailable. Resolution is one clock tick.
+    """
+    try:
+        import os
 
+        with open("/proc/self/stat") as f:
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError):
+        return 0.0
 
-class MainWindow(QMainWindow):
-    # Log initialization
-    logging.info("MainWindow initialized")
 
-    def __init__(self) -> None:
-        """
-        Main window with two tabs for the two problems
-        """
-        super().__init__()
-        self.setWindowTitle("Vehicle intercept simulator")
+START_TIME = time.perf_counter() - process_age()
+
+import argparse
+import logging
+import sys
+from logger import configure_logging
 
-        # Load configuration from file
-        self.config = configparser.ConfigParser()
-        self.config.read("config.ini")
+logger = logging.getLogger(__name__)
 
-        # Create tab widget
-        self.tab_widget = QTabWidget()
-        self.setCentralWidget(self.tab_widget)
+"""
+Entry point.
 
-        # Create and add 'Drone intercept' tab
-        drone_tab = DroneInterceptWindow(self.config)
-        self.tab_widget.addTab(drone_tab, "Drone intercept")
+    python main.py                      Start the GUI.
+    python main.py --test               Run the tests, then start the GUI if they pass.
+    python main.py --measure-startup    Print the startup to first paint time in ms and exit.
+    python main.py --log-level DEBUG    Log every input change and recalculation.
+    python main.py --profile-frames     Show frame timing in simulation windows (F3 toggles).
+    python main.py batch ...            Solve scenario files headless (see batch.py).
+    python main.py sweep ...            Solve a grid of scenarios on all cores (see sweep_executor.py).
+    python main.py stream ...           Solve an endless scenario stream (see stream_pipeline.py).
+    python main.py serve ...            Serve the solvers over local HTTP (see solver_service.py).
 
-        # Create and add 'Car collision' tab
-        car_tab = CarCollisionWindow(self.config)
-        self.tab_widget.addTab(car_tab, "Car collision")
+PySide6 is only imported on the GUI path, so batch, sweep, stream and serve modes run
+without a display server or Qt installed.
+"""
 
 
 def run_tests() -> bool:
+    import test
+    import unittest
+
     # Create a test suite
     test_suite = unittest.TestLoader().loadTestsFromModule(test)
 
@@ -67,13 +59,89 @@ def run_tests() -> bool:
     return test_result.wasSuccessful()
 
 
+def run_gui(measure_startup=False, profile_frames=False, kinematics=None) -> int:
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QApplication
+    from main_window import MainWindow
+
+    app = QApplication(sys.argv)
+
+    if profile_frames or kinematics:
+        from simulation import Simulation
+
+        Simulation.profile_frames = profile_frames
+        Simulation.kinematics = kinematics or Simulation.kinematics
+
+    window = MainWindow(fast_start=True, start_time=START_TIME)
+    window.show()
+
+    if measure_startup:
+        # Quit once the first frame has been painted
+        def poll() -> None:
+            if window.startup_time is None:
+                QTimer.singleShot(1, poll)
+                return
+            print(f"{window.startup_time * 1000:.1f}")
+            app.quit()
+
+        QTimer.singleShot(0, poll)
+
+    return app.exec()
+
+
 if __name__ == "__main__":
-    if run_tests():
-        logging.info("All tests passed.")
-        app = QApplication(sys.argv)
-        window = MainWindow()
-        window.show()
-        sys.exit(app.exec())
-    else:
-        # logging.debug("Some tests failed.")
-        sys.exit(1)
+    if sys.argv[1:2] == ["batch"]:
+        import batch
+
+        configure_logging()
+        sys.exit(batch.main(sys.argv[2:]))
+    if sys.argv[1:2] == ["sweep"]:
+        import sweep_executor
+
+        configure_logging()
+        sys.exit(sweep_executor.main(sys.argv[2:]))
+    if sys.argv[1:2] == ["stream"]:
+        import stream_pipeline
+
+        configure_logging()
+        sys.exit(stream_pipeline.main(sys.argv[2:]))
+    if sys.argv[1:2] == ["serve"]:
+        import solver_service
+
+        configure_logging()
+        sys.exit(solver_service.main(sys.argv[2:]))
+
+    from kinematics import BACKENDS
+
+    parser = argparse.ArgumentParser(description="Vehicle intercept simulator")
+    parser.add_argument("--test", action="store_true", help="run the tests first")
+    parser.add_argument(
+        "--measure-startup",
+        action="store_true",
+        help="print the startup to first paint time in ms and exit",
+    )
+    parser.add_argument(
+        "--profile-frames",
+        action="store_true",
+        help="show tick, timer jitter and paint percentiles in simulation windows",
+    )
+    parser.add_argument(
+        "--kinematics",
+        choices=BACKENDS,
+        help="trajectory backend of the simulation windows, defaults to closed_form",
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        type=str.upper,
+        help="log level, defaults to $LOG_LEVEL or INFO",
+    )
+    args = parser.parse_args()
+    configure_logging(args.log_level)
+
+    if args.test:
+        if not run_tests():
+            sys.exit(1)
+        logger.info("All tests passed.")
+
+    sys.exit(run_gui(args.measure_startup, args.profile_frames, args.kinematics))
@@ -0,0 +1,106 @@
+from PySide6.QtWidgets import QMainWindow, QTabWidget, QVBoxLayout, QWidget
+import configparser
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+"""
+Design Patterns:
+    Composite: The MainWindow class acts as a composite, containing and
+    managing multiple component windows (CarCollisionWindow and
+    DroneInterceptWindow) through a QTabWidget. This allows treating
+    individual windows and compositions of windows uniformly.
+
+    Factory Method: The creation of specific window objects
+    (CarCollisionWindow and DroneInterceptWindow) is delegated to
+    their respective classes, adhering to the Factory Method pattern.
+    This allows for easy extension if more simulation types are added
+    in the future.
+
+    Tabs are built on first activation, so only the visible tab (and not
+    QtCharts or the other tab's module) is loaded at startup.
+"""
+
+
+def create_drone_tab(config, fast_start) -> QWidget:
+    from drone_intercept import DroneInterceptWindow
+
+    return DroneInterceptWindow(config, fast_start)
+
+
+def create_car_tab(config, fast_start) -> QWidget:
+    from car_collision import CarCollisionWindow
+
+    return CarCollisionWindow(config, fast_start)
+
+
+TABS = [
+    ("Drone intercept", create_drone_tab),
+    ("Car collision", create_car_tab),
+]
+
+
+class MainWindow(QMainWindow):
+    # Log initialization
+    logger.debug("MainWindow initialized")
+
+    def __init__(self, fast_start=False, start_time=None) -> None:
+        """
+        Main window with two tabs for the two problems
+
+        Parameters:
+            fast_start (bool): Defer each tab's first calculation and chart
+                until after it has been shown.
+            start_time (float): time.perf_counter() at process start, used to
+                report the time to first paint.
+        """
+        super().__init__()
+        self.setWindowTitle("Vehicle intercept simulator")
+        self.fast_start = fast_start
+        self.start_time = start_time if start_time is not None else time.perf_counter()
+        self.startup_time = None
+
+        # Load configuration from file
+        self.config = configparser.ConfigParser()
+        self.config.read("config.ini")
+
+        # Create tab widget with an empty page per tab
+        self.tab_widget = QTabWidget()
+        self.setCentralWidget(self.tab_widget)
+        self.tabs = [None] * len(TABS)
+        for title, _ in TABS:
+            page = QWidget()
+            QVBoxLayout(page).setContentsMargins(0, 0, 0, 0)
+            self.tab_widget.addTab(page, title)
+
+        # Build tabs on first activation
+        self.tab_widget.currentChanged.connect(self.get_tab)
+        self.get_tab(self.tab_widget.currentIndex())
+
+    def get_tab(self, index) -> QWidget:
+        """
+        Returns the simulation window of a tab, building it on first use.
+
+        Parameters:
+            index (int): The tab index.
+
+        Returns:
+            SimulationWindow: The tab's window.
+        """
+        if self.tabs[index] is None:
+            logger.debug("Building tab %d", index)
+            _, factory = TABS[index]
+            self.tabs[index] = factory(self.config, self.fast_start)
+            self.tab_widget.widget(index).layout().addWidget(self.tabs[index])
+        return self.tabs[index]
+
+    def paintEvent(self, event) -> None:
+        """
+        Records the time from process start to the first paint.
+        """
+        super().paintEvent(event)
+        if self.startup_time is None:
+            self.startup_time = time.perf_counter() - self.start_time
+            logger.info("Startup to first paint: %.1f ms", self.startup_time * 1000)
@@ -0,0 +1,187 @@
+from typing import NamedTuple
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+"""
+Headless planar drone intercept math.
+
+The enemy drone is detected at a point of the plane and flies a straight
+line at a constant speed and heading. Our drone launches from the origin
+after its launch delay and flies straight at full speed to the point where
+it meets the enemy drone. It reaches a point d miles out at launch_delay + d
+/ speed, so the intercept time t is the earliest root, at or after launch,
+of the relative-motion quadratic
+
+    |p + v t|^2 = u^2 (t - launch_delay)^2
+
+where p and v are the enemy drone's position and velocity and u is our
+speed. The head-on case of DroneInterceptSolver is a threat flying straight
+at the origin.
+
+Positions are x east and y north; headings and bearings are compass degrees,
+clockwise from north. Units: speeds in miles per hour, distances in miles,
+times in minutes. This module must not import PySide6 so it can be used
+without a display.
+"""
+
+
+class PlanarInterceptResult(NamedTuple):
+    """
+    Result of a planar intercept solve. Fields are floats for a scalar solve
+    and NumPy arrays for a batch solve.
+
+    Attributes:
+        intercept_time: Time of the intercept after detection, in minutes.
+            NaN where no intercept is possible.
+        intercept_x: East coordinate of the intercept, in miles.
+        intercept_y: North coordinate of the intercept, in miles.
+        intercept_distance: Distance from the origin of the intercept, in miles.
+        interceptor_heading: Heading our drone flies, in compass degrees.
+        intercept_possible: True where our drone can reach the enemy drone.
+    """
+
+    intercept_time: object
+    intercept_x: object
+    intercept_y: object
+    intercept_distance: object
+    interceptor_heading: object
+    intercept_possible: object
+
+
+class PlanarInterceptSolver:
+    """
+    Vectorized solver for intercepts in the plane
+    """
+
+    # Log initialization
+    logger.debug("PlanarInterceptSolver initialized")
+
+    @staticmethod
+    def velocity(speed, heading) -> tuple:
+        """
+        Converts a speed in miles per hour and a compass heading into east
+        and north velocities in miles per minute.
+        """
+        radians = np.radians(heading)
+        mins_speed = np.asarray(speed, dtype=np.float64) / 60
+        return mins_speed * np.sin(radians), mins_speed * np.cos(radians)
+
+    @staticmethod
+    def detection_point(radar_range, bearing, heading_offset=0.0) -> tuple:
+        """
+        Places a threat on the radar circle.
+
+        Parameters:
+            radar_range (array_like): Detection range in miles.
+            bearing (array_like): Compass bearing of the threat from the origin.
+            heading_offset (array_like): Degrees the threat's heading is off
+                the origin, 0 for straight at it.
+
+        Returns:
+            tuple: East and north position in miles and the compass heading.
+        """
+        radians = np.radians(bearing)
+        x = radar_range * np.sin(radians)
+        y = radar_range * np.cos(radians)
+        heading = np.mod(np.asarray(bearing) + 180 + heading_offset, 360)
+        return x, y, heading
+
+    @staticmethod
+    def solve(
+        threat_x,
+        threat_y,
+        threat_heading,
+        threat_speed,
+        interceptor_speed,
+        launch_delay,
+    ) -> PlanarInterceptResult:
+        """
+        Solves the earliest intercept for arrays of scenarios in one call.
+
+        Inputs are broadcast against each other, so any of them may be a scalar.
+
+        Parameters:
+            threat_x (array_like): East position at detection, in miles.
+            threat_y (array_like): North position at detection, in miles.
+            threat_heading (array_like): Compass heading of the enemy drone.
+            threat_speed (array_like): Speed of the enemy drone in miles per hour.
+            interceptor_speed (array_like): Speed of our drone in miles per hour.
+            launch_delay (array_like): Time from detection to launch, in minutes.
+
+        Returns:
+            PlanarInterceptResult: Arrays of the intercept time, point,
+            distance, our heading and the feasibility mask.
+        """
+        px = np.asarray(threat_x, dtype=np.float64)
+        py = np.asarray(threat_y, dtype=np.float64)
+        vx, vy = PlanarInterceptSolver.velocity(threat_speed, threat_heading)
+        u = np.asarray(interceptor_speed, dtype=np.float64) / 60
+        delay = np.asarray(launch_delay, dtype=np.float64)
+
+        # a t^2 + b t + c = 0, from |p + v t|^2 = u^2 (t - delay)^2
+        a = vx * vx + vy * vy - u * u
+        b = 2 * (px * vx + py * vy + u * u * delay)
+        c = px * px + py * py - (u * delay) ** 2
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            discriminant = b * b - 4 * a * c
+            root = np.sqrt(np.where(discriminant >= 0, discriminant, np.nan))
+            # Stable form: no cancellation between b and the root
+            q = -0.5 * (b + np.copysign(root, b))
+            first = q / a
+            second = c / q
+            # Equal speeds leave the linear equation b t + c = 0
+            linear = np.abs(a) <= 1e-12 * (vx * vx + vy * vy + u * u)
+            first = np.where(linear, -c / b, first)
+            second = np.where(linear, np.nan, second)
+
+            early = np.fmin(first, second)
+            late = np.fmax(first, second)
+            # Roots before launch belong to the mirrored, backward flight
+            tolerance = 1e-9 * np.maximum(np.abs(delay), 1)
+            time = np.where(
+                early >= delay - tolerance,
+                early,
+                np.where(late >= delay - tolerance, late, np.nan),
+            )
+            time = np.where(time >= 0, time, np.nan)
+
+        possible = np.isfinite(time) & (u > 0)
+        time = np.where(possible, np.maximum(time, delay), np.nan)
+        x = px + vx * time
+        y = py + vy * time
+        heading = np.mod(np.degrees(np.arctan2(x, y)), 360)
+        return PlanarInterceptResult(
+            time, x, y, np.hypot(x, y), heading, np.asarray(possible)
+        )
+
+    @staticmethod
+    def solve_scalar(
+        threat_x,
+        threat_y,
+        threat_heading,
+        threat_speed,
+        interceptor_speed,
+        launch_delay,
+    ) -> PlanarInterceptResult:
+        """
+        Solves the earliest intercept of a single scenario.
+
+        Runs the same code path as solve() so the GUI and batch results agree.
+
+        Returns:
+            PlanarInterceptResult: Python floats and a bool.
+        """
+        result = PlanarInterceptSolver.solve(
+            threat_x,
+            threat_y,
+            threat_heading,
+            threat_speed,
+            interceptor_speed,
+            launch_delay,
+        )
+        return PlanarInterceptResult(
+            *(float(value) for value in result[:-1]), bool(result.intercept_possible)
+        )
@@ -0,0 +1,167 @@
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Tuple
+import logging
+import math
+import threading
+
+logger = logging.getLogger(__name__)
+
+"""
+Bounded memo of solved scenarios.
+
+Entries are keyed by the scenario in the solvers' canonical units (mph,
+miles, minutes or hours) with every float quantized to a few significant
+digits. A scenario entered in km/h and the same one in mph share a key, as
+do values that only differ by the round-off of a unit conversion, so
+switching units, toggling back and resetting to a preset hit the cache and
+only the labels are redrawn.
+
+The cache is safe to use from several threads; computing a missing entry
+happens outside its lock.
+
+This module does not import PySide6.
+"""
+
+
+class ChartPoints(NamedTuple):
+    """
+    Point sets of a result chart in canonical units, ready to be scaled into
+    the display unit.
+
+    Attributes:
+        series: Maps a series attribute name to its x and y values.
+        x_max: End of the x axis.
+        y_max: End of the y axis, in canonical distance units.
+    """
+
+    series: Dict[str, Tuple[tuple, tuple]]
+    x_max: float
+    y_max: float
+
+
+def quantize(value, digits: int) -> float:
+    """
+    Rounds a value to a number of significant digits.
+
+    Parameters:
+        value (float): The value, or None which is returned unchanged.
+        digits (int): Significant digits to keep.
+    """
+    if value is None:
+        return None
+    return float(f"{float(value):.{digits}g}")
+
+
+class ResultCache:
+    """
+    LRU cache of solved results with hit and miss counters
+    """
+
+    # Log initialization
+    logger.debug("ResultCache initialized")
+
+    def __init__(self, maxsize: int = 256, digits: int = 12) -> None:
+        """
+        Parameters:
+            maxsize (int): The most entries kept; the least recently used go first.
+            digits (int): Significant digits of the quantized key values.
+        """
+        self.maxsize = maxsize
+        self.digits = digits
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key) -> bool:
+        # Membership tests do not count as hits or misses
+        return key in self.entries
+
+    def key(self, *values) -> tuple:
+        """
+        Builds a cache key from values in canonical units. Strings (names of
+        problems or outputs) are kept as they are and numbers are quantized.
+        """
+        return tuple(
+            value if isinstance(value, str) else quantize(value, self.digits)
+            for value in values
+        )
+
+    @staticmethod
+    def same_scenario(key, other, rel_tol: float = 1e-9) -> bool:
+        """
+        Tells whether two keys are the same scenario up to the round-off of a
+        unit conversion. Values rounded or clamped by an input field differ
+        by far more, and are a different scenario.
+        """
+        if other is None or len(key) != len(other):
+            return False
+        for value, other_value in zip(key, other):
+            if isinstance(value, (str, type(None))) or isinstance(
+                other_value, (str, type(None))
+            ):
+                if value != other_value:
+                    return False
+            elif not math.isclose(value, other_value, rel_tol=rel_tol, abs_tol=1e-12):
+                return False
+        return True
+
+    def get(self, key):
+        """
+        Returns the entry for a key, or None, and counts the hit or miss.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return entry
+
+    def put(self, key, entry) -> None:
+        """
+        Stores an entry, evicting the least recently used one if full.
+        """
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def get_or_compute(self, key, compute):
+        """
+        Returns the entry for a key, computing and storing it on a miss.
+
+        Parameters:
+            key (tuple): The cache key, see key().
+            compute (callable): Called without arguments on a miss.
+        """
+        entry = self.get(key)
+        if entry is None:
+            entry = compute()
+            self.put(key, entry)
+        return entry
+
+    def clear(self) -> None:
+        """
+        Removes all entries and resets the counters.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the hit and miss counts and the current size.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+        }
@@ -1,11 +1,22 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QFileDialog,
+)
+from PySide6.QtCharts import QChartView
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFontDatabase, QKeySequence, QShortcut
+from frame_profiler import FrameProfiler
+from simulation_clock import SimulationClock
 import logging
+import numpy as np
+import time
+
+logger = logging.getLogger(__name__)
 
-# Set up logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - %(filename)s - %(lineno)d - %(message)s",
-)
 
 """
 Design Pattern:
@@ -20,16 +31,53 @@ Design Pattern:
         CarCollisionSimulation, DroneInterceptSimulation (subclasses/implementation): 
         Implements the abstract methods defined in Simulation.
         Provides specific behavior for both simulations.
+
+    Decorator Pattern:
+        tick() wraps update_simulation() and ProfiledChartView wraps the chart
+        paint, timing both when frame profiling is on.
 """
 
 
+class ProfiledChartView(QChartView):
+    """
+    Chart view that records its paint time when it has a profiler.
+    """
+
+    # Log initialization
+    logger.debug("ProfiledChartView initialized")
+
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self.profiler = None
+
+    def paintEvent(self, event) -> None:
+        if self.profiler is None:
+            super().paintEvent(event)
+            return
+        start = time.perf_counter()
+        super().paintEvent(event)
+        self.profiler.record("paint", time.perf_counter() - start)
+
+
 class Simulation(QWidget):
     """
     Base class for simulation windows.
     """
 
     # Log initialization
-    logging.info("Simulation initialized")
+    logger.debug("Simulation initialized")
+
+    # Show the frame timing overlay in new simulation windows
+    profile_frames = False
+
+    # Trajectory backend of new simulation windows, one of kinematics.BACKENDS
+    kinematics = "closed_form"
+
+    # Initial time warp, simulated per wall time: a simulated minute per second
+    DEFAULT_WARP = 60.0
+
+    # Ticks between two refreshes of the frame timing overlay
+    OVERLAY_INTERVAL = 10
 
     def __init__(self, problem, *args) -> None:
         super().__init__()
@@ -51,7 +99,10 @@ class Simulation(QWidget):
         else:
             raise ValueError("Invalid window type")
 
+        self.profiler = None
         self.init_ui()
+        self.init_clock()
+        self.init_profiler_overlay()
 
     def init_ui(self) -> None:
         layout = QVBoxLayout()
@@ -61,6 +112,141 @@ class Simulation(QWidget):
 
         self.update_simulation()
 
+    def init_clock(self) -> None:
+        """
+        Starts the real-time clock at the current simulated time and sets up
+        the time warp slider on a log scale.
+        """
+        self.clock = SimulationClock(self.time, self.DEFAULT_WARP)
+        self.speed_slider.setRange(0, SimulationClock.max_position())
+        self.speed_slider.setValue(SimulationClock.position_from_warp(self.DEFAULT_WARP))
+        self.speed_slider.valueChanged.connect(self.set_warp_from_slider)
+        self.update_warp_label()
+        self.clock.start()
+
+    def set_warp_from_slider(self, position) -> None:
+        """
+        Sets the time warp from a slider position.
+        """
+        self.clock.set_warp(SimulationClock.warp_from_position(position))
+        self.update_warp_label()
+
+    def update_warp_label(self) -> None:
+        """
+        Shows the current time warp next to the slider.
+        """
+        warp = self.clock.warp
+        text = f"{warp:.3g}" if warp < 1000 else f"{warp:,.0f}"
+        self.speed_label.setText(f"Time warp: {text}\u00d7")
+
+    def init_profiler_overlay(self) -> None:
+        """
+        Adds the frame timing overlay below the chart, hidden unless
+        profile_frames is set. F3 toggles it.
+        """
+        self.profiler_overlay = QWidget()
+        overlay_layout = QHBoxLayout(self.profiler_overlay)
+        overlay_layout.setContentsMargins(0, 0, 0, 0)
+        self.profiler_label = QLabel()
+        self.profiler_label.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        dump_button = QPushButton("Dump Histogram")
+        dump_button.clicked.connect(self.choose_profile_file)
+        overlay_layout.addWidget(self.profiler_label, 1)
+        overlay_layout.addWidget(dump_button)
+        self.layout().addWidget(self.profiler_overlay)
+
+        shortcut = QShortcut(QKeySequence(Qt.Key_F3), self)
+        shortcut.activated.connect(lambda: self.set_profiling(self.profiler is None))
+
+        self.set_profiling(self.profile_frames)
+
+    def set_profiling(self, enabled) -> None:
+        """
+        Starts or stops recording frame timings and shows or hides the overlay.
+        Stopping discards the recorded histograms.
+
+        Parameters:
+            enabled (bool): Record frame timings.
+        """
+        if enabled and self.profiler is None:
+            self.profiler = FrameProfiler(self.timer.interval() / 1000)
+            self.ticks_since_overlay = 0
+            self.update_profiler_overlay()
+        elif not enabled:
+            self.profiler = None
+        self.chart_view.profiler = self.profiler
+        self.profiler_overlay.setVisible(enabled)
+
+    def tick(self) -> None:
+        """
+        Runs one timer tick: update_simulation(), timed when profiling.
+        """
+        if self.profiler is None:
+            self.update_simulation()
+            return
+
+        start = time.perf_counter()
+        self.profiler.tick_started(start)
+        self.update_simulation()
+        self.profiler.record("tick", time.perf_counter() - start)
+
+        # Refresh the overlay every few ticks, and once the simulation ends
+        self.ticks_since_overlay += 1
+        if (
+            self.ticks_since_overlay >= self.OVERLAY_INTERVAL
+            or not self.timer.isActive()
+        ):
+            self.ticks_since_overlay = 0
+            self.update_profiler_overlay()
+
+    def update_profiler_overlay(self) -> None:
+        """
+        Shows the current percentiles and dropped frames in the overlay.
+        """
+        self.profiler_label.setText(self.profiler.summary())
+
+    def dump_profile(self, path) -> None:
+        """
+        Writes the frame timing histograms to a JSON file.
+
+        Parameters:
+            path (str): The output file.
+
+        Raises:
+            RuntimeError: If profiling is off.
+        """
+        if self.profiler is None:
+            raise RuntimeError("Frame profiling is not enabled")
+        self.profiler.dump(path)
+
+    def choose_profile_file(self) -> None:
+        """
+        Asks for a file name and dumps the frame timing histograms to it.
+        """
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Dump Frame Histogram", "frame_profile.json", "JSON (*.json)"
+        )
+        if path:
+            self.dump_profile(path)
+
+    def reveal_path(self, series, buffer, path, start, end) -> None:
+        """
+        Extends a series along a precomputed trajectory from start to end.
+
+        Keyframes passed in between are stored in the series' bounded buffer,
+        and the series ends at the exact position at the end time.
+
+        Parameters:
+            series (QXYSeries): The chart series.
+            buffer (TrajectoryBuffer): The series' bounded point storage.
+            path (Trajectory): The precomputed trajectory.
+            start (float): The time revealed up to so far.
+            end (float): The time to reveal up to.
+        """
+        buffer.extend(*path.keyframes(start, end))
+        x, y = buffer.points()
+        series.replaceNp(np.append(x, end), np.append(y, path.at(end)))
+
     def init_chart(self) -> None:
         """
         Placeholder method to be implemented by subclasses.
@@ -0,0 +1,134 @@
+import logging
+import math
+
+logger = logging.getLogger(__name__)
+
+"""
+Real-time clock of the simulation windows.
+
+Simulated time follows wall time measured with a QElapsedTimer, scaled by a
+time warp (1x is real time, 60x plays a simulated minute per second). Wall
+time is accumulated and consumed in fixed steps, so the simulated time is
+always a whole number of steps and does not depend on the frame rate: a slow
+or loaded machine shows fewer frames (the ones in between are skipped), not a
+slower simulation. A stall longer than MAX_FRAME, such as a dragged window,
+only advances the clock by MAX_FRAME.
+
+PySide6 is imported when the clock is started, so the stepping can be used
+without it.
+"""
+
+# Fixed step of simulated time, in minutes
+STEP = 1e-6
+
+# Most wall time consumed by one frame, in seconds
+MAX_FRAME = 0.25
+
+# Time warp range, and slider positions per factor of ten
+MIN_WARP = 0.01
+MAX_WARP = 10000.0
+SLIDER_STEPS_PER_DECADE = 100
+
+
+class SimulationClock:
+    """
+    Fixed-step simulated clock in minutes, driven by wall time and a time warp
+    """
+
+    # Log initialization
+    logger.debug("SimulationClock initialized")
+
+    def __init__(self, start_time=0.0, warp=1.0, step=STEP, timer=None) -> None:
+        """
+        Parameters:
+            start_time (float): Simulated time at start, in minutes.
+            warp (float): Simulated time per wall time, clamped to
+                MIN_WARP to MAX_WARP.
+            step (float): The fixed step in minutes.
+            timer: Wall clock with start() and nsecsElapsed(), a QElapsedTimer
+                by default.
+        """
+        self.start_time = start_time
+        self.step = step
+        self.timer = timer
+        self.warp = 1.0
+        self.set_warp(warp)
+        self.steps = 0
+        self.accumulator = 0.0
+        self.last_ns = 0
+
+    @property
+    def time(self) -> float:
+        """
+        The simulated time in minutes.
+        """
+        return self.start_time + self.steps * self.step
+
+    def set_warp(self, warp) -> None:
+        """
+        Sets the time warp, clamped to MIN_WARP to MAX_WARP. Time accumulated
+        so far keeps its old warp.
+        """
+        self.warp = min(max(warp, MIN_WARP), MAX_WARP)
+
+    def start(self) -> None:
+        """
+        Starts measuring wall time. Skipped frames are counted by the
+        window's FrameProfiler.
+        """
+        if self.timer is None:
+            from PySide6.QtCore import QElapsedTimer
+
+            self.timer = QElapsedTimer()
+        self.timer.start()
+        self.last_ns = 0
+
+    def advance(self) -> float:
+        """
+        Advances by the wall time since the last call.
+
+        Returns:
+            float: The simulated time in minutes.
+        """
+        now = self.timer.nsecsElapsed()
+        elapsed = (now - self.last_ns) / 1e9
+        self.last_ns = now
+        return self.advance_by(elapsed)
+
+    def advance_by(self, elapsed) -> float:
+        """
+        Advances by a given wall time, in whole steps.
+
+        Parameters:
+            elapsed (float): Wall time in seconds.
+
+        Returns:
+            float: The simulated time in minutes.
+        """
+        self.accumulator += min(elapsed, MAX_FRAME) / 60 * self.warp
+        # The tolerance keeps round-off from holding back a whole step
+        steps = math.floor(self.accumulator / self.step + 1e-9)
+        self.steps += steps
+        self.accumulator -= steps * self.step
+        return self.time
+
+    @staticmethod
+    def warp_from_position(position) -> float:
+        """
+        Maps a slider position, 0 at MIN_WARP, to a time warp on a log scale.
+        """
+        return MIN_WARP * 10 ** (position / SLIDER_STEPS_PER_DECADE)
+
+    @staticmethod
+    def position_from_warp(warp) -> int:
+        """
+        Maps a time warp to the nearest slider position.
+        """
+        return round(math.log10(warp / MIN_WARP) * SLIDER_STEPS_PER_DECADE)
+
+    @staticmethod
+    def max_position() -> int:
+        """
+        Returns the slider position of MAX_WARP.
+        """
+        return SimulationClock.position_from_warp(MAX_WARP)
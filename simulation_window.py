@@ -1,12 +1,18 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton
-from PySide6.QtCharts import QChartView
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QMessageBox
+from PySide6.QtCore import (
+    QCoreApplication,
+    QPointF,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
+from contextlib import contextmanager
+from result_cache import ResultCache
 import logging
 
-# Set up logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - %(filename)s - %(lineno)d - %(message)s",
-)
+logger = logging.getLogger(__name__)
+
 
 """
 Design Pattern:
@@ -16,31 +22,122 @@ Design Pattern:
         methods to be implemented by subclasses:
             - create_input_group()
             - create_result_group()
+            - init_chart()
             - update_units()
             - reset_to_default()
             - start_simulation()
-            - calculate() (implied by its use in init_ui())
+            - scenario(), solve_scenario() and show_result(), the steps of
+              calculate()
     
         CarCollisionWindow, DroneInterceptWindow (subclasses/implementation): 
         Implements the abstract methods defined in SimulationWindow.
         Provides specific behavior for both simulations.
+
+    Command Pattern:
+        CalculationTask: Wraps one solve_scenario() call so it runs on the
+        window's thread pool, off the UI thread.
 """
 
 
+class CalculationTask(QRunnable):
+    """
+    Solves one scenario on a worker thread and reports back through the
+    window's signals, tagged with the generation it was started for.
+    """
+
+    # Log initialization
+    logger.debug("CalculationTask initialized")
+
+    def __init__(self, window, generation, key) -> None:
+        """
+        Parameters:
+            window (SimulationWindow): The window whose scenario is solved.
+            generation (int): The window's calculation generation at submission.
+            key (tuple): The scenario in canonical units.
+        """
+        super().__init__()
+        self.solve_scenario = window.solve_scenario
+        self.finished = window.calculation_finished
+        self.failed = window.calculation_failed
+        self.generation = generation
+        self.key = key
+
+    def run(self) -> None:
+        """
+        Solves the scenario. solve_scenario() must not touch any widget.
+        """
+        try:
+            entry = self.solve_scenario(*self.key)
+        except Exception as error:
+            logger.exception("Calculation failed for %s", self.key)
+            self.failed.emit(self.generation, str(error))
+            return
+        self.finished.emit(self.generation, self.key, entry)
+
+
 class SimulationWindow(QWidget):
     """
     Base class for simulation windows.
     """
 
     # Log initialization
-    logging.info("SimulationWindow initialized")
+    logger.debug("SimulationWindow initialized")
+
+    # Minimum time between two recalculations, one frame at 60 Hz
+    FRAME_INTERVAL_MS = 16
+
+    # Most solved scenarios kept per window
+    RESULT_CACHE_SIZE = 256
+
+    # Results of background calculations: generation, key and entry
+    calculation_finished = Signal(int, object, object)
+
+    # Failed background calculations: generation and error message
+    calculation_failed = Signal(int, str)
 
-    def __init__(self, config) -> None:
+    def __init__(self, config, fast_start=False) -> None:
         """
         Initializes the simulation window.
+
+        Parameters:
+            config (ConfigParser): The default values.
+            fast_start (bool): Defer the first calculation and chart until after
+                the first paint, so the window shows before QtCharts loads.
         """
         super().__init__()
         self.config = config
+        self.fast_start = fast_start
+
+        # Recalculation scheduler: input edits are merged into one pass per frame
+        self.recalculation_timer = QTimer(self)
+        self.recalculation_timer.setSingleShot(True)
+        self.recalculation_timer.setInterval(self.FRAME_INTERVAL_MS)
+        self.recalculation_timer.timeout.connect(self.run_scheduled_calculate)
+        self.suppress_depth = 0
+        self.recalculation_stats = {
+            "requested": 0,
+            "coalesced": 0,
+            "suppressed": 0,
+            "performed": 0,
+            "background": 0,
+            "stale": 0,
+        }
+
+        # Solved scenarios in canonical units, so unit changes only relabel
+        self.result_cache = ResultCache(self.RESULT_CACHE_SIZE)
+        self.current_entry = None
+        self.current_key = None
+
+        # Background solving: one worker per window, and a generation counter
+        # that is bumped by every calculation so late results can be dropped
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+        self.generation = 0
+        self.calculation_pending = False
+        self.calculation_finished.connect(self.finish_calculation)
+        self.calculation_failed.connect(self.fail_calculation)
+        QCoreApplication.instance().aboutToQuit.connect(self.stop_calculations)
+
         self.init_ui()
 
     def init_ui(self) -> None:
@@ -59,12 +156,17 @@ class SimulationWindow(QWidget):
         # Result label group
         self.create_result_group(layout)
 
-        # Chart setup
-        self.chart_view = QChartView()
-        layout.addWidget(self.chart_view)
+        # Chart setup, the view is created by set_chart() on first use and
+        # the chart by init_chart() on the first update_chart()
+        self.chart_view = None
+        self.chart = None
+        self.chart_layout = QVBoxLayout()
+        layout.addLayout(self.chart_layout)
 
-        # Calculate outcome
-        self.calculate()
+        # Calculate outcome, in fast start mode after the first paint
+        self.pending_calculate = self.fast_start
+        if not self.fast_start:
+            self.calculate()
 
         # Reset button
         reset_button = QPushButton("Reset to Default")
@@ -76,6 +178,252 @@ class SimulationWindow(QWidget):
         self.start_simulation_button.clicked.connect(self.start_simulation)
         layout.addWidget(self.start_simulation_button)
 
+    def paintEvent(self, event) -> None:
+        """
+        Runs the deferred first calculation once the window has painted.
+        """
+        super().paintEvent(event)
+        if self.pending_calculate:
+            self.pending_calculate = False
+            QTimer.singleShot(0, self.calculate)
+
+    def schedule_calculate(self) -> None:
+        """
+        Requests a recalculation. Requests made while one is already pending
+        are merged into it, and requests made while recalculation is
+        suppressed are dropped.
+        """
+        self.recalculation_stats["requested"] += 1
+        if self.suppress_depth:
+            self.recalculation_stats["suppressed"] += 1
+        elif self.recalculation_timer.isActive():
+            self.recalculation_stats["coalesced"] += 1
+        else:
+            self.recalculation_timer.start()
+
+    def run_scheduled_calculate(self) -> None:
+        """
+        Runs the pending recalculation.
+        """
+        self.recalculation_stats["performed"] += 1
+        logger.debug("Recalculating, stats: %s", self.recalculation_stats)
+        self.validate_and_calculate()
+
+    def flush_calculate(self) -> None:
+        """
+        Runs a pending recalculation now instead of waiting for the next frame.
+        """
+        if self.recalculation_timer.isActive():
+            self.recalculation_timer.stop()
+            self.run_scheduled_calculate()
+
+    @contextmanager
+    def suppress_recalculation(self):
+        """
+        Context manager that drops recalculation requests, for programmatic
+        edits such as unit conversion that would otherwise trigger them.
+        """
+        self.suppress_depth += 1
+        try:
+            yield
+        finally:
+            self.suppress_depth -= 1
+
+    def skipped_recalculations(self) -> int:
+        """
+        Returns how many recalculation requests did not cause a calculation.
+        """
+        return self.recalculation_stats["coalesced"] + self.recalculation_stats["suppressed"]
+
+    def calculate(self, background=True) -> None:
+        """
+        Shows the result of the current scenario in the display units. Cached
+        scenarios are shown at once; others are solved on a worker thread and
+        shown by finish_calculation().
+
+        Parameters:
+            background (bool): Solve on the worker thread. If False, solve on
+                the calling thread and show the result before returning.
+        """
+        logger.debug("calculate called")
+
+        self.generation += 1
+        key = self.result_cache.key(*self.scenario())
+        entry = self.result_cache.get(key)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Result cache stats: %s", self.result_cache.stats())
+
+        if entry is None and background:
+            # Queued calculations are out of date, the running one is dropped
+            # by finish_calculation()
+            self.thread_pool.clear()
+            self.calculation_pending = True
+            self.recalculation_stats["background"] += 1
+            self.thread_pool.start(CalculationTask(self, self.generation, key))
+            return
+
+        if entry is None:
+            entry = self.solve_scenario(*key)
+            self.result_cache.put(key, entry)
+        self.calculation_pending = False
+        self.current_entry = entry
+        self.current_key = key
+        self.show_result(entry)
+
+    def finish_calculation(self, generation, key, entry) -> None:
+        """
+        Caches a background result and shows it, unless a later calculation
+        has started since it was submitted.
+
+        Parameters:
+            generation (int): The generation the calculation was started for.
+            key (tuple): The solved scenario in canonical units.
+            entry: The result of solve_scenario().
+        """
+        self.result_cache.put(key, entry)
+        if generation != self.generation:
+            self.recalculation_stats["stale"] += 1
+            logger.debug("Dropped result of generation %d", generation)
+            return
+        self.calculation_pending = False
+        self.current_entry = entry
+        self.current_key = key
+        self.show_result(entry)
+
+    def fail_calculation(self, generation, message) -> None:
+        """
+        Reports a failed background calculation, unless it is out of date.
+
+        Parameters:
+            generation (int): The generation the calculation was started for.
+            message (str): The error message.
+        """
+        if generation != self.generation:
+            return
+        self.calculation_pending = False
+        QMessageBox.warning(self, "Calculation Failed", message)
+
+    def stop_calculations(self) -> None:
+        """
+        Drops queued calculations and waits for the running one, so no worker
+        outlives the window.
+        """
+        self.thread_pool.clear()
+        self.thread_pool.waitForDone()
+
+    def wait_for_calculation(self) -> None:
+        """
+        Blocks until the background calculation is done and its result is shown.
+        """
+        self.flush_calculate()
+        self.thread_pool.waitForDone()
+        while self.calculation_pending:
+            QCoreApplication.processEvents()
+
+    def relabel(self) -> None:
+        """
+        Shows the current result in new display units after a unit change.
+
+        When the converted spin box values describe the same scenario up to
+        conversion round-off, they are stored as another key of the current
+        entry instead of being solved again. A value a spin box clamped or
+        rounded is a different scenario, which is solved.
+        """
+        if (
+            self.suppress_depth
+            or self.recalculation_timer.isActive()
+            or self.calculation_pending
+        ):
+            # A calculation follows or is running, and shows the new units
+            return
+        key = self.result_cache.key(*self.scenario())
+        if self.current_entry is None or not ResultCache.same_scenario(
+            key, self.current_key
+        ):
+            self.current_entry = None
+            self.schedule_calculate()
+            return
+        if key not in self.result_cache:
+            self.result_cache.put(key, self.current_entry)
+        self.current_entry = self.result_cache.get(key)
+        self.current_key = key
+        self.show_result(self.current_entry)
+
+    def scenario(self) -> tuple:
+        """
+        Placeholder method to be implemented by subclasses.
+        Returns the inputs in canonical units (mph, miles, minutes or hours),
+        which are the result cache key.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses.
+        """
+        raise NotImplementedError("Subclasses must implement scenario")
+
+    def solve_scenario(self, *scenario):
+        """
+        Placeholder method to be implemented by subclasses.
+        Solves a scenario, returning everything show_result() needs in
+        canonical units.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses.
+        """
+        raise NotImplementedError("Subclasses must implement solve_scenario")
+
+    def show_result(self, entry) -> None:
+        """
+        Placeholder method to be implemented by subclasses.
+        Updates the labels and chart from a solved scenario, in the current
+        display units.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses.
+        """
+        raise NotImplementedError("Subclasses must implement show_result")
+
+    def show_chart_points(self, points, y_factor) -> None:
+        """
+        Replaces the points of each series and the axis ranges.
+
+        Parameters:
+            points (ChartPoints): Point sets in canonical units.
+            y_factor (float): Factor from the canonical to the display distance unit.
+        """
+        for name, (x, y) in points.series.items():
+            series = getattr(self, name)
+            if x:
+                series.replace([QPointF(a, b * y_factor) for a, b in zip(x, y)])
+            else:
+                series.clear()
+        self.axis_x.setRange(0, points.x_max)
+        self.axis_y.setRange(0, points.y_max * y_factor)
+
+    def set_chart(self, chart) -> None:
+        """
+        Shows a chart, creating the chart view (and importing QtCharts) on first use.
+
+        Parameters:
+            chart (QChart): The chart to show.
+        """
+        if self.chart_view is None:
+            from PySide6.QtCharts import QChartView
+
+            self.chart_view = QChartView()
+            self.chart_layout.addWidget(self.chart_view)
+        self.chart_view.setChart(chart)
+
+    def init_chart(self) -> None:
+        """
+        Placeholder method to be implemented by subclasses.
+        Creates the chart, its series and axes, which are kept for the
+        lifetime of the window and updated in place.
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses.
+        """
+        raise NotImplementedError("Subclasses must implement init_chart")
+
     def create_input_group(self) -> None:
         """
         Placeholder method to be implemented by subclasses.
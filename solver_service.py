@@ -0,0 +1,387 @@
+from batch import PROBLEMS, dump_json, solve_chunk, validate_record
+from frame_profiler import Histogram
+from typing import Dict, List, Tuple
+import argparse
+import asyncio
+import json
+import logging
+import numpy as np
+import time
+
+logger = logging.getLogger(__name__)
+
+"""
+Local HTTP/JSON solver service.
+
+    POST /<problem>   one scenario as a JSON object, with the batch mode's
+                      input columns and optional "speed_unit" and
+                      "distance_unit"; answers with the output columns,
+                      null where a result doesn't exist
+    GET /stats        request latency and batch size statistics
+    GET /health       {"status": "ok"}
+
+Problems and units are those of batch mode: drone, planar, car and braking.
+
+Requests are micro-batched: the first request of a problem opens a window
+of a few milliseconds, and every request of that problem arriving within it
+is solved in the same vectorized solve_chunk() call. A window closes early
+when it holds max_batch requests. Under load this turns many small solves
+into a few large ones; a lone request waits at most one window.
+
+The server is plain asyncio streams with HTTP/1.1 keep-alive, so it needs
+nothing beyond the standard library and NumPy. It binds to localhost by
+default. This module does not import PySide6.
+"""
+
+# Longest request body accepted, in bytes
+MAX_BODY = 65536
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+
+class ServiceStats:
+    """
+    Request latency and batch size statistics, in constant memory
+    """
+
+    # Log initialization
+    logger.debug("ServiceStats initialized")
+
+    def __init__(self, max_batch) -> None:
+        """
+        Parameters:
+            max_batch (int): The largest possible batch.
+        """
+        self.start = time.perf_counter()
+        self.requests = 0
+        self.errors = 0
+        self.latency = Histogram()
+        self.batch_sizes = np.zeros(max_batch + 1, dtype=np.int64)
+
+    def record_batch(self, size) -> None:
+        """
+        Counts a solved batch of a given size.
+        """
+        self.batch_sizes[size] += 1
+
+    def batch_percentile(self, percent) -> int:
+        """
+        Returns a percentile of the batch sizes, weighted per batch.
+        """
+        cumulative = np.cumsum(self.batch_sizes)
+        if not cumulative[-1]:
+            return 0
+        rank = max(percent / 100 * cumulative[-1], 1)
+        return int(np.searchsorted(cumulative, rank))
+
+    def to_dict(self) -> dict:
+        """
+        Returns the statistics, latencies in milliseconds.
+        """
+        batches = int(self.batch_sizes.sum())
+        solved = int(np.dot(self.batch_sizes, np.arange(len(self.batch_sizes))))
+
+        def milliseconds(percent):
+            if not self.latency.count:
+                return None
+            return self.latency.percentile(percent) * 1000
+
+        return {
+            "uptime_seconds": time.perf_counter() - self.start,
+            "requests": self.requests,
+            "errors": self.errors,
+            "latency_ms": {
+                "mean": self.latency.mean() * 1000 if self.latency.count else None,
+                "p50": milliseconds(50),
+                "p99": milliseconds(99),
+                "max": self.latency.maximum * 1000 if self.latency.count else None,
+            },
+            "batches": batches,
+            "batch_size": {
+                "mean": solved / batches if batches else None,
+                "p50": self.batch_percentile(50),
+                "p99": self.batch_percentile(99),
+                "max": int(np.flatnonzero(self.batch_sizes)[-1]) if batches else 0,
+            },
+        }
+
+
+class MicroBatcher:
+    """
+    Collects the requests of one problem and solves each window in one call
+    """
+
+    # Log initialization
+    logger.debug("MicroBatcher initialized")
+
+    def __init__(self, problem, window, max_batch, stats) -> None:
+        """
+        Parameters:
+            problem (str): The batch problem.
+            window (float): Seconds a batch stays open after its first request.
+            max_batch (int): Requests that close a batch early.
+            stats (ServiceStats): Where batch sizes are counted.
+        """
+        self.problem = problem
+        self.window = window
+        self.max_batch = max_batch
+        self.stats = stats
+        self.pending: List[Tuple[dict, asyncio.Future]] = []
+        self.timer = None
+
+    def submit(self, record) -> asyncio.Future:
+        """
+        Queues a validated record and returns the future of its output columns.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((record, future))
+        if len(self.pending) >= self.max_batch:
+            self.flush()
+        elif self.timer is None:
+            self.timer = loop.call_later(self.window, self.flush)
+        return future
+
+    def flush(self) -> None:
+        """
+        Solves the pending requests in one call and resolves their futures.
+        """
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        pending, self.pending = self.pending, []
+        if not pending:
+            return
+        records = [record for record, _ in pending]
+        try:
+            columns = solve_chunk(self.problem, records, "mph", "miles")
+        except ValueError as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        self.stats.record_batch(len(pending))
+
+        outputs = PROBLEMS[self.problem]["outputs"]
+        values = [np.asarray(columns[name]).tolist() for name in outputs]
+        for i, (_, future) in enumerate(pending):
+            if not future.done():
+                future.set_result(dict(zip(outputs, (column[i] for column in values))))
+
+
+class SolverService:
+    """
+    asyncio HTTP server in front of one MicroBatcher per problem
+    """
+
+    # Log initialization
+    logger.debug("SolverService initialized")
+
+    def __init__(self, window=0.002, max_batch=4096) -> None:
+        """
+        Parameters:
+            window (float): Micro-batching window in seconds.
+            max_batch (int): Most requests solved in one call.
+        """
+        self.stats = ServiceStats(max_batch)
+        self.batchers: Dict[str, MicroBatcher] = {
+            problem: MicroBatcher(problem, window, max_batch, self.stats)
+            for problem in PROBLEMS
+        }
+        self.server = None
+
+    async def start(self, host="127.0.0.1", port=8765) -> int:
+        """
+        Starts listening and returns the bound port, useful with port 0.
+        """
+        self.server = await asyncio.start_server(self.handle_connection, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """
+        Stops listening and closes the server.
+        """
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle_connection(self, reader, writer) -> None:
+        """
+        Serves the requests of one keep-alive connection in order.
+        """
+        try:
+            while True:
+                try:
+                    request = await self.read_request(reader)
+                except ValueError as e:
+                    # The rest of the stream can't be framed, so answer and close
+                    self.stats.requests += 1
+                    self.stats.errors += 1
+                    await self.write_response(writer, 400, {"error": str(e)}, False)
+                    break
+                if request is None:
+                    break
+                method, path, body, keep_alive = request
+                status, payload = await self.respond(method, path, body)
+                await self.write_response(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def write_response(writer, status, payload, keep_alive) -> None:
+        """
+        Writes one JSON response.
+        """
+        # Missing results are null, as in batch mode's JSONL output
+        data = dump_json(payload).encode()
+        writer.write(
+            f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n".encode()
+            + data
+        )
+        await writer.drain()
+
+    @staticmethod
+    async def read_request(reader):
+        """
+        Reads one HTTP/1.1 request.
+
+        Returns:
+            tuple: Method, path, body bytes and whether to keep the
+            connection open, or None at the end of the connection.
+
+        Raises:
+            ValueError: If the request is malformed or too large.
+        """
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, path, version = line.decode("latin-1").split()
+        except ValueError:
+            raise ValueError("Malformed request line") from None
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise ValueError("Invalid Content-Length") from None
+        if length < 0:
+            raise ValueError("Invalid Content-Length")
+        if length > MAX_BODY:
+            raise ValueError("Request body too large")
+        body = await reader.readexactly(length) if length else b""
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" and (
+            version == "HTTP/1.1" or connection == "keep-alive"
+        )
+        return method, path, body, keep_alive
+
+    async def respond(self, method, path, body) -> Tuple[int, dict]:
+        """
+        Returns the status and JSON payload of a request.
+        """
+        path = path.split("?", 1)[0].rstrip("/")
+        if path == "/health":
+            return 200, {"status": "ok"}
+        if path == "/stats":
+            return 200, self.stats.to_dict()
+        problem = path.lstrip("/")
+        if problem not in self.batchers:
+            return 404, {"error": f"Unknown path: {path}"}
+        if method != "POST":
+            return 405, {"error": "Use POST"}
+
+        start = time.perf_counter()
+        self.stats.requests += 1
+        try:
+            record = validate_record(problem, json.loads(body or b"null"))
+        except Exception as e:
+            # Untrusted input: any failure to decode or check it is the client's
+            self.stats.errors += 1
+            return 400, {"error": str(e) or type(e).__name__}
+        try:
+            result = await self.batchers[problem].submit(record)
+        except ValueError as e:
+            self.stats.errors += 1
+            return 400, {"error": str(e)}
+        self.stats.latency.record(time.perf_counter() - start)
+        return 200, result
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the argument parser for the serve command.
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py serve",
+        description="Serve the intercept and collision solvers over HTTP/JSON.",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="default 127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765, help="default 8765")
+    parser.add_argument(
+        "--window-ms",
+        type=float,
+        default=2.0,
+        help="micro-batching window in milliseconds, default 2",
+    )
+    parser.add_argument(
+        "--max-batch",
+        type=int,
+        default=4096,
+        help="most requests solved in one call, default 4096",
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        type=str.upper,
+        help="log level, defaults to $LOG_LEVEL or INFO",
+    )
+    return parser
+
+
+async def serve(host, port, window, max_batch) -> None:
+    """
+    Runs the service until cancelled.
+    """
+    service = SolverService(window, max_batch)
+    port = await service.start(host, port)
+    logger.info("Serving on http://%s:%d", host, port)
+    try:
+        await service.server.serve_forever()
+    finally:
+        logger.info("Stats: %s", json.dumps(service.stats.to_dict()))
+
+
+def main(argv=None) -> int:
+    """
+    Entry point for "python main.py serve ...".
+
+    Parameters:
+        argv (list): Command line arguments after "serve".
+
+    Returns:
+        int: The process exit code.
+    """
+    args = build_parser().parse_args(argv)
+    if args.log_level:
+        logging.getLogger().setLevel(args.log_level)
+    if args.window_ms < 0 or args.max_batch < 1:
+        logger.error("The window must be non-negative and max-batch positive")
+        return 1
+    try:
+        asyncio.run(serve(args.host, args.port, args.window_ms / 1000, args.max_batch))
+    except KeyboardInterrupt:
+        pass
+    return 0
@@ -0,0 +1,388 @@
+from batch import (
+    PROBLEMS,
+    UNIT_COLUMNS,
+    read_records,
+    solve_chunk,
+    validate_record,
+    write_chunk,
+)
+from frame_profiler import Histogram
+from typing import Iterator, List, Tuple
+from unit_converter import UnitConverter
+import argparse
+import csv
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+"""
+Streaming scenario pipeline for endless input.
+
+Records flow through four stages, each a generator over the one before:
+
+    parse      a reader thread turns lines into records and rejects bad ones
+    batch      records are grouped into chunks of at most chunk_size, or
+               whatever has arrived max_wait seconds after a chunk's first
+               record, so a slow producer still sees its answers promptly
+    solve      solve_chunk() converts the units with UnitConverter and runs
+               one vectorized solver call per chunk
+    serialize  the solved chunk is written and flushed
+
+The reader thread hands records over through a bounded queue. When the
+solver falls behind, the queue fills, the reader stops reading and the
+producer blocks on its pipe, so memory stays bounded however long the
+stream runs. Throughput, chunk sizes and the latency of every record from
+parse to flush are kept in constant memory and logged periodically.
+
+A record that can't be solved, such as a malformed line or one missing an
+input, is logged and counted as rejected; the stream goes on without it.
+
+Units are those of the batch mode. This module does not import PySide6.
+"""
+
+# End of input marker on the queue
+END = object()
+
+
+class StreamStats:
+    """
+    Throughput, chunk sizes and record latency of a running pipeline
+    """
+
+    # Log initialization
+    logger.debug("StreamStats initialized")
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.records = 0
+        self.chunks = 0
+        self.rejected = 0
+        self.max_queued = 0
+        self.latency = Histogram()
+
+    def record_chunk(self, arrivals, written) -> None:
+        """
+        Counts a written chunk and the latency of each of its records.
+
+        Parameters:
+            arrivals (list): perf_counter() time each record was parsed.
+            written (float): perf_counter() time the chunk was flushed.
+        """
+        self.records += len(arrivals)
+        self.chunks += 1
+        for arrival in arrivals:
+            self.latency.record(written - arrival)
+
+    def summary(self) -> str:
+        """
+        Returns records, throughput, rejected records, mean chunk size,
+        latency percentiles in milliseconds and the most records waiting in
+        the queue, on one line.
+        """
+        elapsed = max(time.perf_counter() - self.start, 1e-9)
+        mean_chunk = self.records / self.chunks if self.chunks else 0.0
+        if self.latency.count:
+            p50, p99 = (self.latency.percentile(p) * 1000 for p in (50, 99))
+            latency = f"latency p50 {p50:.2f} p99 {p99:.2f} ms"
+        else:
+            latency = "latency -"
+        return (
+            f"{self.records} records, {self.records / elapsed:.0f} records/s, "
+            f"{self.rejected} rejected, mean chunk {mean_chunk:.1f}, {latency}, "
+            f"queue max {self.max_queued}"
+        )
+
+
+class StreamPipeline:
+    """
+    Bounded parse, batch, solve and serialize stages over one input stream
+    """
+
+    # Log initialization
+    logger.debug("StreamPipeline initialized")
+
+    def __init__(
+        self,
+        problem: str,
+        chunk_size: int = 1024,
+        max_wait: float = 0.05,
+        queue_size: int = None,
+        speed_unit: str = "mph",
+        distance_unit: str = "miles",
+    ) -> None:
+        """
+        Parameters:
+            problem (str): A batch problem: "drone", "planar", "car" or "braking".
+            chunk_size (int): Most records solved per vectorized call.
+            max_wait (float): Seconds a started chunk waits for more records.
+            queue_size (int): Most parsed records waiting to be solved,
+                2 chunks by default.
+            speed_unit (str): Speed unit for records without a "speed_unit" column.
+            distance_unit (str): Distance unit for records without a
+                "distance_unit" column.
+
+        Raises:
+            ValueError: If the problem is unknown or a size is not positive.
+        """
+        if problem not in PROBLEMS:
+            raise ValueError(f"Invalid problem: {problem}")
+        if chunk_size < 1 or max_wait < 0:
+            raise ValueError("chunk_size must be positive and max_wait non-negative")
+        self.problem = problem
+        self.chunk_size = chunk_size
+        self.max_wait = max_wait
+        self.queue = queue.Queue(maxsize=queue_size or 2 * chunk_size)
+        self.speed_unit = speed_unit
+        self.distance_unit = distance_unit
+        self.stats = StreamStats()
+
+    def parse(self, input_stream, input_format) -> None:
+        """
+        Reader thread: puts (record, arrival time) pairs on the queue, then
+        END, or the exception that stopped the reading. put() blocks while
+        the queue is full, which is the backpressure on the producer.
+        Records that can't be decoded or fail validate_record() are logged
+        and counted instead.
+        """
+        try:
+            if input_format == "jsonl":
+                # Decoded line by line, so a malformed line is rejected alone
+                records = (line for line in input_stream if line.strip())
+            else:
+                records = read_records(input_stream, input_format)
+            for number, record in enumerate(records, 1):
+                try:
+                    if input_format == "jsonl":
+                        record = json.loads(record)
+                    record = validate_record(self.problem, record)
+                except Exception as e:
+                    # Whatever one record does, it must not end the stream
+                    self.stats.rejected += 1
+                    logger.warning("Rejected record %d: %s", number, e)
+                    continue
+                self.queue.put((record, time.perf_counter()))
+        except Exception as e:
+            self.queue.put(e)
+            return
+        self.queue.put(END)
+
+    def batches(self) -> Iterator[Tuple[List[dict], List[float]]]:
+        """
+        Yields chunks of records and their arrival times from the queue, full
+        or after max_wait, until END.
+
+        Raises:
+            Exception: Whatever stopped the reader thread.
+        """
+        while True:
+            item = self.queue.get()
+            records, arrivals = [], []
+            deadline = None
+            while item is not END and not isinstance(item, Exception):
+                records.append(item[0])
+                arrivals.append(item[1])
+                if len(records) >= self.chunk_size:
+                    break
+                if deadline is None:
+                    deadline = time.perf_counter() + self.max_wait
+                queued = self.queue.qsize()
+                self.stats.max_queued = max(self.stats.max_queued, queued)
+                try:
+                    timeout = max(deadline - time.perf_counter(), 0)
+                    item = self.queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+            if records:
+                yield records, arrivals
+            if isinstance(item, Exception):
+                raise item
+            if item is END:
+                return
+
+    def solved(self, batches) -> Iterator[Tuple[dict, List[float]]]:
+        """
+        Yields the solved columns of each chunk with its arrival times.
+        """
+        for records, arrivals in batches:
+            columns = solve_chunk(
+                self.problem, records, self.speed_unit, self.distance_unit
+            )
+            yield columns, arrivals
+
+    def run(
+        self,
+        input_stream,
+        output_stream,
+        input_format: str = "jsonl",
+        output_format: str = None,
+        stats_interval: float = None,
+    ) -> StreamStats:
+        """
+        Streams scenarios from input_stream into output_stream until the
+        input ends.
+
+        Parameters:
+            input_stream (TextIO): Where to read scenarios from.
+            output_stream (TextIO): Where to write results to, flushed per chunk.
+            input_format (str): "csv" or "jsonl".
+            output_format (str): "csv" or "jsonl". Defaults to input_format.
+            stats_interval (float): Seconds between stats log lines, None for
+                none until the end.
+
+        Returns:
+            StreamStats: The final statistics.
+
+        Raises:
+            ValueError: If the input format is invalid or a CSV input can't
+                be parsed.
+        """
+        output_format = output_format or input_format
+        problem = PROBLEMS[self.problem]
+        fieldnames = problem["inputs"] + UNIT_COLUMNS + problem["outputs"]
+        if output_format == "csv":
+            writer = csv.writer(output_stream, lineterminator="\n")
+            writer.writerow(fieldnames)
+        else:
+            writer = output_stream
+
+        # A daemon reader, so an endless input doesn't keep the process alive
+        reader = threading.Thread(
+            target=self.parse, args=(input_stream, input_format), daemon=True
+        )
+        reader.start()
+
+        last_report = time.perf_counter()
+        for columns, arrivals in self.solved(self.batches()):
+            write_chunk(writer, output_format, fieldnames, columns)
+            output_stream.flush()
+            now = time.perf_counter()
+            self.stats.record_chunk(arrivals, now)
+            if stats_interval is not None and now - last_report >= stats_interval:
+                logger.info("%s", self.stats.summary())
+                last_report = now
+        return self.stats
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the argument parser for the stream command.
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py stream",
+        description="Solve an endless stream of scenarios from stdin or a pipe.",
+    )
+    parser.add_argument("problem", choices=sorted(PROBLEMS))
+    parser.add_argument(
+        "input", nargs="?", default="-", help="input file, or - for stdin"
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="output file, or - for stdout"
+    )
+    parser.add_argument("--input-format", choices=["csv", "jsonl"], default="jsonl")
+    parser.add_argument("--output-format", choices=["csv", "jsonl"])
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    parser.add_argument(
+        "--max-wait",
+        type=float,
+        default=0.05,
+        help="seconds a chunk waits for more records, default 0.05",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        help="most parsed records waiting to be solved, default 2 chunks",
+    )
+    parser.add_argument(
+        "--stats-interval",
+        type=float,
+        default=10.0,
+        help="seconds between throughput and latency log lines, default 10",
+    )
+    parser.add_argument(
+        "--speed-unit", default="mph", choices=UnitConverter.speed_units.units
+    )
+    parser.add_argument(
+        "--distance-unit", default="miles", choices=UnitConverter.distance_units.units
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        type=str.upper,
+        help="log level, defaults to $LOG_LEVEL or INFO",
+    )
+    return parser
+
+
+def main(argv=None) -> int:
+    """
+    Entry point for "python main.py stream ...". Logs the statistics to
+    stderr, so stdout only carries results.
+
+    Parameters:
+        argv (list): Command line arguments after "stream".
+
+    Returns:
+        int: The process exit code.
+    """
+    args = build_parser().parse_args(argv)
+    if args.log_level:
+        logging.getLogger().setLevel(args.log_level)
+
+    try:
+        pipeline = StreamPipeline(
+            args.problem,
+            args.chunk_size,
+            args.max_wait,
+            args.queue_size,
+            args.speed_unit,
+            args.distance_unit,
+        )
+    except ValueError as e:
+        logger.error("Stream failed: %s", e)
+        return 1
+
+    input_stream, output_stream = sys.stdin, sys.stdout
+    try:
+        if args.input != "-":
+            input_stream = open(args.input, newline="")
+        if args.output != "-":
+            output_stream = open(args.output, "w", newline="")
+    except OSError as e:
+        logger.error("Stream failed: %s", e)
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        return 1
+
+    try:
+        stats = pipeline.run(
+            input_stream,
+            output_stream,
+            args.input_format,
+            args.output_format,
+            args.stats_interval,
+        )
+    except ValueError as e:
+        logger.error("Stream failed: %s", e)
+        return 1
+    except BrokenPipeError:
+        # The consumer went away; keep the exit flush from raising again
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        logger.info("Output closed: %s", pipeline.stats.summary())
+        return 0
+    except KeyboardInterrupt:
+        logger.info("Stream interrupted: %s", pipeline.stats.summary())
+        return 130
+    finally:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream is not sys.stdout:
+            output_stream.close()
+
+    logger.info("Stream done: %s", stats.summary())
+    return 0
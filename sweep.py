@@ -0,0 +1,199 @@
+from drone_intercept_solver import DroneInterceptSolver
+from typing import List, NamedTuple
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+"""
+Headless parameter sweeps.
+
+A sweep solves the drone intercept problem over a 2-D grid of any two of its
+inputs, with the third held fixed, in one broadcast call to
+DroneInterceptSolver.solve(). Grids are filled coarse-to-fine: every level
+solves the grid at a stride, starting coarse enough that the first picture
+is cheap and halving the stride until every cell is solved.
+
+This module does not import PySide6; drone_sweep.py draws its results.
+"""
+
+# Sweepable drone inputs, in the solver's units, with their display labels
+DRONE_SWEEP_PARAMETERS = {
+    "drone_speed": "Drone speed (mph)",
+    "radar_range": "Radar range (miles)",
+    "reaction_time": "Reaction time (min)",
+}
+
+# Colour stops of the intercept distance colour map, dark (near) to light (far)
+COLOR_STOPS = np.array(
+    [
+        [68, 1, 84],
+        [59, 82, 139],
+        [33, 145, 140],
+        [94, 201, 98],
+        [253, 231, 37],
+    ],
+    dtype=np.float64,
+)
+
+# The colour map sampled at 256 levels, so colouring is one table lookup per cell
+COLOR_TABLE = np.stack(
+    [
+        np.interp(np.linspace(0, 1, 256), np.linspace(0, 1, len(COLOR_STOPS)), channel)
+        for channel in COLOR_STOPS.T
+    ],
+    axis=-1,
+).astype(np.uint8)
+INFEASIBLE_COLOR = np.array([90, 90, 90], dtype=np.uint8)
+BOUNDARY_COLOR = np.array([255, 255, 255], dtype=np.uint8)
+
+
+class SweepResult(NamedTuple):
+    """
+    One level of a drone intercept sweep. Rows follow the y values and
+    columns the x values.
+
+    Attributes:
+        x: The x parameter values solved at this level.
+        y: The y parameter values solved at this level.
+        intercept_distance: Distance from the origin of the intercept, in miles.
+        intercept_possible: True where an intercept is possible.
+        stride: The step through the full grid, 1 for the finest level.
+    """
+
+    x: np.ndarray
+    y: np.ndarray
+    intercept_distance: np.ndarray
+    intercept_possible: np.ndarray
+    stride: int
+
+
+def solve_drone_grid(
+    x_name, x_values, y_name, y_values, fixed, stride=1
+) -> SweepResult:
+    """
+    Solves the drone intercept problem on a 2-D grid.
+
+    Parameters:
+        x_name (str): The input swept along the columns, see DRONE_SWEEP_PARAMETERS.
+        x_values (array_like): The x values, in the solver's units.
+        y_name (str): The input swept along the rows.
+        y_values (array_like): The y values, in the solver's units.
+        fixed (dict): Values of all three inputs; the swept two are ignored.
+        stride (int): Solve every stride-th value of each axis only.
+
+    Returns:
+        SweepResult: The solved grid.
+
+    Raises:
+        ValueError: If a parameter name is unknown or both axes sweep the same input.
+    """
+    for name in (x_name, y_name):
+        if name not in DRONE_SWEEP_PARAMETERS:
+            raise ValueError(f"Invalid sweep parameter: {name}")
+    if x_name == y_name:
+        raise ValueError("The two sweep parameters must differ")
+
+    x = np.asarray(x_values, dtype=np.float64)[::stride]
+    y = np.asarray(y_values, dtype=np.float64)[::stride]
+    inputs = dict(fixed)
+    inputs[x_name] = x[np.newaxis, :]
+    inputs[y_name] = y[:, np.newaxis]
+
+    result = DroneInterceptSolver.solve(
+        inputs["drone_speed"], inputs["radar_range"], inputs["reaction_time"]
+    )
+    shape = (len(y), len(x))
+    return SweepResult(
+        x,
+        y,
+        np.broadcast_to(result.intercept_distance, shape),
+        np.broadcast_to(result.intercept_possible, shape),
+        stride,
+    )
+
+
+def refinement_strides(size: int, coarse_size: int = 64) -> List[int]:
+    """
+    Returns the strides of a coarse-to-fine fill, largest first, ending at 1.
+
+    Parameters:
+        size (int): The number of values along the longer axis.
+        coarse_size (int): The largest number of values of the first level.
+    """
+    stride = 1
+    while size > coarse_size * stride:
+        stride *= 2
+    strides = []
+    while stride >= 1:
+        strides.append(stride)
+        stride //= 2
+    return strides
+
+
+def sweep_drone_grid(
+    x_name, x_values, y_name, y_values, fixed, coarse_size=64, min_stride=1
+):
+    """
+    Generator of coarse-to-fine levels of a drone intercept sweep.
+
+    Parameters:
+        coarse_size (int): The largest number of values per axis of the first level.
+        min_stride (int): Stop after the level at this stride, to leave the
+            finer levels to another solver such as SweepExecutor.
+        Others as for solve_drone_grid().
+
+    Yields:
+        SweepResult: Each level, the last one at min_stride.
+    """
+    size = max(len(x_values), len(y_values))
+    strides = refinement_strides(size, coarse_size)
+    for stride in [stride for stride in strides if stride >= min_stride]:
+        logger.debug("Sweeping %s x %s at stride %d", x_name, y_name, stride)
+        yield solve_drone_grid(x_name, x_values, y_name, y_values, fixed, stride)
+
+
+def feasibility_boundary(intercept_possible) -> np.ndarray:
+    """
+    Marks the cells where feasibility changes from a neighbouring cell.
+
+    Parameters:
+        intercept_possible (np.ndarray): The 2-D feasibility mask.
+
+    Returns:
+        np.ndarray: True on the feasibility boundary.
+    """
+    mask = np.asarray(intercept_possible, dtype=bool)
+    boundary = np.zeros(mask.shape, dtype=bool)
+    changed_x = mask[:, 1:] != mask[:, :-1]
+    changed_y = mask[1:, :] != mask[:-1, :]
+    boundary[:, 1:] |= changed_x
+    boundary[1:, :] |= changed_y
+    return boundary
+
+
+def heatmap_rgb(result: SweepResult, max_distance=None) -> np.ndarray:
+    """
+    Colours a sweep level: intercept distance on the colour map, infeasible
+    cells grey and the feasibility boundary white.
+
+    Parameters:
+        result (SweepResult): The level to colour.
+        max_distance (float): Distance at the top of the colour map, in
+            miles. Defaults to the largest intercept distance in the level.
+
+    Returns:
+        np.ndarray: uint8 array of shape (rows, columns, 3), first row at the
+        lowest y value.
+    """
+    distance = result.intercept_distance
+    feasible = result.intercept_possible & np.isfinite(distance)
+    if max_distance is None:
+        max_distance = distance[feasible].max() if feasible.any() else 1.0
+    with np.errstate(invalid="ignore"):
+        scaled = np.clip(distance * (255 / (max_distance or 1.0)), 0, 255)
+    rgb = COLOR_TABLE[np.nan_to_num(scaled).astype(np.uint8)]
+
+    rgb[~feasible] = INFEASIBLE_COLOR
+    rgb[feasibility_boundary(result.intercept_possible)] = BOUNDARY_COLOR
+    return rgb
@@ -0,0 +1,470 @@
+from car_collision_solver import CarCollisionSolver
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from drone_intercept_solver import DroneInterceptSolver
+from multiprocessing import get_context
+from typing import Callable, Dict, NamedTuple, Tuple
+import argparse
+import logging
+import numpy as np
+import os
+import shutil
+import sys
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+"""
+Multi-process parameter sweeps.
+
+A sweep solves every cell of an N-D grid, one axis per swept input. The grid
+is flattened in C order and split into chunks of cells, and the chunks are
+solved on a ProcessPoolExecutor. Workers write straight into the result
+arrays, which are .npy files mapped into every process, so no results are
+pickled back. By default the files live in /dev/shm, which is shared memory
+on Linux; grids larger than memory go to files in an output directory.
+Mapped arrays keep their mapping alive, so results stay valid after close().
+
+Only a few chunks are in flight at a time. poll() collects finished chunks
+and submits more, so a caller can report progress and cancel between polls
+(the GUI polls from a QTimer, run() polls in a loop).
+
+This module does not import PySide6. Workers are started with "spawn", which
+is safe from a process that runs Qt.
+"""
+
+
+class Workload(NamedTuple):
+    """
+    A solver that can be swept.
+
+    Attributes:
+        solve: Vectorized solver called with the inputs as keyword arguments.
+        inputs: Names of the solver inputs.
+        defaults: Values of inputs that may be left out.
+        outputs: Maps each result field to its dtype.
+    """
+
+    solve: Callable
+    inputs: Tuple[str, ...]
+    defaults: Dict[str, object]
+    outputs: Dict[str, type]
+
+
+# Drone units: mph, miles, minutes. Car units: mph, miles, hours.
+WORKLOADS = {
+    "drone": Workload(
+        DroneInterceptSolver.solve,
+        ("drone_speed", "radar_range", "reaction_time", "interceptor_speed"),
+        {"interceptor_speed": None},
+        {
+            "delay_distance": np.float64,
+            "intercept_distance": np.float64,
+            "intercept_time": np.float64,
+            "intercept_possible": np.bool_,
+        },
+    ),
+    "car": Workload(
+        CarCollisionSolver.solve,
+        ("speed_car_a", "speed_car_b", "initial_distance"),
+        {},
+        {
+            "speed_difference": np.float64,
+            "time_to_collision": np.float64,
+            "will_collide": np.bool_,
+        },
+    ),
+}
+
+
+def solve_cells(workload_name, axes, fixed, outputs, start, stop) -> int:
+    """
+    Solves the cells [start, stop) of a flattened grid and writes the results.
+
+    Runs in a worker process.
+
+    Parameters:
+        workload_name (str): A key of WORKLOADS.
+        axes (dict): Maps each swept input to its values.
+        fixed (dict): Values of the inputs that are not swept.
+        outputs (dict): Maps each result field to its .npy file.
+        start (int): The first cell.
+        stop (int): One past the last cell.
+
+    Returns:
+        int: The number of cells solved.
+    """
+    workload = WORKLOADS[workload_name]
+    shape = tuple(len(values) for values in axes.values())
+    indices = np.unravel_index(np.arange(start, stop), shape)
+
+    inputs = dict(workload.defaults)
+    inputs.update(fixed)
+    for (name, values), index in zip(axes.items(), indices):
+        inputs[name] = values[index]
+    result = workload.solve(**inputs)
+
+    for field, path in outputs.items():
+        array = np.load(path, mmap_mode="r+").reshape(-1)
+        array[start:stop] = getattr(result, field)
+        del array
+    return stop - start
+
+
+class SweepExecutor:
+    """
+    Chunked N-D sweep on a process pool with shared result arrays
+    """
+
+    # Log initialization
+    logger.debug("SweepExecutor initialized")
+
+    def __init__(
+        self,
+        workload,
+        axes,
+        fixed=None,
+        fields=None,
+        chunk_size=1 << 20,
+        max_workers=None,
+        output_dir=None,
+    ) -> None:
+        """
+        Allocates the result arrays. Call start() or run() to solve.
+
+        Parameters:
+            workload (str): A key of WORKLOADS.
+            axes (dict): Maps each swept input to its values, in the solver's
+                units. The grid has one axis per entry, in order.
+            fixed (dict): Values of the inputs that are not swept.
+            fields (list): Result fields to keep. Defaults to all of them.
+            chunk_size (int): Cells solved per task.
+            max_workers (int): Worker processes. Defaults to the CPU count.
+            output_dir (str): Write the results to <field>.npy files in this
+                directory. Defaults to a temporary directory in shared
+                memory that close() removes.
+
+        Raises:
+            ValueError: If an input or field is unknown, or an input is missing.
+        """
+        if workload not in WORKLOADS:
+            raise ValueError(f"Invalid workload: {workload}")
+        self.workload_name = workload
+        self.workload = WORKLOADS[workload]
+        self.axes = {
+            name: np.asarray(values, dtype=np.float64) for name, values in axes.items()
+        }
+        self.fixed = dict(fixed or {})
+        self.fields = list(fields or self.workload.outputs)
+
+        for name in list(self.axes) + list(self.fixed):
+            if name not in self.workload.inputs:
+                raise ValueError(f"Invalid input for {workload}: {name}")
+        for name in self.workload.inputs:
+            if (
+                name not in self.axes
+                and name not in self.fixed
+                and name not in self.workload.defaults
+            ):
+                raise ValueError(f"Missing input for {workload}: {name}")
+        for field in self.fields:
+            if field not in self.workload.outputs:
+                raise ValueError(f"Invalid field for {workload}: {field}")
+
+        self.shape = tuple(len(values) for values in self.axes.values())
+        self.total = int(np.prod(self.shape))
+        self.chunk_size = max(1, int(chunk_size))
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        # Result arrays, shaped like the grid
+        self.temporary_dir = None
+        if output_dir is None:
+            shm_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+            output_dir = self.temporary_dir = tempfile.mkdtemp(
+                prefix="sweep-", dir=shm_dir
+            )
+        self.storage = {}
+        self.results = {}
+        for field in self.fields:
+            path = os.path.join(output_dir, f"{field}.npy")
+            self.results[field] = np.lib.format.open_memmap(
+                path, mode="w+", dtype=self.workload.outputs[field], shape=self.shape
+            )
+            self.storage[field] = path
+
+        self.pool = None
+        self.pending = set()
+        self.next_start = 0
+        self.done = 0
+        self.cancelled = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """
+        Starts the worker processes and submits the first chunks.
+        """
+        if self.pool is None:
+            logger.info(
+                "Sweeping %s over %s = %d cells on %d workers",
+                self.workload_name,
+                " x ".join(map(str, self.shape)),
+                self.total,
+                self.max_workers,
+            )
+            self.pool = ProcessPoolExecutor(
+                self.max_workers, mp_context=get_context("spawn")
+            )
+        self.submit()
+
+    def submit(self) -> None:
+        """
+        Keeps two chunks per worker in flight until every chunk is submitted.
+        """
+        while (
+            not self.cancelled
+            and self.next_start < self.total
+            and len(self.pending) < 2 * self.max_workers
+        ):
+            stop = min(self.next_start + self.chunk_size, self.total)
+            self.pending.add(
+                self.pool.submit(
+                    solve_cells,
+                    self.workload_name,
+                    self.axes,
+                    self.fixed,
+                    self.storage,
+                    self.next_start,
+                    stop,
+                )
+            )
+            self.next_start = stop
+
+    def poll(self, timeout=0.0) -> bool:
+        """
+        Collects finished chunks and submits more.
+
+        Parameters:
+            timeout (float): Seconds to wait for a chunk to finish.
+
+        Returns:
+            bool: True while chunks are still running.
+
+        Raises:
+            Exception: The first error raised by a worker, after cancelling the rest.
+        """
+        if self.pool is None:
+            self.start()
+        if self.pending:
+            finished, self.pending = wait(
+                self.pending, timeout=timeout, return_when=FIRST_COMPLETED
+            )
+            for future in finished:
+                if future.cancelled():
+                    continue
+                try:
+                    self.done += future.result()
+                except Exception:
+                    self.cancel()
+                    raise
+        self.submit()
+        return bool(self.pending)
+
+    def cancel(self) -> None:
+        """
+        Stops submitting chunks and cancels those not yet started. Chunks
+        already running finish, so poll() until it returns False.
+        """
+        if not self.cancelled:
+            logger.info("Sweep cancelled after %d of %d cells", self.done, self.total)
+        self.cancelled = True
+        for future in self.pending:
+            future.cancel()
+
+    def progress(self) -> float:
+        """
+        Returns the solved fraction of the grid.
+        """
+        return self.done / self.total if self.total else 1.0
+
+    def run(self, progress=None, interval=0.1) -> dict:
+        """
+        Solves the whole grid, blocking until done or cancelled.
+
+        Parameters:
+            progress (callable): Called with (done, total) cells after each poll.
+            interval (float): Seconds between progress calls.
+
+        Returns:
+            dict: Maps each field to its result array, shaped like the grid.
+        """
+        self.start()
+        while self.poll(interval):
+            if progress is not None:
+                progress(self.done, self.total)
+        if progress is not None:
+            progress(self.done, self.total)
+        self.shutdown()
+        return self.results
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker processes.
+        """
+        if self.pool is not None:
+            self.pool.shutdown(wait=True, cancel_futures=True)
+            self.pool = None
+            self.pending = set()
+
+    def close(self) -> None:
+        """
+        Stops the workers and removes the temporary result files. Arrays
+        returned by run() stay valid until they are garbage collected.
+        """
+        self.shutdown()
+        self.results = {}
+        if self.temporary_dir is not None:
+            shutil.rmtree(self.temporary_dir, ignore_errors=True)
+            self.temporary_dir = None
+
+
+def summarize(field, array, chunk_size) -> str:
+    """
+    Describes a result array, reading it a chunk at a time so memory-mapped
+    results are not loaded whole.
+    """
+    flat = array.reshape(-1)
+    if array.dtype == np.bool_:
+        count = sum(
+            int(np.count_nonzero(flat[i : i + chunk_size]))
+            for i in range(0, flat.size, chunk_size)
+        )
+        return f"{field}: {count / max(flat.size, 1):.2%} true"
+
+    low, high = np.inf, -np.inf
+    for i in range(0, flat.size, chunk_size):
+        chunk = flat[i : i + chunk_size]
+        finite = chunk[np.isfinite(chunk)]
+        if finite.size:
+            low = min(low, finite.min())
+            high = max(high, finite.max())
+    if low > high:
+        return f"{field}: no finite values"
+    return f"{field}: min {low:g}, max {high:g}"
+
+
+def parse_axis(text: str):
+    """
+    Parses "name=start:stop:count" into a name and evenly spaced values.
+    The count must be positive.
+    """
+    try:
+        name, spec = text.split("=", 1)
+        start, stop, count = spec.split(":")
+        if int(count) < 1:
+            raise ValueError
+        return name, np.linspace(float(start), float(stop), int(count))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid axis: {text}") from None
+
+
+def parse_fixed(text: str):
+    """
+    Parses "name=value".
+    """
+    try:
+        name, value = text.split("=", 1)
+        return name, float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid fixed input: {text}") from None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the argument parser for the sweep command.
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py sweep",
+        description="Solve a grid of drone intercept or car collision scenarios "
+        "on all cores.",
+    )
+    parser.add_argument("workload", choices=sorted(WORKLOADS))
+    parser.add_argument(
+        "--axis",
+        type=parse_axis,
+        action="append",
+        required=True,
+        help="swept input as name=start:stop:count, once per axis",
+    )
+    parser.add_argument(
+        "--fixed", type=parse_fixed, action="append", default=[], help="name=value"
+    )
+    parser.add_argument("--field", action="append", help="result field to keep")
+    parser.add_argument("--chunk-size", type=int, default=1 << 20)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument(
+        "-o", "--output-dir", help="keep the <field>.npy result files in this directory"
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        type=str.upper,
+        help="log level, defaults to $LOG_LEVEL or INFO",
+    )
+    return parser
+
+
+def main(argv=None) -> int:
+    """
+    Entry point for "python main.py sweep ...". Prints the progress and a
+    summary of each result field.
+
+    Parameters:
+        argv (list): Command line arguments after "sweep".
+
+    Returns:
+        int: The process exit code.
+    """
+    args = build_parser().parse_args(argv)
+    if args.log_level:
+        logging.getLogger().setLevel(args.log_level)
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    last_done = [-1]
+
+    def report(done, total) -> None:
+        if done != last_done[0]:
+            last_done[0] = done
+            message = f"\r{done}/{total} cells ({done / max(total, 1):.0%})"
+            print(message, end="", file=sys.stderr)
+
+    try:
+        executor = SweepExecutor(
+            args.workload,
+            dict(args.axis),
+            dict(args.fixed),
+            args.field,
+            args.chunk_size,
+            args.workers,
+            args.output_dir,
+        )
+    except ValueError as e:
+        logger.error("Sweep failed: %s", e)
+        return 1
+
+    with executor:
+        try:
+            results = executor.run(report)
+        except KeyboardInterrupt:
+            executor.cancel()
+            executor.shutdown()
+            print(file=sys.stderr)
+            return 130
+        print(file=sys.stderr)
+        for field, array in results.items():
+            print(summarize(field, array, args.chunk_size))
+    return 0
@@ -3,6 +3,31 @@ import math
 import unittest
 from io import StringIO
 from unit_converter import UnitConverter
+from drone_intercept_solver import DroneInterceptSolver
+from car_collision_solver import CarCollisionSolver
+import batch
+from trajectory_buffer import TrajectoryBuffer
+from trajectory import Trajectory
+import json
+import threading
+import sweep
+from sweep_executor import SweepExecutor
+import inverse_solver
+from inverse_solver import InverseSolver
+from result_cache import ResultCache
+from benchmarks import suite
+from frame_profiler import FrameProfiler, Histogram
+from simulation_clock import SimulationClock
+from drone_assignment_solver import DroneAssignmentSolver
+from lane_collision_solver import LaneCollisionSolver
+from planar_intercept_solver import PlanarInterceptSolver
+from kinematics import AccelerationProfile, Body, Event, KinematicsEngine
+from braking_collision_solver import BrakingCollisionSolver
+from stream_pipeline import StreamPipeline
+from solver_service import SolverService
+import asyncio
+import itertools
+import numpy as np
 
 
 class TestUnitConverter(unittest.TestCase):
@@ -140,7 +165,791 @@ class TestUnitConverter(unittest.TestCase):
         with self.assertRaises(ValueError):
             UnitConverter.from_miles(1, "invalid_unit")
 
+    def test_convert_speed_any_to_any(self) -> None:
+        result = UnitConverter.convert_speed(1, "km/h", "m/s")
+        self.assertTrue(self.assertAlmostEqualRelative(result, 1 / 3.6, rel_tol=1e-5))
+
+    def test_convert_distance_array_in_place(self) -> None:
+        values = np.array([1.0, 2.0, 3.0])
+        result = UnitConverter.convert_distance(values, "miles", "feet", in_place=True)
+        self.assertIs(result, values)
+        np.testing.assert_allclose(values, [5280.0, 10560.0, 15840.0])
+
+    def test_convert_speed_per_element_units(self) -> None:
+        result = UnitConverter.convert_speed([1.0, 1.0, 1.0], ["mph", "mps", "mph"], "mph")
+        np.testing.assert_allclose(result, [1.0, 3600.0, 1.0])
+
+    def test_convert_invalid_unit(self) -> None:
+        with self.assertRaises(ValueError):
+            UnitConverter.convert_distance(np.ones(2), ["miles", "invalid_unit"], "feet")
+        with self.assertRaises(ValueError):
+            UnitConverter.convert_distance(1, "miles", "invalid_unit")
+
     def test_logging(self) -> None:
         UnitConverter.to_miles_per_hour(1, "km/h")
         log_output = self.log_capture.getvalue()
         self.assertIn("to_miles_per_hour called with value=1, unit=km/h", log_output)
+
+
+class TestDroneInterceptSolver(unittest.TestCase):
+
+    def test_solve_scalar(self) -> None:
+        result = DroneInterceptSolver.solve_scalar(30, 4, 2)
+        self.assertAlmostEqual(result.delay_distance, 1.0)
+        self.assertAlmostEqual(result.intercept_distance, 1.5)
+        self.assertAlmostEqual(result.intercept_time, 5.0)
+        self.assertTrue(result.intercept_possible)
+
+    def test_solve_scalar_not_possible(self) -> None:
+        result = DroneInterceptSolver.solve_scalar(30, 2, 5)
+        self.assertFalse(result.intercept_possible)
+
+    def test_solve_matches_scalar(self) -> None:
+        drone_speed = np.array([30.0, 60.0, 120.0, 45.5])
+        radar_range = np.array([4.0, 2.0, 10.0, 3.3])
+        reaction_time = np.array([2.0, 5.0, 1.5, 0.0])
+        batch = DroneInterceptSolver.solve(drone_speed, radar_range, reaction_time)
+        for i in range(len(drone_speed)):
+            with self.subTest(i=i):
+                scalar = DroneInterceptSolver.solve_scalar(
+                    drone_speed[i], radar_range[i], reaction_time[i]
+                )
+                self.assertEqual(batch.intercept_distance[i], scalar.intercept_distance)
+                self.assertEqual(batch.intercept_time[i], scalar.intercept_time)
+                self.assertEqual(
+                    bool(batch.intercept_possible[i]), scalar.intercept_possible
+                )
+
+
+class TestCarCollisionSolver(unittest.TestCase):
+
+    def test_solve_scalar(self) -> None:
+        result = CarCollisionSolver.solve_scalar(45, 27, 200, "mph", "feet")
+        self.assertAlmostEqual(result.speed_difference, 18.0)
+        self.assertAlmostEqual(result.time_to_collision, 200 / 5280 / 18)
+        self.assertTrue(result.will_collide)
+
+    def test_solve_non_closing(self) -> None:
+        result = CarCollisionSolver.solve([27, 30, np.nan], [45, 30, 10], 1.0)
+        self.assertTrue(np.isposinf(result.time_to_collision[0]))
+        self.assertTrue(np.isposinf(result.time_to_collision[1]))
+        self.assertTrue(np.isnan(result.time_to_collision[2]))
+        self.assertFalse(result.will_collide.any())
+
+    def test_solve_mixed_units(self) -> None:
+        result = CarCollisionSolver.solve(
+            [60, 96.5604],
+            [30, 48.2802],
+            [1, 1609.34],
+            ["mph", "km/h"],
+            ["miles", "meters"],
+        )
+        np.testing.assert_allclose(result.time_to_collision, [1 / 30, 1 / 30])
+
+
+class TestBatch(unittest.TestCase):
+
+    def test_run_batch_csv(self) -> None:
+        input_stream = StringIO(
+            "drone_speed,radar_range,reaction_time,speed_unit\n30,4,2,\n30,2,5,mph\n"
+        )
+        output_stream = StringIO()
+        count = batch.run_batch("drone", input_stream, output_stream, chunk_size=1)
+        self.assertEqual(count, 2)
+        lines = output_stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[1].endswith(",1.0,1.5,5.0,True"))
+        self.assertTrue(lines[2].endswith(",False"))
+
+    def test_run_batch_jsonl(self) -> None:
+        input_stream = StringIO(
+            '{"speed_car_a": 45, "speed_car_b": 27, "initial_distance": 200, "distance_unit": "feet"}\n'
+        )
+        output_stream = StringIO()
+        batch.run_batch("car", input_stream, output_stream, input_format="jsonl")
+        record = json.loads(output_stream.getvalue())
+        self.assertAlmostEqual(record["time_to_collision_hours"], 200 / 5280 / 18)
+        self.assertTrue(record["will_collide"])
+
+    def test_run_batch_jsonl_no_collision(self) -> None:
+        input_stream = StringIO('{"speed_car_a": 30, "speed_car_b": 60, "initial_distance": 1}\n')
+        output_stream = StringIO()
+        batch.run_batch("car", input_stream, output_stream, input_format="jsonl")
+        line = output_stream.getvalue()
+        self.assertNotIn("Infinity", line)
+        record = json.loads(line, parse_constant=self.fail)
+        self.assertIsNone(record["time_to_collision_hours"])
+        self.assertFalse(record["will_collide"])
+
+    def test_validate_record(self) -> None:
+        record = {"speed_car_a": "60", "speed_car_b": 40, "initial_distance": 1}
+        self.assertEqual(batch.validate_record("car", dict(record, speed_unit=""))["speed_car_a"], 60.0)
+        with self.assertRaisesRegex(ValueError, "Missing column"):
+            batch.validate_record("car", {"speed_car_a": 60})
+        with self.assertRaisesRegex(ValueError, "Invalid unit"):
+            batch.validate_record("car", dict(record, speed_unit="furlongs"))
+        with self.assertRaisesRegex(ValueError, "Invalid number"):
+            batch.validate_record("car", dict(record, initial_distance="nan"))
+        with self.assertRaisesRegex(ValueError, "Negative input"):
+            batch.validate_record("drone", {"drone_speed": -5, "radar_range": 1, "reaction_time": 0})
+        planar = {"threat_x": -3, "threat_y": -4, "threat_heading": -90, "threat_speed": 60}
+        planar.update(interceptor_speed=100, launch_delay=0)
+        self.assertEqual(batch.validate_record("planar", planar)["threat_x"], -3.0)
+
+    def test_run_batch_missing_column(self) -> None:
+        with self.assertRaises(ValueError):
+            batch.run_batch("car", StringIO("speed_car_a\n1\n"), StringIO())
+
+
+class TestTrajectoryBuffer(unittest.TestCase):
+
+    def test_append_is_bounded(self) -> None:
+        buffer = TrajectoryBuffer(capacity=16)
+        for i in range(1000):
+            buffer.append(i, i * 2)
+        self.assertLessEqual(len(buffer), 16)
+        x, y = buffer.points()
+        self.assertEqual(x[0], 0)
+        self.assertEqual(x[-1], 999)
+        self.assertTrue(np.all(np.diff(x) > 0))
+        np.testing.assert_array_equal(y, x * 2)
+
+    def test_decimate_keeps_extremes(self) -> None:
+        buffer = TrajectoryBuffer(capacity=8)
+        buffer.extend(np.arange(8), [0, 5, -3, 1, 2, 2, 9, 2])
+        buffer.decimate()
+        x, y = buffer.points()
+        np.testing.assert_array_equal(x, [1, 2, 4, 6])
+        np.testing.assert_array_equal(y, [5, -3, 2, 9])
+
+    def test_invalid_capacity(self) -> None:
+        with self.assertRaises(ValueError):
+            TrajectoryBuffer(capacity=10)
+
+
+class TestTrajectory(unittest.TestCase):
+
+    def test_at_interpolates_and_extrapolates(self) -> None:
+        path = Trajectory([0, 2, 4], [0, 0, 4])
+        self.assertEqual(path.at(1), 0)
+        self.assertEqual(path.at(3), 2)
+        self.assertEqual(path.at(6), 8)
+
+    def test_keyframes(self) -> None:
+        path = Trajectory([0, 2, 4], [0, 0, 4])
+        t, y = path.keyframes(0, 2)
+        np.testing.assert_array_equal(t, [2])
+        t, y = path.keyframes(-1, 10)
+        np.testing.assert_array_equal(t, [0, 2, 4])
+
+    def test_drone_event_is_exact(self) -> None:
+        paths = DroneInterceptSolver.trajectories(30, 4, 2)
+        self.assertTrue(paths.intercepted)
+        self.assertAlmostEqual(paths.event_time, 5.0)
+        self.assertAlmostEqual(paths.enemy.at(paths.event_time), paths.event_position)
+        self.assertAlmostEqual(paths.ours.at(paths.event_time), paths.event_position)
+
+    def test_car_event_is_exact(self) -> None:
+        paths = CarCollisionSolver.trajectories(45, 27, 0.5)
+        self.assertAlmostEqual(paths.event_time, 0.5 / 18 * 60)
+        self.assertAlmostEqual(paths.car_a.at(paths.event_time), paths.event_position)
+        self.assertAlmostEqual(paths.car_b.at(paths.event_time), paths.event_position)
+
+
+class TestSweep(unittest.TestCase):
+
+    def test_grid_matches_scalar_solve(self) -> None:
+        x = np.linspace(10, 100, 7)
+        y = np.linspace(0, 10, 5)
+        fixed = {"drone_speed": 30, "radar_range": 2, "reaction_time": 5}
+        result = sweep.solve_drone_grid("drone_speed", x, "reaction_time", y, fixed)
+        self.assertEqual(result.intercept_distance.shape, (5, 7))
+        expected = DroneInterceptSolver.solve_scalar(x[3], 2, y[2])
+        self.assertAlmostEqual(
+            result.intercept_distance[2, 3], expected.intercept_distance
+        )
+        self.assertEqual(result.intercept_possible[2, 3], expected.intercept_possible)
+
+    def test_coarse_to_fine_levels(self) -> None:
+        self.assertEqual(sweep.refinement_strides(1000, 64), [16, 8, 4, 2, 1])
+        self.assertEqual(sweep.refinement_strides(10, 64), [1])
+        x = np.linspace(1, 100, 100)
+        fixed = {"drone_speed": 30, "radar_range": 2, "reaction_time": 5}
+        levels = list(
+            sweep.sweep_drone_grid("drone_speed", x, "radar_range", x, fixed, 25)
+        )
+        self.assertEqual([level.stride for level in levels], [4, 2, 1])
+        self.assertEqual(levels[-1].intercept_distance.shape, (100, 100))
+
+    def test_boundary_and_colours(self) -> None:
+        mask = np.array([[True, True, False], [True, False, False]])
+        np.testing.assert_array_equal(
+            sweep.feasibility_boundary(mask),
+            [[False, False, True], [False, True, False]],
+        )
+        x = np.linspace(1, 100, 20)
+        fixed = {"drone_speed": 30, "radar_range": 2, "reaction_time": 5}
+        result = sweep.solve_drone_grid("drone_speed", x, "reaction_time", x, fixed)
+        rgb = sweep.heatmap_rgb(result, max_distance=1.0)
+        self.assertEqual(rgb.shape, (20, 20, 3))
+        self.assertEqual(rgb.dtype, np.uint8)
+
+    def test_invalid_parameters(self) -> None:
+        with self.assertRaises(ValueError):
+            sweep.solve_drone_grid("speed", [1], "radar_range", [1], {})
+        with self.assertRaises(ValueError):
+            sweep.solve_drone_grid("radar_range", [1], "radar_range", [1], {})
+
+
+class TestSweepExecutor(unittest.TestCase):
+
+    def test_matches_direct_solve(self) -> None:
+        axes = {
+            "speed_car_a": np.linspace(0, 90, 30),
+            "speed_car_b": np.linspace(0, 90, 20),
+        }
+        fixed = {"initial_distance": 2}
+        with SweepExecutor("car", axes, fixed, chunk_size=64, max_workers=1) as executor:
+            results = executor.run()
+            expected = CarCollisionSolver.solve(
+                axes["speed_car_a"][:, np.newaxis], axes["speed_car_b"], 2
+            )
+            self.assertEqual(executor.progress(), 1.0)
+            np.testing.assert_array_equal(results["will_collide"], expected.will_collide)
+            np.testing.assert_allclose(
+                results["time_to_collision"], expected.time_to_collision
+            )
+
+    def test_invalid_inputs(self) -> None:
+        with self.assertRaises(ValueError):
+            SweepExecutor("drone", {"speed": [1]}, {"radar_range": 1})
+        with self.assertRaises(ValueError):
+            SweepExecutor("drone", {"drone_speed": [1]}, {"radar_range": 1})
+
+    def test_interceptor_speed(self) -> None:
+        same = DroneInterceptSolver.solve(30, 4, 2)
+        explicit = DroneInterceptSolver.solve(30, 4, 2, interceptor_speed=30)
+        self.assertAlmostEqual(
+            float(explicit.intercept_distance), float(same.intercept_distance)
+        )
+        self.assertAlmostEqual(
+            float(explicit.intercept_time), float(same.intercept_time)
+        )
+        faster = DroneInterceptSolver.solve(30, 4, 2, interceptor_speed=90)
+        self.assertAlmostEqual(float(faster.intercept_distance), 2.25)
+
+
+class TestInverseSolver(unittest.TestCase):
+
+    def test_feasibility_thresholds(self) -> None:
+        inputs = {"drone_speed": 30, "radar_range": 2, "reaction_time": 5}
+        expected = {"drone_speed": 24, "radar_range": 2.5, "reaction_time": 4}
+        for solve_for, value in expected.items():
+            with self.subTest(solve_for):
+                others = {k: v for k, v in inputs.items() if k != solve_for}
+                result = InverseSolver.solve_scalar(
+                    "drone", "intercept_distance", 0, solve_for, **others
+                )
+                self.assertTrue(result.found)
+                self.assertAlmostEqual(result.value, value)
+        others = {"radar_range": 2, "reaction_time": 1}
+        result = InverseSolver.solve_scalar(
+            "drone", "intercept_distance", 0, "drone_speed", **others
+        )
+        self.assertFalse(result.increasing)
+
+    def test_bisection_matches_closed_form(self) -> None:
+        speeds = np.linspace(30, 90, 7)
+        closed = InverseSolver.solve(
+            "car",
+            "time_to_collision",
+            0.5,
+            "speed_car_a",
+            speed_car_b=speeds,
+            initial_distance=2,
+        )
+        original = inverse_solver.CLOSED_FORMS["car"]
+        inverse_solver.CLOSED_FORMS["car"] = lambda *args: None
+        try:
+            bisected = InverseSolver.solve(
+                "car",
+                "time_to_collision",
+                0.5,
+                "speed_car_a",
+                speed_car_b=speeds,
+                initial_distance=2,
+            )
+        finally:
+            inverse_solver.CLOSED_FORMS["car"] = original
+        np.testing.assert_allclose(closed.value, speeds + 4)
+        np.testing.assert_allclose(bisected.value, closed.value)
+
+    def test_unreachable_target(self) -> None:
+        result = InverseSolver.solve(
+            "drone",
+            "intercept_distance",
+            [0.5, 5],
+            "reaction_time",
+            drone_speed=30,
+            radar_range=2,
+        )
+        np.testing.assert_array_equal(result.found, [True, False])
+        self.assertTrue(np.isnan(result.value[1]))
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            InverseSolver.solve("drone", "intercept_possible", 0, "drone_speed")
+        with self.assertRaises(ValueError):
+            InverseSolver.solve("drone", "intercept_distance", 0, "drone_speed")
+
+
+class TestResultCache(unittest.TestCase):
+
+    def test_hits_and_misses(self) -> None:
+        cache = ResultCache(maxsize=4)
+        calls = []
+        key = cache.key("drone", 30, 2, 5)
+        for _ in range(3):
+            cache.get_or_compute(key, lambda: calls.append(1) or "entry")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.stats()["hits"], 2)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_unit_round_trip_shares_key(self) -> None:
+        cache = ResultCache()
+        speed = UnitConverter.to_miles_per_hour(
+            UnitConverter.from_miles_per_hour(30.0, "km/h"), "km/h"
+        )
+        self.assertEqual(cache.key(speed, 2.0), cache.key(30.0, 2.0))
+        self.assertNotEqual(cache.key(30.01, 2.0), cache.key(30.0, 2.0))
+
+    def test_same_scenario(self) -> None:
+        cache = ResultCache()
+        key = cache.key("drone", 30.0, 2.0, None)
+        self.assertTrue(ResultCache.same_scenario(cache.key("drone", 30.0 + 1e-12, 2.0, None), key))
+        # 100 feet clamped to 1 mile by a spin box is another scenario
+        self.assertFalse(ResultCache.same_scenario(cache.key("drone", 30.0, 1.0, None), key))
+        self.assertFalse(ResultCache.same_scenario(cache.key("car", 30.0, 2.0, None), key))
+        self.assertFalse(ResultCache.same_scenario(key, None))
+
+    def test_unit_switch_on_clamped_value_solves(self) -> None:
+        try:
+            from PySide6.QtWidgets import QApplication
+        except ImportError:
+            self.skipTest("PySide6 is not installed")
+        import configparser
+        import os
+
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from drone_intercept import DroneInterceptWindow
+
+        app = QApplication.instance() or QApplication([])
+        config = configparser.ConfigParser()
+        config.read("config.ini")
+        window = DroneInterceptWindow(config)
+        window.wait_for_calculation()
+        window.distance_unit_combo.setCurrentText("feet")
+        window.radar_range.setValue(100)
+        window.reaction_time.setValue(0)
+        window.wait_for_calculation()
+        # 100 feet clamps to the 1 mile minimum, which must be solved afresh
+        window.distance_unit_combo.setCurrentText("miles")
+        window.wait_for_calculation()
+        self.assertEqual(window.radar_range.value(), 1.0)
+        key = window.result_cache.key(*window.scenario())
+        self.assertEqual(window.current_key, key)
+        fresh = window.solve_scenario(*key)
+        self.assertEqual(window.current_entry, fresh)
+        window.close()
+        app.processEvents()
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = ResultCache(maxsize=2)
+        cache.put(("a",), 1)
+        cache.put(("b",), 2)
+        cache.get(("a",))
+        cache.put(("c",), 3)
+        self.assertIn(("a",), cache)
+        self.assertNotIn(("b",), cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_concurrent_use(self) -> None:
+        cache = ResultCache(maxsize=8)
+
+        def worker(offset):
+            for i in range(500):
+                key = cache.key((i + offset) % 16)
+                cache.get_or_compute(key, lambda: i)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(cache), 8)
+        self.assertEqual(cache.hits + cache.misses, 2000)
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+
+    def test_compare(self) -> None:
+        baseline = {"fast": 10.0, "slow": 10.0, "removed": 1.0}
+        results = {"fast": 12.0, "slow": 14.0, "new": 5.0}
+        regressions = suite.compare(results, baseline, threshold=0.3)
+        self.assertEqual([name for name, *_ in regressions], ["slow"])
+        self.assertAlmostEqual(regressions[0][3], 1.4)
+        regressions = suite.compare(results, baseline, 0.3, {"slow": 0.5})
+        self.assertEqual(regressions, [])
+
+
+class TestFrameProfiler(unittest.TestCase):
+
+    def test_percentiles(self) -> None:
+        histogram = Histogram()
+        for ms in range(1, 101):
+            histogram.record(ms / 1000)
+        for percent in (50, 95, 99):
+            expected = percent / 1000
+            self.assertAlmostEqual(
+                histogram.percentile(percent), expected, delta=expected * 0.05
+            )
+        self.assertEqual(int(histogram.counts.sum()), 100)
+        self.assertTrue(math.isnan(Histogram().percentile(50)))
+
+    def test_jitter_and_dropped_frames(self) -> None:
+        profiler = FrameProfiler(interval=0.05)
+        for now in (0.0, 0.051, 0.1, 0.25):
+            profiler.tick_started(now)
+        self.assertEqual(profiler.dropped, 2)
+        self.assertEqual(profiler.histograms["jitter"].count, 3)
+        self.assertAlmostEqual(profiler.histograms["jitter"].maximum, 0.1)
+
+
+class TestSimulationClock(unittest.TestCase):
+
+    def test_frame_rate_independent(self) -> None:
+        # One wall second at 60x is one simulated minute at any frame rate
+        for frames in (5, 20, 60, 144):
+            clock = SimulationClock(start_time=-5, warp=60)
+            for _ in range(frames):
+                clock.advance_by(1 / frames)
+            self.assertAlmostEqual(clock.time, -4, delta=clock.step)
+
+    def test_warp_range(self) -> None:
+        clock = SimulationClock(warp=1e9)
+        self.assertEqual(clock.warp, 10000)
+        clock.set_warp(0)
+        self.assertEqual(clock.warp, 0.01)
+        top = SimulationClock.max_position()
+        self.assertAlmostEqual(SimulationClock.warp_from_position(top), 10000)
+        self.assertAlmostEqual(SimulationClock.warp_from_position(0), 0.01)
+        self.assertEqual(SimulationClock.position_from_warp(60), 378)
+
+    def test_stalls_are_capped(self) -> None:
+        clock = SimulationClock(warp=60)
+        clock.advance_by(0.25)
+        clock.advance_by(10)
+        self.assertAlmostEqual(clock.time, 0.5, delta=clock.step)
+
+
+class TestDroneAssignmentSolver(unittest.TestCase):
+
+    def test_min_cost_assignment_is_optimal(self) -> None:
+        rng = np.random.default_rng(3)
+        for shape in ((5, 5), (4, 7), (7, 4), (6, 6)):
+            cost = rng.uniform(0, 100, shape)
+            short, long = sorted(shape)
+            costs = cost if shape[0] <= shape[1] else cost.T
+            best = min(
+                costs[range(short), list(perm)].sum()
+                for perm in itertools.permutations(range(long), short)
+            )
+            for method in ("augmenting_path", "auction"):
+                rows, cols = DroneAssignmentSolver.min_cost_assignment(cost, method)
+                self.assertEqual(len(set(cols)), short)
+                self.assertAlmostEqual(cost[rows, cols].sum(), best, places=6)
+
+    def test_assign(self) -> None:
+        # The slow interceptor launches too late for the fast threat
+        threat_speed = [600, 60, 60]
+        threat_range = [20, 50, 10]
+        interceptor_speed = [1000, 100]
+        reaction_time = [0.5, 3]
+        result = DroneAssignmentSolver.assign(
+            threat_speed, threat_range, interceptor_speed, reaction_time
+        )
+        self.assertEqual(result.threat.tolist(), [0, 2])
+        self.assertEqual(result.interceptor.tolist(), [0, 1])
+        self.assertEqual(result.unassigned.tolist(), [1])
+        self.assertAlmostEqual(result.intercept_time[1], 5.625)
+        result = DroneAssignmentSolver.assign(
+            threat_speed,
+            threat_range,
+            interceptor_speed,
+            reaction_time,
+            objective="intercept_distance",
+        )
+        self.assertEqual(result.threat.tolist(), [1, 2])
+        self.assertEqual(result.unassigned.tolist(), [0])
+        self.assertAlmostEqual(result.intercept_distance[1], 4.375)
+        with self.assertRaises(ValueError):
+            DroneAssignmentSolver.assign([60], [10], [100], [1], objective="fuel")
+
+    def test_grounded_interceptor_is_infeasible(self) -> None:
+        result = DroneInterceptSolver.solve([60, 60], [5, 5], [1, 1], [0, -10])
+        self.assertEqual(result.intercept_possible.tolist(), [False, False])
+        self.assertTrue(np.isposinf(result.intercept_time).all())
+        planar = PlanarInterceptSolver.solve_scalar(3, 4, 180, 60, 0, 0)
+        self.assertFalse(planar.intercept_possible)
+        # The grounded interceptor is left out instead of failing the assignment
+        result = DroneAssignmentSolver.assign([60, 50], [5, 6], [0, 100], [1, 1])
+        self.assertEqual(result.interceptor.tolist(), [1])
+        self.assertEqual(len(result.unassigned), 1)
+
+
+class TestLaneCollisionSolver(unittest.TestCase):
+
+    def test_merged_cluster_is_hit(self) -> None:
+        # Car 1 hits car 2 first, then car 0 hits the merged pair at 20 mph
+        result = LaneCollisionSolver.solve([10, 0, 11], [30, 60, 20])
+        np.testing.assert_allclose(result.time, [0.1, 0.275])
+        np.testing.assert_allclose(result.position, [13, 16.5])
+        self.assertEqual(result.rear.tolist(), [0, 1])
+        self.assertEqual(result.front.tolist(), [2, 0])
+
+    def test_random_lane(self) -> None:
+        rng = np.random.default_rng(0)
+        positions = rng.uniform(0, 100, 2000)
+        speeds = rng.uniform(40, 80, 2000)
+        result = LaneCollisionSolver.solve(positions, speeds)
+        self.assertTrue((np.diff(result.time) >= 0).all())
+
+        # Cars no faster than every car ahead are never merged into another
+        lane_speeds = speeds[np.argsort(positions)]
+        slowest_ahead = np.minimum.accumulate(lane_speeds[::-1])[::-1]
+        self.assertEqual(len(result.time), (lane_speeds > slowest_ahead).sum())
+
+        # The first collision is the earliest of the initial neighbour pairs
+        times = LaneCollisionSolver.pair_times(np.sort(positions), lane_speeds)
+        self.assertEqual(result.time[0], times.min())
+        first = LaneCollisionSolver.solve(positions, speeds, max_collisions=3)
+        np.testing.assert_array_equal(first.time, result.time[:3])
+
+
+class TestPlanarInterceptSolver(unittest.TestCase):
+
+    def test_head_on_matches_line_solver(self) -> None:
+        rng = np.random.default_rng(0)
+        speed = rng.uniform(10, 300, 1000)
+        interceptor_speed = rng.uniform(10, 300, 1000)
+        radar_range = rng.uniform(1, 50, 1000)
+        delay = rng.uniform(0, 10, 1000)
+        x, y, heading = PlanarInterceptSolver.detection_point(
+            radar_range, rng.uniform(0, 360, 1000)
+        )
+        planar = PlanarInterceptSolver.solve(
+            x, y, heading, speed, interceptor_speed, delay
+        )
+        line = DroneInterceptSolver.solve(speed, radar_range, delay, interceptor_speed)
+        possible = line.intercept_possible
+        self.assertTrue(planar.intercept_possible[possible].all())
+        np.testing.assert_allclose(
+            planar.intercept_time[possible], line.intercept_time[possible]
+        )
+        np.testing.assert_allclose(
+            planar.intercept_distance[possible],
+            line.intercept_distance[possible],
+            atol=1e-9,
+        )
+
+    def test_crossing_and_escaping_threats(self) -> None:
+        # Crossing 10 miles north at 1 mile/min, chased at 2 miles/min
+        result = PlanarInterceptSolver.solve_scalar(0, 10, 90, 60, 120, 0)
+        self.assertAlmostEqual(result.intercept_time, 10 / math.sqrt(3))
+        self.assertAlmostEqual(result.intercept_y, 10)
+        self.assertAlmostEqual(result.interceptor_heading, 30)
+
+        # Flying away faster than our drone
+        result = PlanarInterceptSolver.solve_scalar(0, 10, 0, 60, 30, 0)
+        self.assertFalse(result.intercept_possible)
+        self.assertTrue(math.isnan(result.intercept_time))
+
+
+class TestKinematicsEngine(unittest.TestCase):
+
+    def test_constant_speed_matches_closed_form(self) -> None:
+        for args in [(100, 10, 2), (60, 5, 6), (300, 40, 0)]:
+            rk4 = KinematicsEngine.drone_trajectories(*args)
+            exact = DroneInterceptSolver.trajectories(*args)
+            self.assertEqual(rk4.intercepted, exact.intercepted)
+            self.assertAlmostEqual(rk4.event_time, exact.event_time, places=9)
+            self.assertAlmostEqual(rk4.event_position, exact.event_position, places=9)
+        rk4 = KinematicsEngine.car_trajectories(60, 30, 5)
+        self.assertAlmostEqual(rk4.event_time, 10, places=9)
+        self.assertAlmostEqual(rk4.event_position, 10, places=9)
+        self.assertFalse(KinematicsEngine.car_trajectories(30, 60, 5).will_collide)
+
+    def test_acceleration_and_in_step_event(self) -> None:
+        # Car A speeds up by 60 mph per minute from minute 1: x = 1 + s + s^2 / 2
+        profile = AccelerationProfile([1.0], [60.0])
+        result = KinematicsEngine.car_trajectories(60, 0, 10, profile_a=profile)
+        s = -1 + math.sqrt(19)
+        self.assertAlmostEqual(result.event_time, 1 + s, places=9)
+
+        # Braking from 60 mph at 120 mph per minute: x = t - t^2 reaches
+        # 0.2 miles and turns back well inside one 5 minute step
+        braking = Body(0.0, 60.0, profile=AccelerationProfile([0.0], [-120.0]))
+        engine = KinematicsEngine([braking], [Event("reach", (-1.0,), 0.2)])
+        engine.run(10, 5.0)
+        self.assertEqual(engine.steps, 1)
+        self.assertAlmostEqual(
+            engine.event_time[0], (1 - math.sqrt(0.2)) / 2, places=9
+        )
+
+
+class TestBrakingCollisionSolver(unittest.TestCase):
+
+    def test_without_braking_matches_constant_speeds(self) -> None:
+        rng = np.random.default_rng(0)
+        speed_a, speed_b = rng.uniform(0, 90, (2, 1000))
+        distance = rng.uniform(0, 2, 1000)
+        constant = CarCollisionSolver.solve(speed_a, speed_b, distance)
+        braking = BrakingCollisionSolver.solve(speed_a, speed_b, distance)
+        np.testing.assert_array_equal(braking.will_collide, constant.will_collide)
+        np.testing.assert_allclose(
+            braking.time_to_collision, constant.time_to_collision
+        )
+
+    def test_reaction_delay(self) -> None:
+        # Car B brakes at 15 mph/s; 1.5 s later the gap of 52.8 feet has
+        # shrunk by 0.0046875 miles and closes at a steady 22.5 mph
+        result = BrakingCollisionSolver.solve_scalar(
+            60, 60, 52.8, 15, 15, 1.5, "mph", "feet"
+        )
+        self.assertTrue(result.will_collide)
+        self.assertAlmostEqual(
+            result.time_to_collision * 3600, 1.5 + 0.0053125 / 22.5 * 3600
+        )
+        self.assertAlmostEqual(result.impact_speed, 22.5)
+
+        # A longer gap: both cars stop in time
+        result = BrakingCollisionSolver.solve_scalar(
+            60, 60, 200, 15, 15, 1.5, "mph", "feet"
+        )
+        self.assertFalse(result.will_collide)
+        self.assertTrue(math.isinf(result.time_to_collision))
+
+
+class TestStreamPipeline(unittest.TestCase):
+
+    def test_run_matches_batch(self) -> None:
+        lines = "".join(
+            json.dumps({"drone_speed": 30, "radar_range": 4 + i, "reaction_time": 2})
+            + "\n"
+            for i in range(7)
+        )
+        output_stream = StringIO()
+        pipeline = StreamPipeline("drone", chunk_size=3, max_wait=10)
+        stats = pipeline.run(StringIO(lines), output_stream)
+        self.assertEqual((stats.records, stats.chunks), (7, 3))
+        self.assertEqual(stats.latency.count, 7)
+
+        expected = StringIO()
+        batch.run_batch("drone", StringIO(lines), expected, input_format="jsonl")
+        self.assertEqual(output_stream.getvalue(), expected.getvalue())
+
+    def test_bad_records_are_rejected_alone(self) -> None:
+        lines = (
+            '{"speed_car_a": 60, "speed_car_b": 40, "initial_distance": 1}\n'
+            '{"speed_car_a": 60, "initial_distance": 1}\n'
+            "not json\n"
+            '{"speed_car_a": 60, "speed_car_b": 40, "initial_distance": 1, "speed_unit": ["x"]}\n'
+            '{"speed_car_a": 50, "speed_car_b": 40, "initial_distance": 1}\n'
+        )
+        output_stream = StringIO()
+        with self.assertLogs("stream_pipeline", logging.WARNING):
+            stats = StreamPipeline("car").run(StringIO(lines), output_stream)
+        self.assertEqual((stats.records, stats.rejected), (2, 3))
+        self.assertEqual(len(output_stream.getvalue().splitlines()), 2)
+
+    def test_partial_chunk_after_max_wait(self) -> None:
+        pipeline = StreamPipeline("car", chunk_size=100, max_wait=0.01)
+        self.assertEqual(pipeline.queue.maxsize, 200)
+        for i in range(2):
+            pipeline.queue.put(({"speed_car_a": i}, 0.0))
+        # The input is still open, yet the two records come out as a chunk
+        records, arrivals = next(pipeline.batches())
+        self.assertEqual(len(records), 2)
+        self.assertEqual(arrivals, [0.0, 0.0])
+
+
+class TestSolverService(unittest.TestCase):
+
+    async def post(self, port, path, payload) -> tuple:
+        body = json.dumps(payload).encode()
+        return await self.send(
+            port,
+            f"POST {path} HTTP/1.1\r\nConnection: close\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n".encode() + body,
+        )
+
+    async def send(self, port, request) -> tuple:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(request)
+        response = await reader.read()
+        writer.close()
+        head, _, body = response.partition(b"\r\n\r\n")
+        # Strict JSON: Infinity or NaN in a body fails the test
+        return int(head.split()[1]), json.loads(body, parse_constant=self.fail)
+
+    def test_concurrent_requests_share_a_batch(self) -> None:
+        records = [
+            {"drone_speed": 30, "radar_range": 4 + i, "reaction_time": 2}
+            for i in range(5)
+        ]
+
+        async def scenario():
+            service = SolverService(window=0.05)
+            port = await service.start(port=0)
+            try:
+                return service, await asyncio.gather(
+                    *(self.post(port, "/drone", record) for record in records)
+                )
+            finally:
+                await service.stop()
+
+        service, responses = asyncio.run(scenario())
+        expected = batch.solve_chunk("drone", records, "mph", "miles")
+        for i, (status, result) in enumerate(responses):
+            self.assertEqual(status, 200)
+            for name, value in result.items():
+                self.assertAlmostEqual(value, float(expected[name][i]))
+        stats = service.stats.to_dict()
+        self.assertEqual((stats["requests"], stats["batches"]), (5, 1))
+        self.assertEqual(stats["batch_size"]["max"], 5)
+
+    def test_bad_request_is_rejected_alone(self) -> None:
+        async def scenario():
+            service = SolverService()
+            port = await service.start(port=0)
+            try:
+                return service, await asyncio.gather(
+                    self.post(port, "/car", {"speed_car_a": "fast"}),
+                    self.post(port, "/car", dict(record, speed_car_b="inf")),
+                    self.post(port, "/car", dict(record, speed_unit=["x"])),
+                    self.send(port, b"POST /car HTTP/1.1\r\nContent-Length: 999999\r\n\r\n"),
+                    self.send(port, b"nonsense\r\n\r\n"),
+                    self.post(port, "/car", record),
+                )
+            finally:
+                await service.stop()
+
+        record = {"speed_car_a": 30, "speed_car_b": 60, "initial_distance": 1}
+        service, responses = asyncio.run(scenario())
+        statuses = [status for status, _ in responses]
+        self.assertEqual(statuses, [400, 400, 400, 400, 400, 200])
+        self.assertEqual(service.stats.errors, 5)
+        status, result = responses[-1]
+        # No collision: null, not the Infinity that strict JSON parsers reject
+        self.assertIsNone(result["time_to_collision_hours"])
+        self.assertFalse(result["will_collide"])
@@ -0,0 +1,60 @@
+import numpy as np
+
+"""
+Precomputed piecewise-linear trajectories.
+
+A trajectory is a list of keyframes (time, position) with constant velocity
+in between. Past the last keyframe it keeps the velocity of the last
+segment, so a path that never ends (cars that never collide) needs only two
+keyframes. Animations reveal a trajectory up to the current time instead
+of integrating it tick by tick, so positions are exact at any playback speed.
+
+This module does not import PySide6.
+"""
+
+
+class Trajectory:
+    """
+    Piecewise-linear position over time
+    """
+
+    def __init__(self, t, y) -> None:
+        """
+        Parameters:
+            t (array_like): Keyframe times, strictly increasing, at least two.
+            y (array_like): Positions at the keyframe times.
+        """
+        self.t = np.asarray(t, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        if len(self.t) < 2 or len(self.t) != len(self.y) or np.any(np.diff(self.t) <= 0):
+            raise ValueError("Trajectory needs at least two increasing keyframes")
+        self.end_velocity = (self.y[-1] - self.y[-2]) / (self.t[-1] - self.t[-2])
+
+    def at(self, time: float) -> float:
+        """
+        Returns the position at a time.
+
+        Parameters:
+            time (float): The time.
+
+        Returns:
+            float: The position, extrapolated with the last velocity past the end.
+        """
+        if time > self.t[-1]:
+            return float(self.y[-1] + self.end_velocity * (time - self.t[-1]))
+        return float(np.interp(time, self.t, self.y))
+
+    def keyframes(self, start: float, end: float):
+        """
+        Returns the keyframes with start < time <= end.
+
+        Parameters:
+            start (float): Exclusive start time.
+            end (float): Inclusive end time.
+
+        Returns:
+            tuple: Arrays of keyframe times and positions.
+        """
+        first = np.searchsorted(self.t, start, side="right")
+        last = np.searchsorted(self.t, end, side="right")
+        return self.t[first:last], self.y[first:last]
@@ -0,0 +1,110 @@
+import numpy as np
+
+"""
+Bounded point storage for animated chart series.
+
+A simulation appends points as it runs. Once the buffer is full it is
+decimated in place with min/max decimation: every bucket of four points
+keeps its lowest and highest point, in time order. The buffer then holds
+half as many points spread over the whole run, so memory and redraw cost
+stay fixed however long the simulation runs, while peaks and the overall
+shape of the trajectory are kept.
+
+This module does not import PySide6; series are fed from it with
+replaceNp() (see Simulation.reveal_path).
+"""
+
+
+class TrajectoryBuffer:
+    """
+    Fixed-capacity x/y point buffer with min/max decimation
+    """
+
+    # Points per decimation bucket; each bucket is reduced to two points
+    BUCKET_SIZE = 4
+
+    def __init__(self, capacity: int = 2048) -> None:
+        """
+        Parameters:
+            capacity (int): The maximum number of points held. Must be a
+                positive multiple of 4.
+        """
+        if capacity <= 0 or capacity % self.BUCKET_SIZE:
+            raise ValueError(f"Invalid capacity: {capacity}")
+        self.capacity = capacity
+        self.x = np.empty(capacity, dtype=np.float64)
+        self.y = np.empty(capacity, dtype=np.float64)
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def append(self, x: float, y: float) -> bool:
+        """
+        Appends a point, decimating the buffer first if it is full.
+
+        Returns:
+            bool: True if the buffer was decimated.
+        """
+        decimated = self.size == self.capacity
+        if decimated:
+            self.decimate()
+        self.x[self.size] = x
+        self.y[self.size] = y
+        self.size += 1
+        return decimated
+
+    def extend(self, x, y) -> None:
+        """
+        Appends arrays of points, decimating as often as needed.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        start = 0
+        while start < len(x):
+            if self.size == self.capacity:
+                self.decimate()
+            count = min(len(x) - start, self.capacity - self.size)
+            self.x[self.size : self.size + count] = x[start : start + count]
+            self.y[self.size : self.size + count] = y[start : start + count]
+            self.size += count
+            start += count
+
+    def decimate(self) -> None:
+        """
+        Halves the number of points by keeping the minimum and maximum
+        point of each bucket. A trailing partial bucket is kept as is.
+        """
+        n = self.size - self.size % self.BUCKET_SIZE
+        if n == 0:
+            return
+        xb = self.x[:n].reshape(-1, self.BUCKET_SIZE)
+        yb = self.y[:n].reshape(-1, self.BUCKET_SIZE)
+        rows = np.arange(len(xb))
+        imin = yb.argmin(axis=1)
+        imax = yb.argmax(axis=1)
+        first = np.minimum(imin, imax)
+        second = np.maximum(imin, imax)
+
+        # Fancy indexing copies, so writing back over the prefix is safe
+        x_kept = np.column_stack((xb[rows, first], xb[rows, second])).ravel()
+        y_kept = np.column_stack((yb[rows, first], yb[rows, second])).ravel()
+        tail = self.size - n
+        kept = len(x_kept)
+        self.x[kept : kept + tail] = self.x[n : self.size]
+        self.y[kept : kept + tail] = self.y[n : self.size]
+        self.x[:kept] = x_kept
+        self.y[:kept] = y_kept
+        self.size = kept + tail
+
+    def clear(self) -> None:
+        """
+        Removes all points.
+        """
+        self.size = 0
+
+    def points(self):
+        """
+        Returns views of the stored x and y values, oldest first.
+        """
+        return self.x[: self.size], self.y[: self.size]
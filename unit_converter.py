@@ -1,10 +1,103 @@
 import logging
+import numpy as np
 
-# Set up logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - %(filename)s - %(lineno)d - %(message)s",
-)
+logger = logging.getLogger(__name__)
+
+
+class UnitRegistry:
+    """
+    Table of units of one kind with a precomputed conversion matrix.
+
+    Converting between any two registered units is one lookup and one multiply.
+    """
+
+    def __init__(self, base_unit: str, to_base: dict) -> None:
+        """
+        Builds the N x N factor matrix from each unit's factor into the base unit.
+
+        Parameters:
+            base_unit (str): The unit every factor converts into.
+            to_base (dict): Maps each unit name to the factor that converts it to base_unit.
+        """
+        self.base_unit = base_unit
+        self.units = list(to_base)
+        self.index = {unit: i for i, unit in enumerate(self.units)}
+
+        # matrix[i, j] converts a value in units[i] to units[j]
+        factors = np.array(list(to_base.values()), dtype=np.float64)
+        self.matrix = factors[:, np.newaxis] / factors[np.newaxis, :]
+        self.pair_factors = {
+            (from_unit, to_unit): self.matrix[i, j].item()
+            for from_unit, i in self.index.items()
+            for to_unit, j in self.index.items()
+        }
+
+    def factor(self, from_unit: str, to_unit: str) -> float:
+        """
+        Returns the factor that converts from_unit to to_unit.
+
+        Raises:
+            ValueError: If either unit is not registered.
+        """
+        try:
+            return self.pair_factors[from_unit, to_unit]
+        except (KeyError, TypeError):
+            invalid = from_unit if from_unit not in self.index else to_unit
+            raise ValueError(f"Invalid unit: {invalid}") from None
+
+    def codes(self, units) -> np.ndarray:
+        """
+        Maps unit names to their row in the factor matrix.
+
+        Parameters:
+            units (array_like): Unit names, or integer codes which are returned unchanged.
+
+        Returns:
+            np.ndarray: Integer unit codes with the same shape as units.
+
+        Raises:
+            ValueError: If a unit is not registered.
+        """
+        units = np.asarray(units)
+        if units.dtype.kind in "iu":
+            return units
+        labels, inverse = np.unique(units, return_inverse=True)
+        try:
+            lookup = np.array([self.index[str(label)] for label in labels])
+        except KeyError as e:
+            raise ValueError(f"Invalid unit: {e.args[0]}") from None
+        return lookup[inverse].reshape(units.shape)
+
+    def convert(self, value, from_unit, to_unit, in_place: bool = False):
+        """
+        Converts a value or an array of values between two units.
+
+        Parameters:
+            value (float or array_like): The value(s) to convert.
+            from_unit (str or array_like): The unit of value, or one unit
+                name or code per element.
+            to_unit (str): The target unit.
+            in_place (bool): Overwrite value with the result. value must be
+                a float NumPy array.
+
+        Returns:
+            float or np.ndarray: The converted value(s).
+
+        Raises:
+            ValueError: If a unit is not registered.
+        """
+        if isinstance(from_unit, str):
+            factor = self.factor(from_unit, to_unit)
+        else:
+            if to_unit not in self.index:
+                raise ValueError(f"Invalid unit: {to_unit}")
+            factor = self.matrix[self.codes(from_unit), self.index[to_unit]]
+
+        if in_place:
+            return np.multiply(value, factor, out=value)
+        if isinstance(value, (list, tuple)):
+            value = np.asarray(value, dtype=np.float64)
+        return value * factor
 
 
 class UnitConverter:
@@ -13,152 +106,148 @@ class UnitConverter:
     """
 
     # Log initialization
-    logging.info("UnitConverter initialized")
+    logger.debug("UnitConverter initialized")
+
+    # Speeds, as factors into miles per hour
+    speed_units = UnitRegistry(
+        "mph",
+        {
+            "mph": 1,
+            "km/h": 1 / 1.60934,
+            "m/h": 1 / 1609.34,
+            "yd/h": 1 / 1760,
+            "ft/h": 1 / 5280,
+            "mpm": 60,
+            "km/min": 60 / 1.60934,
+            "m/min": 60 / 1609.34,
+            "yd/min": 60 / 1760,
+            "ft/min": 60 / 5280,
+            "mps": 3600,
+            "km/s": 3600 / 1.60934,
+            "m/s": 3600 / 1609.34,
+            "yd/s": 3600 / 1760,
+            "ft/s": 3600 / 5280,
+        },
+    )
+
+    # Distances, as factors into miles
+    distance_units = UnitRegistry(
+        "miles",
+        {
+            "miles": 1,
+            "kilometers": 1 / 1.60934,
+            "meters": 1 / 1609.34,
+            "yards": 1 / 1760,
+            "feet": 1 / 5280,
+        },
+    )
+
+    @staticmethod
+    def convert_speed(value, from_unit, to_unit, in_place: bool = False):
+        """
+        Converts a speed value, or an array of them, between any two speed units.
+
+        Parameters:
+            value (float or array_like): The speed value(s) to convert.
+            from_unit (str or array_like): The unit of value, or one unit per element.
+            to_unit (str): The target unit.
+            in_place (bool): Overwrite value (a float NumPy array) with the result.
+
+        Returns:
+            float or np.ndarray: The speed value(s) in to_unit.
+        """
+        return UnitConverter.speed_units.convert(value, from_unit, to_unit, in_place)
 
     @staticmethod
-    def to_miles_per_hour(value: float, unit: str) -> float:
+    def convert_distance(value, from_unit, to_unit, in_place: bool = False):
+        """
+        Converts a distance value, or an array of them, between any two distance units.
+
+        Parameters:
+            value (float or array_like): The distance value(s) to convert.
+            from_unit (str or array_like): The unit of value, or one unit per element.
+            to_unit (str): The target unit.
+            in_place (bool): Overwrite value (a float NumPy array) with the result.
+
+        Returns:
+            float or np.ndarray: The distance value(s) in to_unit.
+        """
+        return UnitConverter.distance_units.convert(
+            value, from_unit, to_unit, in_place
+        )
+
+    @staticmethod
+    def to_miles_per_hour(value, unit, in_place: bool = False):
         """
         Converts a speed value from various units to miles per hour (mph).
 
         Parameters:
-            value (float): The speed value to convert.
+            value (float or array_like): The speed value to convert.
             unit (str): The unit of the speed value (e.g., "km/h", "m/s").
+            in_place (bool): Overwrite value (a float NumPy array) with the result.
 
         Returns:
             float: The speed value in miles per hour.
         """
-        logging.debug(f"to_miles_per_hour called with value={value}, unit={unit}")
-
-        if unit == "mph":
-            return value
-        elif unit == "km/h":
-            return value / 1.60934
-        elif unit == "m/h":
-            return value / 1609.34
-        elif unit == "yd/h":
-            return value / 1760
-        elif unit == "ft/h":
-            return value / 5280
-        elif unit == "mpm":
-            return value * 60
-        elif unit == "km/min":
-            return value * 60 / 1.60934
-        elif unit == "m/min":
-            return value * 60 / 1609.34
-        elif unit == "yd/min":
-            return value * 60 / 1760
-        elif unit == "ft/min":
-            return value * 60 / 5280
-        elif unit == "mps":
-            return value * 3600
-        elif unit == "km/s":
-            return value * 3600 / 1.60934
-        elif unit == "m/s":
-            return value * 3600 / 1609.34
-        elif unit == "yd/s":
-            return value * 3600 / 1760
-        elif unit == "ft/s":
-            return value * 3600 / 5280
-        else:
-            raise ValueError(f"Invalid unit: {unit}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "to_miles_per_hour called with value=%s, unit=%s", value, unit
+            )
+
+        return UnitConverter.speed_units.convert(value, unit, "mph", in_place)
 
     @staticmethod
-    def from_miles_per_hour(value: float, unit: str) -> float:
+    def from_miles_per_hour(value, unit, in_place: bool = False):
         """
         Converts a speed value from miles per hour (mph) to various units.
 
         Parameters:
-            value (float): The speed value to convert.
+            value (float or array_like): The speed value to convert.
             unit (str): The unit of the speed value (e.g., "km/h", "m/s").
+            in_place (bool): Overwrite value (a float NumPy array) with the result.
 
         Returns:
             float: The speed value in given unit.
         """
-        logging.debug(f"from_miles_per_hour called with value={value}, unit={unit}")
-
-        if unit == "mph":
-            return value
-        elif unit == "km/h":
-            return value * 1.60934
-        elif unit == "m/h":
-            return value * 1609.34
-        elif unit == "yd/h":
-            return value * 1760
-        elif unit == "ft/h":
-            return value * 5280
-        elif unit == "mpm":
-            return value / 60
-        elif unit == "km/min":
-            return value / 60 * 1.60934
-        elif unit == "m/min":
-            return value / 60 * 1609.34
-        elif unit == "yd/min":
-            return value / 60 * 1760
-        elif unit == "ft/min":
-            return value / 60 * 5280
-        elif unit == "mps":
-            return value / 3600
-        elif unit == "km/s":
-            return value / 3600 * 1.60934
-        elif unit == "m/s":
-            return value / 3600 * 1609.34
-        elif unit == "yd/s":
-            return value / 3600 * 1760
-        elif unit == "ft/s":
-            return value / 3600 * 5280
-        else:
-            raise ValueError(f"Invalid unit: {unit}")
-    
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "from_miles_per_hour called with value=%s, unit=%s", value, unit
+            )
+
+        return UnitConverter.speed_units.convert(value, "mph", unit, in_place)
+
     @staticmethod
-    def to_miles(value: float, unit: str) -> float:
+    def to_miles(value, unit, in_place: bool = False):
         """
         Converts a distance value from various units to miles.
 
         Parameters:
-            value (float): The distance value to convert.
+            value (float or array_like): The distance value to convert.
             unit (str): The unit of the distance value (e.g., "km", "feet").
+            in_place (bool): Overwrite value (a float NumPy array) with the result.
 
         Returns:
             float: The distance value in miles.
         """
-        logging.debug(f"to_miles called with value={value}, unit={unit}")
-
-        if unit == "miles":
-            return value
-        elif unit == "kilometers":
-            return value / 1.60934
-        elif unit == "meters":
-            return value / 1609.34
-        elif unit == "yards":
-            return value / 1760
-        elif unit == "feet":
-            return value / 5280
-        else:
-            raise ValueError(f"Invalid unit: {unit}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("to_miles called with value=%s, unit=%s", value, unit)
+
+        return UnitConverter.distance_units.convert(value, unit, "miles", in_place)
 
     @staticmethod
-    def from_miles(value: float, unit: str) -> float:
+    def from_miles(value, unit, in_place: bool = False):
         """
         Converts a distance value from miles to various units.
 
         Parameters:
-            value (float): The distance value in miles.
+            value (float or array_like): The distance value in miles.
             unit (str): The target unit for conversion (e.g., "km", "feet").
+            in_place (bool): Overwrite value (a float NumPy array) with the result.
 
         Returns:
             float: The distance value in the specified unit.
         """
-        logging.debug(f"from_miles called with value={value}, unit={unit}")
-
-        if unit == "miles":
-            return value
-        elif unit == "kilometers":
-            return value * 1.60934
-        elif unit == "meters":
-            return value * 1609.34
-        elif unit == "yards":
-            return value * 1760
-        elif unit == "feet":
-            return value * 5280
-        else:
-            raise ValueError(f"Invalid unit: {unit}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("from_miles called with value=%s, unit=%s", value, unit)
+
+        return UnitConverter.distance_units.convert(value, "miles", unit, in_place)